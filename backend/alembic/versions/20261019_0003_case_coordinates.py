@@ -0,0 +1,30 @@
+"""case coordinates
+
+Revision ID: 20261019_0003
+Revises: 20261019_0002
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0003"
+down_revision = "20261019_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("cases", sa.Column("lat", sa.Float(), nullable=True))
+    op.add_column("cases", sa.Column("lon", sa.Float(), nullable=True))
+    op.create_index("ix_cases_mode_updated_at", "cases", ["mode", "updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cases_mode_updated_at", table_name="cases")
+    with op.batch_alter_table("cases") as batch_op:
+        batch_op.drop_column("lon")
+        batch_op.drop_column("lat")
@@ -0,0 +1,28 @@
+"""case incidents
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0004"
+down_revision = "20261019_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("cases", sa.Column("incident_id", sa.String(length=96), nullable=True))
+    op.create_index("ix_cases_incident_id", "cases", ["incident_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cases_incident_id", table_name="cases")
+    with op.batch_alter_table("cases") as batch_op:
+        batch_op.drop_column("incident_id")
@@ -0,0 +1,26 @@
+"""case rules version
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0005"
+down_revision = "20261019_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("cases", sa.Column("rules_version", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("cases") as batch_op:
+        batch_op.drop_column("rules_version")
@@ -0,0 +1,224 @@
+"""Live grid stress feed (e.g. ERCOT) behind a cache that triage never waits on.
+
+The feed returns the same ``{zone, timestamp, stress_level}`` rows as the
+seed file. Zone polygons rarely change and come from the local zones file.
+:meth:`FeedGridStressProvider.snapshot` never touches the network:
+
+- Readings younger than ``GRID_STRESS_TTL_S`` are served as they are.
+- Older readings are still served (stale-while-revalidate) while one
+  background refresh runs. Concurrent refreshes coalesce into one request.
+- Readings older than ``GRID_STRESS_MAX_STALE_S``, or none at all, fall back
+  to the file-backed mock until the feed answers again.
+
+A refresher thread started with the app also polls every TTL. Each request is
+bounded by ``GRID_STRESS_TIMEOUT_S``. After ``GRID_STRESS_BREAKER_FAILURES``
+failures in a row the circuit opens. The feed is then left alone for
+``GRID_STRESS_BREAKER_RESET_S`` before a single probe request. Enable with
+``GRID_STRESS_PROVIDER=feed`` and ``GRID_STRESS_FEED_URL``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from threading import Event, Lock
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import httpx
+
+from app.adapters.grid_stress_mock import SEED_DIR, FileGridStressProvider
+from app.grid_stress import GridStressProvider, GridStressSnapshot
+from app.services.singleflight import SingleFlight
+
+GRID_STRESS_FEED_URL = os.getenv("GRID_STRESS_FEED_URL", "")
+GRID_STRESS_TTL_S = float(os.getenv("GRID_STRESS_TTL_S", "300"))
+GRID_STRESS_MAX_STALE_S = float(os.getenv("GRID_STRESS_MAX_STALE_S", "3600"))
+GRID_STRESS_TIMEOUT_S = float(os.getenv("GRID_STRESS_TIMEOUT_S", "2"))
+GRID_STRESS_BREAKER_FAILURES = int(os.getenv("GRID_STRESS_BREAKER_FAILURES", "3"))
+GRID_STRESS_BREAKER_RESET_S = float(os.getenv("GRID_STRESS_BREAKER_RESET_S", "60"))
+
+logger = logging.getLogger(__name__)
+
+Rows = Sequence[Mapping[str, Any]]
+
+
+def http_fetcher(url: str, timeout_s: float = GRID_STRESS_TIMEOUT_S) -> Callable[[], Rows]:
+    client = httpx.Client(timeout=httpx.Timeout(timeout_s))
+
+    def fetch() -> Rows:
+        response = client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    return fetch
+
+
+class CircuitBreaker:
+    """Closed until ``failure_threshold`` failures in a row, then open for ``reset_timeout_s``.
+
+    Once the timeout passes, the breaker is half-open and lets exactly one
+    probe through. The probe's outcome closes it or opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = GRID_STRESS_BREAKER_FAILURES,
+        reset_timeout_s: float = GRID_STRESS_BREAKER_RESET_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self._clock = clock
+        self._lock = Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self._clock() - self._opened_at >= self.reset_timeout_s:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self._clock() - self._opened_at < self.reset_timeout_s:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._probing = False
+
+
+class FeedGridStressProvider:
+    def __init__(
+        self,
+        fetch: Callable[[], Rows],
+        zone_rows: Rows,
+        fallback: GridStressProvider,
+        ttl_s: float = GRID_STRESS_TTL_S,
+        max_stale_s: float = GRID_STRESS_MAX_STALE_S,
+        breaker: Optional[CircuitBreaker] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self._zone_rows: List[Mapping[str, Any]] = list(zone_rows)
+        self._fallback = fallback
+        self.ttl_s = ttl_s
+        self.max_stale_s = max_stale_s
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        self._clock = clock
+        self._lock = Lock()
+        self._snapshot: Optional[GridStressSnapshot] = None
+        self._fetched_at = 0.0
+        self._revalidating = False
+        self._flight = SingleFlight()
+        self._stop = Event()
+        self._thread: Optional[threading.Thread] = None
+        self._counts: Dict[str, int] = {"fetches": 0, "failures": 0, "rejected": 0, "fallback_reads": 0}
+
+    def snapshot(self) -> GridStressSnapshot:
+        with self._lock:
+            snapshot, age = self._snapshot, self._clock() - self._fetched_at
+            stale = snapshot is None or age >= self.ttl_s
+            if stale and not self._revalidating:
+                self._revalidating = True
+                threading.Thread(target=self._revalidate, name="grid-stress-revalidate", daemon=True).start()
+            if snapshot is not None and age < self.max_stale_s:
+                return snapshot
+            self._counts["fallback_reads"] += 1
+        return self._fallback.snapshot()
+
+    def _revalidate(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._revalidating = False
+
+    def refresh(self) -> bool:
+        """Fetch now unless the breaker is open; concurrent callers share one request."""
+        return self._flight.do("refresh", self._refresh_once)
+
+    def _refresh_once(self) -> bool:
+        if not self.breaker.allow():
+            with self._lock:
+                self._counts["rejected"] += 1
+            return False
+        with self._lock:
+            self._counts["fetches"] += 1
+        try:
+            snapshot = GridStressSnapshot.from_rows(self._zone_rows, self._fetch())
+        except Exception:
+            self.breaker.record_failure()
+            with self._lock:
+                self._counts["failures"] += 1
+            logger.warning("grid stress feed refresh failed", exc_info=True)
+            return False
+        self.breaker.record_success()
+        with self._lock:
+            self._snapshot = snapshot
+            self._fetched_at = self._clock()
+        return True
+
+    def start(self) -> None:
+        """Poll the feed every TTL on a daemon thread until :meth:`stop`."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="grid-stress-refresh", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.ttl_s)
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=GRID_STRESS_TIMEOUT_S + 1)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            age = self._clock() - self._fetched_at if self._snapshot is not None else None
+            counts = dict(self._counts)
+        return {
+            "source": "feed",
+            "breaker": self.breaker.state,
+            "age_s": round(age, 3) if age is not None else None,
+            "serving": "feed" if age is not None and age < self.max_stale_s else "fallback",
+            **counts,
+        }
+
+
+def feed_provider_from_env(zones_path: Path = SEED_DIR / "grid_zones.json") -> Optional[FeedGridStressProvider]:
+    if not GRID_STRESS_FEED_URL:
+        logger.warning("GRID_STRESS_PROVIDER=feed without GRID_STRESS_FEED_URL; using the file-backed mock")
+        return None
+    return FeedGridStressProvider(
+        http_fetcher(GRID_STRESS_FEED_URL),
+        json.loads(zones_path.read_text()),
+        fallback=FileGridStressProvider(),
+    )
@@ -0,0 +1,40 @@
+"""File-backed grid stress provider for demos and tests.
+
+Reads zone polygons from ``seed_data/grid_zones.json`` and readings from
+``seed_data/grid_stress.json`` once, then serves the same snapshot forever.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from app.grid_stress import GridStressSnapshot
+
+SEED_DIR = Path(__file__).resolve().parents[1] / "seed_data"
+
+
+class FileGridStressProvider:
+    def __init__(
+        self,
+        zones_path: Path = SEED_DIR / "grid_zones.json",
+        stress_path: Path = SEED_DIR / "grid_stress.json",
+    ) -> None:
+        self.zones_path = zones_path
+        self.stress_path = stress_path
+        self._snapshot: Optional[GridStressSnapshot] = None
+        self._lock = Lock()
+
+    def snapshot(self) -> GridStressSnapshot:
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = GridStressSnapshot.from_rows(
+                    json.loads(self.zones_path.read_text()),
+                    json.loads(self.stress_path.read_text()),
+                )
+            return self._snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        return {"source": "mock", "loaded": self._snapshot is not None}
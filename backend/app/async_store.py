@@ -0,0 +1,124 @@
+"""Async counterparts of the :mod:`app.store` helpers used by the API routes.
+
+Reads and single-case writes run the store's session-level bodies on an
+``AsyncSession`` via ``run_sync``, so a request waiting on the database yields
+the event loop instead of holding a threadpool thread.
+
+Bulk triage writes are different: building and flushing thousands of ORM
+objects is CPU work that ``run_sync`` would do on the event loop, so those
+run the sync store on a worker thread. Shard and replica routing also live
+in the sync store, so with ``DATABASE_SHARDS`` or ``DATABASE_REPLICA_URLS``
+configured every helper takes the worker-thread path, and so does an in-memory
+SQLite ``DATABASE_URL``: aiosqlite would open its own empty database rather
+than share the sync engine's connection.
+"""
+
+from __future__ import annotations
+
+import functools
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from anyio import to_thread
+
+from app import store
+from app.db import session as db_session
+from app.db.async_session import async_session_scope
+from app.db.profiles import _is_memory_sqlite
+from app.models import (
+    Case,
+    CaseMode,
+    Signal,
+    VerificationResult,
+    VerificationTask,
+    WorkOrder,
+    WorkOrderState,
+)
+from app.store import VerificationOutcome
+
+T = TypeVar("T")
+
+
+def _routed() -> bool:
+    if db_session.shard_engines or db_session.replica_engines:
+        return True
+    return _is_memory_sqlite(db_session.DATABASE_URL)
+
+
+async def _in_thread(fn: Callable[..., T], *args: Any) -> T:
+    db_session.share_primary_writes()
+    return await to_thread.run_sync(functools.partial(fn, *args))
+
+
+async def _run(body: Callable[..., T], *args: Any) -> T:
+    async with async_session_scope() as session:
+        return await session.run_sync(body, *args)
+
+
+async def set_signals(items: Sequence[Signal]) -> None:
+    await _in_thread(store.set_signals, items)
+
+
+async def get_signal_contents(ids: Sequence[str]) -> List[store.SignalContent]:
+    if _routed():
+        return await _in_thread(store.get_signal_contents, ids)
+    return await _run(store._load_signal_contents, ids)
+
+
+async def set_baseline_cases(cases: Sequence[Case]) -> None:
+    await _in_thread(store.set_baseline_cases, cases)
+
+
+async def set_certainty_cases(cases: Sequence[Case], tasks: Sequence[VerificationTask]) -> None:
+    await _in_thread(store.set_certainty_cases, cases, tasks)
+
+
+async def get_cases(mode: CaseMode) -> List[Case]:
+    if _routed():
+        return await _in_thread(store.get_cases, mode)
+    return await _run(store._load_cases, mode)
+
+
+async def cases_token(mode: CaseMode) -> Tuple[Tuple[Optional[int], Optional[datetime]], ...]:
+    if _routed():
+        return await _in_thread(store.cases_token, mode)
+    return (await _run(store._load_cases_token, mode),)
+
+
+async def find_case(case_id: str) -> Optional[Case]:
+    if _routed():
+        return await _in_thread(store.find_case, case_id)
+    return await _run(store._load_case, case_id)
+
+
+async def create_or_update_work_order(
+    case_id: str,
+    assigned_team: str,
+    due_at: datetime,
+    state: WorkOrderState = "created",
+) -> WorkOrder:
+    if _routed():
+        return await _in_thread(store.create_or_update_work_order, case_id, assigned_team, due_at, state)
+    return await _run(store._upsert_work_order, case_id, assigned_team, due_at, state)
+
+
+async def complete_verification(
+    case_id: str,
+    result: VerificationResult,
+    notes: Optional[str],
+) -> VerificationTask:
+    if _routed():
+        return await _in_thread(store.complete_verification, case_id, result, notes)
+    return await _run(store._record_verification, None, case_id, result, notes)
+
+
+async def get_verification_tasks_map() -> Dict[str, VerificationTask]:
+    if _routed():
+        return await _in_thread(store.get_verification_tasks_map)
+    return {task.case_id: task for task in await _run(store._load_verification_tasks)}
+
+
+async def get_verification_outcomes() -> List[VerificationOutcome]:
+    if _routed():
+        return await _in_thread(store.get_verification_outcomes)
+    return await _run(store._load_verification_outcomes)
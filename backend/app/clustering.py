@@ -0,0 +1,144 @@
+"""Multi-zoom point clustering for map views, in the style of supercluster.
+
+Points are projected to Web Mercator and clustered greedily from the deepest
+zoom up: at each zoom, every unclaimed cluster absorbs the unclaimed neighbours
+within ``CLUSTER_RADIUS_PX`` screen pixels at that zoom. Seeds are taken in
+input order, so feeding cases by priority makes the most urgent case the seed
+of its cluster. Each zoom keeps a :class:`~app.spatial.GridIndex` of its
+clusters for viewport lookups, so a query returns at most a screenful of
+clusters however many points were indexed.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.spatial import SPATIAL_CELL_DEG, BBox, GridIndex
+
+CLUSTER_RADIUS_PX = float(os.getenv("CLUSTER_RADIUS_PX", "60"))
+CLUSTER_EXTENT_PX = 512
+CLUSTER_MIN_ZOOM = 0
+CLUSTER_MAX_ZOOM = int(os.getenv("CLUSTER_MAX_ZOOM", "16"))
+
+_MAX_LAT = 85.051129
+
+
+@dataclass(frozen=True)
+class Cluster:
+    x: float
+    y: float
+    count: int
+    max_priority: int
+    # Position of the point in the input for single points, else None.
+    leaf: Optional[int]
+    # Zoom at which the cluster splits into its children; None for single points.
+    expansion_zoom: Optional[int]
+
+    @property
+    def lon(self) -> float:
+        return (self.x - 0.5) * 360.0
+
+    @property
+    def lat(self) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1.0 - 2.0 * self.y))))
+
+
+def _project(lon: float, lat: float) -> Tuple[float, float]:
+    sin = math.sin(math.radians(max(-_MAX_LAT, min(_MAX_LAT, lat))))
+    y = 0.5 - 0.25 * math.log((1 + sin) / (1 - sin)) / math.pi
+    return lon / 360.0 + 0.5, y
+
+
+def _radius(zoom: int) -> float:
+    """Cluster radius in projected units at ``zoom``."""
+    return CLUSTER_RADIUS_PX / (CLUSTER_EXTENT_PX * 2**zoom)
+
+
+def _cluster_level(items: List[Cluster], zoom: int) -> List[Cluster]:
+    radius = _radius(zoom)
+    radius_sq = radius * radius
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    keys: List[Tuple[int, int]] = []
+    for index, item in enumerate(items):
+        key = (int(item.x // radius), int(item.y // radius))
+        keys.append(key)
+        cells.setdefault(key, []).append(index)
+
+    claimed = bytearray(len(items))
+    merged: List[Cluster] = []
+    for index, seed in enumerate(items):
+        if claimed[index]:
+            continue
+        claimed[index] = 1
+        cx, cy = keys[index]
+        neighbours = [
+            other
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            for other in cells.get((cx + dx, cy + dy), ())
+            if not claimed[other]
+            and (items[other].x - seed.x) ** 2 + (items[other].y - seed.y) ** 2 <= radius_sq
+        ]
+        if not neighbours:
+            merged.append(seed)
+            continue
+
+        count = seed.count
+        wx, wy = seed.x * seed.count, seed.y * seed.count
+        max_priority = seed.max_priority
+        for other in neighbours:
+            claimed[other] = 1
+            item = items[other]
+            count += item.count
+            wx += item.x * item.count
+            wy += item.y * item.count
+            max_priority = max(max_priority, item.max_priority)
+        merged.append(Cluster(wx / count, wy / count, count, max_priority, None, zoom + 1))
+    return merged
+
+
+class ClusterIndex:
+    """Clusters of ``points`` (lon, lat, priority) for every zoom level."""
+
+    def __init__(
+        self,
+        points: Iterable[Optional[Tuple[float, float, int]]],
+        min_zoom: int = CLUSTER_MIN_ZOOM,
+        max_zoom: int = CLUSTER_MAX_ZOOM,
+    ) -> None:
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        leaves = [
+            Cluster(*_project(point[0], point[1]), 1, point[2], position, None)
+            for position, point in enumerate(points)
+            if point is not None
+        ]
+        self._levels: Dict[int, List[Cluster]] = {max_zoom + 1: leaves}
+        self._grids: Dict[int, GridIndex] = {max_zoom + 1: self._grid(leaves, SPATIAL_CELL_DEG)}
+        current = leaves
+        for zoom in range(max_zoom, min_zoom - 1, -1):
+            merged = _cluster_level(current, zoom)
+            if len(merged) == len(current):
+                # Nothing merged at this zoom: reuse the level below and its grid.
+                self._levels[zoom] = current
+                self._grids[zoom] = self._grids[zoom + 1]
+                continue
+            current = merged
+            self._levels[zoom] = current
+            # Cells about two cluster radii wide keep each viewport to a few hundred cells.
+            self._grids[zoom] = self._grid(current, max(SPATIAL_CELL_DEG, 720.0 * _radius(zoom)))
+
+    @staticmethod
+    def _grid(clusters: List[Cluster], cell_deg: float) -> GridIndex:
+        return GridIndex(((cluster.lon, cluster.lat) for cluster in clusters), cell_deg=cell_deg)
+
+    def clamp_zoom(self, zoom: int) -> int:
+        return max(self.min_zoom, min(zoom, self.max_zoom + 1))
+
+    def clusters(self, zoom: int, bbox: BBox) -> List[Cluster]:
+        """Clusters at ``zoom`` (clamped to the indexed range) whose centre lies in ``bbox``."""
+        zoom = self.clamp_zoom(zoom)
+        return self._grids[zoom].select(self._levels[zoom], bbox)
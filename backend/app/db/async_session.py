@@ -0,0 +1,79 @@
+"""Async SQLAlchemy engine and session management for the primary database.
+
+Uses the same ``DATABASE_URL`` and ``DB_PROFILE`` as :mod:`app.db.session`,
+with the asyncio driver for the dialect (``aiosqlite`` for SQLite, psycopg's
+async mode for Postgres). Statements are counted by the same query accounting
+hooks, and the pool reports through ``/api/metrics/db-pool`` as ``async``.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+from anyio import to_thread
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.db.pool_stats import InstrumentedAsyncQueuePool
+from app.db.profiles import DB_PROFILE, engine_options, install_profile, resolve_profile
+from app.db.query_stats import install_query_accounting
+from app.db.session import DATABASE_URL, database_initialized, engines_by_label, init_database
+
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "psycopg"}
+
+
+def async_database_url(url: str) -> str:
+    """Swap the sync driver in ``url`` for its asyncio counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"no async driver configured for {backend}")
+    return parsed.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+class _AccountedSession(Session):
+    """Sync session class behind :class:`AsyncSession`, hooked for row accounting."""
+
+
+def _make_async_engine(url: str) -> AsyncEngine:
+    profile = resolve_profile(DB_PROFILE, url)
+    async_url = async_database_url(url)
+    options = engine_options(profile, async_url, pool_class=InstrumentedAsyncQueuePool)
+    options.pop("future", None)
+    new_engine = create_async_engine(async_url, **options)
+    install_profile(new_engine.sync_engine, profile)
+    return new_engine
+
+
+async_engine: AsyncEngine = _make_async_engine(DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=_AccountedSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+install_query_accounting(async_engine.sync_engine, _AccountedSession)
+
+
+def all_engines() -> Dict[str, Engine]:
+    """:func:`engines_by_label` plus the async primary engine as ``async``."""
+    return {**engines_by_label(), "async": async_engine.sync_engine}
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """Yield a transactional async session on the primary database."""
+    # Table creation is a one-off; the sync engine handles it on a worker thread.
+    if not database_initialized():
+        await to_thread.run_sync(init_database)
+    session = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
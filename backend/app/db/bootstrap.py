@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
-from typing import Any, List, cast
+from typing import Any, Dict, List, cast
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
 from app import store
+from app.db.base import Base
+from app.db.models import DEMO_SEED_MARKER_KEY, SCHEMA_MARKER_KEY, BootstrapMarkerRecord
+from app.db.session import engine, init_database, mark_database_initialized, session_scope
+from app.db.sharding import sharding_enabled
 from app.models import Signal
-from app.triage.baseline import run_baseline_triage
-from app.triage.certainty import run_certainty_triage
+from app.triage.sharded import run_sharded_baseline_triage, run_sharded_certainty_triage
 
 MIN_DEMO_CASES = 6
 SEED_SIGNALS_PATH = Path(__file__).resolve().parents[1] / "seed_data" / "signals.json"
@@ -38,15 +45,70 @@ def _load_seed_signals() -> List[Signal]:
     return signals
 
 
+def schema_fingerprint() -> str:
+    """Hash of every table, column, type and nullability in the ORM metadata."""
+    digest = hashlib.sha256()
+    for table in sorted(Base.metadata.tables.values(), key=lambda item: item.name):
+        for column in table.columns:
+            digest.update(f"{table.name}.{column.name}:{column.type}:{column.nullable};".encode())
+    return digest.hexdigest()[:32]
+
+
+def seed_fingerprint(min_cases: int = MIN_DEMO_CASES) -> str:
+    """Hash of the seed signal file and the case threshold it was checked against."""
+    digest = hashlib.sha256(f"min_cases={min_cases};".encode())
+    if SEED_SIGNALS_PATH.exists():
+        digest.update(SEED_SIGNALS_PATH.read_bytes())
+    return digest.hexdigest()[:32]
+
+
+def read_markers() -> Dict[str, str]:
+    """Return persisted bootstrap markers, or nothing if the table does not exist yet."""
+    try:
+        with engine.connect() as connection:
+            rows = connection.execute(select(BootstrapMarkerRecord.key, BootstrapMarkerRecord.value)).all()
+    except SQLAlchemyError:
+        return {}
+    return {key: value for key, value in rows}
+
+
+def write_marker(key: str, value: str) -> None:
+    with session_scope() as session:
+        session.merge(BootstrapMarkerRecord(key=key, value=value))
+
+
+def prepare_database() -> bool:
+    """Create tables unless the persisted schema marker matches the models.
+
+    Returns True if ``create_all`` ran. The marker lives in the primary
+    database only, so shards are always checked.
+    """
+    fingerprint = schema_fingerprint()
+    if not sharding_enabled() and read_markers().get(SCHEMA_MARKER_KEY) == fingerprint:
+        mark_database_initialized()
+        return False
+    init_database()
+    write_marker(SCHEMA_MARKER_KEY, fingerprint)
+    return True
+
+
+def demo_seed_current(min_cases: int = MIN_DEMO_CASES) -> bool:
+    """True if demo cases were already verified for the current seed file."""
+    return read_markers().get(DEMO_SEED_MARKER_KEY) == seed_fingerprint(min_cases)
+
+
 def ensure_demo_cases(min_cases: int = MIN_DEMO_CASES) -> bool:
     """
     Ensure the database has enough cases for demo UX.
 
     Returns True if seed data was written, False otherwise.
     """
-    baseline_existing = store.get_cases("baseline")
-    certainty_existing = store.get_cases("certainty")
-    if len(baseline_existing) >= min_cases and len(certainty_existing) >= min_cases:
+    if demo_seed_current(min_cases):
+        return False
+
+    fingerprint = seed_fingerprint(min_cases)
+    if store.count_cases("baseline") >= min_cases and store.count_cases("certainty") >= min_cases:
+        write_marker(DEMO_SEED_MARKER_KEY, fingerprint)
         return False
 
     signals = _load_seed_signals()
@@ -54,8 +116,9 @@ def ensure_demo_cases(min_cases: int = MIN_DEMO_CASES) -> bool:
         return False
 
     store.set_signals(signals)
-    baseline_cases = run_baseline_triage(signals)
-    certainty_cases, verification_tasks = run_certainty_triage(signals)
+    baseline_cases = run_sharded_baseline_triage(signals)
+    certainty_cases, verification_tasks = run_sharded_certainty_triage(signals)
     store.set_baseline_cases(baseline_cases)
     store.set_certainty_cases(certainty_cases, verification_tasks)
+    write_marker(DEMO_SEED_MARKER_KEY, fingerprint)
     return True
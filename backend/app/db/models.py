@@ -4,12 +4,16 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Float, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Float, Index, Integer, JSON, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
 
+SCHEMA_MARKER_KEY = "schema"
+DEMO_SEED_MARKER_KEY = "demo_seed"
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -30,7 +34,11 @@ class SignalRecord(Base):
 
 class CaseRecord(Base):
     __tablename__ = "cases"
-    __table_args__ = (UniqueConstraint("case_id", "mode", name="uq_cases_case_id_mode"),)
+    __table_args__ = (
+        UniqueConstraint("case_id", "mode", name="uq_cases_case_id_mode"),
+        # Lets the spatial index check for replaced cases without scanning them.
+        Index("ix_cases_mode_updated_at", "mode", "updated_at"),
+    )
 
     pk: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     case_id: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
@@ -46,6 +54,10 @@ class CaseRecord(Base):
     explanation: Mapped[str] = mapped_column(Text, nullable=False)
     uncertainty_reasons: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
     verification_required: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    lat: Mapped[float | None] = mapped_column(Float, nullable=True)
+    lon: Mapped[float | None] = mapped_column(Float, nullable=True)
+    incident_id: Mapped[str | None] = mapped_column(String(96), nullable=True, index=True)
+    rules_version: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utc_now)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=_utc_now, onupdate=_utc_now
@@ -90,3 +102,15 @@ class VerificationOutcomeRecord(Base):
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utc_now)
 
+
+
+class BootstrapMarkerRecord(Base):
+    """Fingerprints of work already done at startup (schema creation, demo seeding)."""
+
+    __tablename__ = "bootstrap_markers"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[str] = mapped_column(String(128), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=_utc_now, onupdate=_utc_now
+    )
@@ -0,0 +1,87 @@
+"""Connection pool telemetry.
+
+:class:`InstrumentedQueuePool` is a drop-in ``QueuePool`` that counts
+checkouts, checkout timeouts, time spent waiting for a connection and peak
+overflow. :func:`pool_snapshot` combines those counters with the pool's live
+size, checked-out and overflow figures.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Dict
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolStats:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ns = 0
+        self.max_wait_ns = 0
+        self.peak_overflow = 0
+
+    def observe(self, wait_ns: int, overflow: int, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_ns += wait_ns
+            self.max_wait_ns = max(self.max_wait_ns, wait_ns)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_ns / 1e6, 3),
+                "wait_ms_mean": round(self.wait_ns / attempts / 1e6, 3) if attempts else 0.0,
+                "wait_ms_max": round(self.max_wait_ns / 1e6, 3),
+                "peak_overflow": self.peak_overflow,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self) -> Any:
+        start_ns = perf_counter_ns()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.observe(perf_counter_ns() - start_ns, self.overflow(), timed_out=True)
+            raise
+        self.stats.observe(perf_counter_ns() - start_ns, self.overflow(), timed_out=False)
+        return connection
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """The same telemetry for ``create_async_engine`` pools."""
+
+
+def pool_snapshot(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    snapshot: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        snapshot.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            max_overflow=pool._max_overflow,
+            timeout_s=pool.timeout(),
+        )
+    stats = getattr(pool, "stats", None)
+    if isinstance(stats, PoolStats):
+        snapshot.update(stats.to_dict())
+    return snapshot
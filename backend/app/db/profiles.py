@@ -0,0 +1,137 @@
+"""Named storage profiles: engine pool options and per-connection settings.
+
+``DB_PROFILE`` selects one of:
+
+- ``basic`` (default): pre-ping only, SQLite in its default rollback journal.
+- ``sqlite_wal``: WAL journal so reads do not block on triage writes,
+  ``synchronous=NORMAL``, memory-mapped I/O, a larger page cache and a busy
+  timeout instead of immediate ``database is locked`` errors.
+- ``postgres``: a larger LIFO pool with bounded overflow and checkout wait,
+  connection recycling, and server-side statement, lock and idle-transaction
+  timeouts.
+- ``production``: ``sqlite_wal`` or ``postgres`` depending on the URL.
+
+Sizes and timeouts are tunable with the ``DB_*`` / ``SQLITE_*`` variables below.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import Pool
+
+from app.db.pool_stats import InstrumentedQueuePool
+
+DB_PROFILE = os.getenv("DB_PROFILE", "basic")
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    name: str
+    # Dialect the profile is written for; None means any.
+    dialect: Optional[str] = None
+    pool: Dict[str, Any] = field(default_factory=dict)
+    sqlite_pragmas: Tuple[Tuple[str, str], ...] = ()
+    # Postgres run-time parameters sent with every new connection.
+    postgres_settings: Dict[str, str] = field(default_factory=dict)
+
+
+def _int_env(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+PROFILES: Dict[str, Callable[[], StorageProfile]] = {
+    "basic": lambda: StorageProfile(name="basic"),
+    "sqlite_wal": lambda: StorageProfile(
+        name="sqlite_wal",
+        dialect="sqlite",
+        pool={
+            "pool_size": _int_env("DB_POOL_SIZE", 8),
+            "max_overflow": _int_env("DB_MAX_OVERFLOW", 8),
+            "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT_S", "10")),
+        },
+        sqlite_pragmas=(
+            ("journal_mode", "WAL"),
+            ("synchronous", "NORMAL"),
+            ("busy_timeout", str(_int_env("SQLITE_BUSY_TIMEOUT_MS", 5000))),
+            ("mmap_size", str(_int_env("SQLITE_MMAP_BYTES", 256 * 1024 * 1024))),
+            # Negative cache_size is in KiB.
+            ("cache_size", str(-_int_env("SQLITE_CACHE_KIB", 64 * 1024))),
+            ("temp_store", "MEMORY"),
+        ),
+    ),
+    "postgres": lambda: StorageProfile(
+        name="postgres",
+        dialect="postgresql",
+        pool={
+            "pool_size": _int_env("DB_POOL_SIZE", 20),
+            "max_overflow": _int_env("DB_MAX_OVERFLOW", 10),
+            "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT_S", "10")),
+            "pool_recycle": _int_env("DB_POOL_RECYCLE_S", 1800),
+            "pool_use_lifo": True,
+        },
+        postgres_settings={
+            "statement_timeout": str(_int_env("DB_STATEMENT_TIMEOUT_MS", 15000)),
+            "lock_timeout": str(_int_env("DB_LOCK_TIMEOUT_MS", 5000)),
+            "idle_in_transaction_session_timeout": str(_int_env("DB_IDLE_IN_TRANSACTION_TIMEOUT_MS", 60000)),
+        },
+    ),
+}
+
+
+def resolve_profile(name: str, url: str) -> StorageProfile:
+    """Return the profile called ``name`` for ``url``; raises ValueError if it does not apply."""
+    dialect = make_url(url).get_backend_name()
+    if name == "production":
+        name = "sqlite_wal" if dialect == "sqlite" else "postgres"
+    if name not in PROFILES:
+        raise ValueError(f"unknown DB_PROFILE {name!r}; expected one of {sorted([*PROFILES, 'production'])}")
+    profile = PROFILES[name]()
+    if profile.dialect is not None and profile.dialect != dialect:
+        raise ValueError(f"DB_PROFILE {name!r} is for {profile.dialect}, not {dialect}")
+    return profile
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and (
+        parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+    )
+
+
+def engine_options(
+    profile: StorageProfile, url: str, pool_class: Type[Pool] = InstrumentedQueuePool
+) -> Dict[str, Any]:
+    """``create_engine`` keyword arguments for ``url`` under ``profile``."""
+    options: Dict[str, Any] = {"future": True, "pool_pre_ping": True}
+    connect_args: Dict[str, Any] = {}
+    if url.startswith("sqlite"):
+        connect_args["check_same_thread"] = False
+    # In-memory SQLite needs its single-connection pool; everything else gets pool telemetry.
+    if not _is_memory_sqlite(url):
+        options["poolclass"] = pool_class
+        options.update(profile.pool)
+    if profile.postgres_settings:
+        connect_args["options"] = " ".join(f"-c {key}={value}" for key, value in profile.postgres_settings.items())
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def install_profile(engine: Engine, profile: StorageProfile) -> None:
+    """Apply ``profile``'s per-connection settings to every new connection of ``engine``."""
+    if not profile.sqlite_pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection: Any, _record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in profile.sqlite_pragmas:
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
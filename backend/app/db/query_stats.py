@@ -0,0 +1,143 @@
+"""SQL statement accounting via SQLAlchemy engine events.
+
+Every statement executed on an instrumented engine is counted against the
+:class:`QueryStats` bound to the current context (one per HTTP request, or
+one per :func:`count_queries` block). Statements slower than
+``SQL_SLOW_QUERY_MS`` are logged with their parameters and the database's
+query plan.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+_START_KEY = "query_stats_start_ns"
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    rows: int = 0
+    duration_ns: int = 0
+    keep_statements: bool = True
+    statement_log: List[str] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration_ns / 1e6, 3)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(stats: QueryStats) -> Iterator[QueryStats]:
+    """Attribute statements executed in this context to ``stats``."""
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _explain(conn: Any, statement: str, parameters: Any) -> str:
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def _log_slow_query(conn: Any, statement: str, parameters: Any, elapsed_ms: float, executemany: bool) -> None:
+    plan = "n/a"
+    if not executemany and statement.lstrip().upper().startswith("SELECT"):
+        try:
+            plan = _explain(conn, statement, parameters)
+        except Exception as exc:  # pragma: no cover - plan is best effort
+            plan = f"unavailable: {exc}"
+    logger.warning(
+        "slow query (%.1f ms): %s | parameters=%r | plan:\n%s",
+        elapsed_ms,
+        statement,
+        parameters,
+        plan,
+    )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+    conn.info.setdefault(_START_KEY, []).append(perf_counter_ns())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+    elapsed_ns = perf_counter_ns() - conn.info[_START_KEY].pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.duration_ns += elapsed_ns
+        if stats.keep_statements:
+            stats.statement_log.append(statement)
+        if cursor.rowcount is not None and cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+
+    elapsed_ms = elapsed_ns / 1e6
+    if elapsed_ms >= SLOW_QUERY_MS:
+        _log_slow_query(conn, statement, parameters, elapsed_ms, executemany)
+
+
+def _loaded_as_persistent(session, instance) -> None:  # type: ignore[no-untyped-def]
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.rows += 1
+
+
+def install_query_accounting(engine: Engine, session_factory: Any = None) -> None:
+    """Attach statement accounting hooks to ``engine`` (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    # SELECT cursors report no rowcount, so count ORM rows as they are loaded.
+    if session_factory is not None and not event.contains(
+        session_factory, "loaded_as_persistent", _loaded_as_persistent
+    ):
+        event.listen(session_factory, "loaded_as_persistent", _loaded_as_persistent)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """Count statements executed inside the block."""
+    with track_queries(QueryStats()) as stats:
+        yield stats
+
+
+@contextmanager
+def assert_query_budget(max_statements: int) -> Iterator[QueryStats]:
+    """Fail if the block executes more than ``max_statements`` SQL statements.
+
+    Intended for tests, e.g. ``with assert_query_budget(3): dispatch_case(...)``.
+    """
+    with count_queries() as stats:
+        yield stats
+    if stats.statements > max_statements:
+        executed = "\n".join(f"  {index + 1}. {sql}" for index, sql in enumerate(stats.statement_log))
+        raise AssertionError(
+            f"expected at most {max_statements} SQL statements, executed {stats.statements}:\n{executed}"
+        )
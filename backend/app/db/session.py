@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import itertools
+import logging
 import os
+import time
 from contextlib import contextmanager
+from contextvars import ContextVar
 from threading import Lock
-from typing import Iterator
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.db.base import Base
+from app.db.profiles import DB_PROFILE, engine_options, install_profile, resolve_profile
+from app.db.query_stats import install_query_accounting
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
 
 
 def _normalize_database_url(raw_url: str) -> str:
@@ -26,12 +36,150 @@ DATABASE_URL = _normalize_database_url(
     os.getenv("DATABASE_URL", "sqlite+pysqlite:///./ev_grid_ops.db")
 )
 
-_engine_kwargs: dict = {"future": True, "pool_pre_ping": True}
-if DATABASE_URL.startswith("sqlite"):
-    _engine_kwargs["connect_args"] = {"check_same_thread": False}
 
-engine: Engine = create_engine(DATABASE_URL, **_engine_kwargs)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+def _make_engine(url: str) -> Engine:
+    profile = resolve_profile(DB_PROFILE, url)
+    new_engine = create_engine(url, **engine_options(profile, url))
+    install_profile(new_engine, profile)
+    return new_engine
+
+
+def _make_session_factory(bind: Engine) -> sessionmaker:
+    factory = sessionmaker(bind=bind, autoflush=False, autocommit=False, expire_on_commit=False)
+    install_query_accounting(bind, factory)
+    return factory
+
+
+engine: Engine = _make_engine(DATABASE_URL)
+SessionLocal = _make_session_factory(engine)
+
+# Region shards (``DATABASE_SHARDS=AUS=postgresql://...,DAL=sqlite:///./dal.db``).
+# Regions without a shard of their own live in the primary database above.
+shard_engines: Dict[str, Engine] = {}
+_shard_sessions: Dict[str, sessionmaker] = {}
+
+
+def _parse_shards(raw: str) -> Dict[str, str]:
+    shards: Dict[str, str] = {}
+    for part in raw.split(","):
+        region, _, url = part.strip().partition("=")
+        if region and url:
+            shards[region.strip().upper()] = _normalize_database_url(url.strip())
+    return shards
+
+
+def configure_shards(urls: Mapping[str, str]) -> None:
+    """Replace the region shard map; an empty mapping turns sharding off."""
+    global _initialized
+    for old_engine in shard_engines.values():
+        old_engine.dispose()
+    shard_engines.clear()
+    _shard_sessions.clear()
+    for region, url in urls.items():
+        shard_engine = _make_engine(_normalize_database_url(url))
+        shard_engines[region.upper()] = shard_engine
+        _shard_sessions[region.upper()] = _make_session_factory(shard_engine)
+    _initialized = False
+
+
+configure_shards(_parse_shards(os.getenv("DATABASE_SHARDS", "")))
+
+# Read replicas of the primary (``DATABASE_REPLICA_URLS=postgresql://replica-1/...,...``).
+# Read-only sessions go to a replica unless this context wrote to the primary
+# within ``REPLICA_STICKY_S``; a replica that fails is skipped for ``REPLICA_RETRY_S``.
+# The write time sits in a one-item list so work run in a copy of the context
+# (``fan_out``, worker threads) updates the caller's holder in place.
+REPLICA_STICKY_S = float(os.getenv("REPLICA_STICKY_S", "5"))
+REPLICA_RETRY_S = float(os.getenv("REPLICA_RETRY_S", "30"))
+
+replica_engines: List[Engine] = []
+_replica_sessions: List[sessionmaker] = []
+_replica_down_until: List[float] = []
+_replica_cursor = itertools.count()
+_last_primary_write: ContextVar[Optional[List[float]]] = ContextVar("db_last_primary_write", default=None)
+
+
+def share_primary_writes() -> None:
+    """Give this context a write-time holder before its context is copied."""
+    if _last_primary_write.get() is None:
+        _last_primary_write.set([float("-inf")])
+
+
+def _note_primary_write() -> None:
+    holder = _last_primary_write.get()
+    if holder is None:
+        _last_primary_write.set([time.monotonic()])
+    else:
+        holder[0] = time.monotonic()
+
+
+def configure_replicas(urls: Sequence[str]) -> None:
+    """Replace the primary's read replicas; an empty sequence sends all reads to the primary."""
+    for old_engine in replica_engines:
+        old_engine.dispose()
+    replica_engines.clear()
+    _replica_sessions.clear()
+    _replica_down_until.clear()
+    for url in urls:
+        replica_engine = _make_engine(_normalize_database_url(url))
+        replica_engines.append(replica_engine)
+        _replica_sessions.append(_make_session_factory(replica_engine))
+        _replica_down_until.append(0.0)
+
+
+configure_replicas([url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()])
+
+
+def engines_by_label() -> Dict[str, Engine]:
+    """Every configured engine: ``primary``, ``shard:<REGION>`` and ``replica:<n>``."""
+    engines = {"primary": engine}
+    engines.update({f"shard:{region}": shard_engine for region, shard_engine in sorted(shard_engines.items())})
+    engines.update({f"replica:{index}": replica for index, replica in enumerate(replica_engines)})
+    return engines
+
+
+def replica_status() -> List[Dict[str, object]]:
+    now = time.monotonic()
+    return [
+        {"url": replica.url.render_as_string(hide_password=True), "healthy": down_until <= now}
+        for replica, down_until in zip(replica_engines, _replica_down_until)
+    ]
+
+
+def _mark_replica_down(index: int, exc: BaseException) -> None:
+    if index < len(_replica_down_until):
+        _replica_down_until[index] = time.monotonic() + REPLICA_RETRY_S
+    logger.warning("read replica %d failed, reading from the primary for %.0fs: %s", index, REPLICA_RETRY_S, exc)
+
+
+def _open_replica_session() -> Optional[Tuple[int, Session]]:
+    """Return a connected replica session, or None if reads should use the primary."""
+    count = len(_replica_sessions)
+    if not count:
+        return None
+    now = time.monotonic()
+    last_write = _last_primary_write.get()
+    if last_write is not None and now - last_write[0] < REPLICA_STICKY_S:
+        return None
+    start = next(_replica_cursor)
+    for offset in range(count):
+        index = (start + offset) % count
+        if _replica_down_until[index] > now:
+            continue
+        session: Session = _replica_sessions[index]()
+        try:
+            session.connection()
+        except OperationalError as exc:
+            session.close()
+            _mark_replica_down(index, exc)
+            continue
+        return index, session
+    return None
+
+
+class ReplicaReadError(OperationalError):
+    """A read failed on a replica; the replica is marked down, so a rerun avoids it."""
+
 
 _init_lock = Lock()
 _initialized = False
@@ -50,20 +198,57 @@ def init_database() -> None:
         from app.db import models as _models  # noqa: F401
 
         Base.metadata.create_all(bind=engine)
+        for shard_engine in shard_engines.values():
+            Base.metadata.create_all(bind=shard_engine)
         _initialized = True
 
 
+def database_initialized() -> bool:
+    return _initialized
+
+
+def mark_database_initialized() -> None:
+    """Skip ``create_all`` when the schema is already known to be current."""
+    global _initialized
+    _initialized = True
+
+
 @contextmanager
-def session_scope() -> Iterator[Session]:
-    """Yield a transactional SQLAlchemy session."""
+def session_scope(shard: Optional[str] = None, *, readonly: bool = False) -> Iterator[Session]:
+    """Yield a transactional SQLAlchemy session on the primary or a region shard.
+
+    ``readonly`` sessions on the primary may be served by a read replica.
+    """
     init_database()
-    session: Session = SessionLocal()
+    replica = _open_replica_session() if readonly and shard is None else None
+    if replica is not None:
+        session = replica[1]
+    else:
+        session = (_shard_sessions[shard] if shard is not None else SessionLocal)()
     try:
         yield session
         session.commit()
-    except Exception:
+        if not readonly and shard is None:
+            _note_primary_write()
+    except Exception as exc:
         session.rollback()
+        if replica is not None and isinstance(exc, OperationalError):
+            _mark_replica_down(replica[0], exc)
+            raise ReplicaReadError(exc.statement, exc.params, exc.orig) from exc
         raise
     finally:
         session.close()
 
+
+def run_readonly(body: Callable[[Session], T], shard: Optional[str] = None) -> T:
+    """Run ``body`` on a ``readonly`` session, rerunning it elsewhere if a replica fails mid-read.
+
+    Each failure marks its replica down, so reruns end on a healthy replica or
+    the primary.
+    """
+    while True:
+        try:
+            with session_scope(shard, readonly=True) as session:
+                return body(session)
+        except ReplicaReadError:
+            continue
@@ -0,0 +1,90 @@
+"""Region routing and parallel fan-out across database shards.
+
+Charger ids carry a region prefix (``AUS_0123``) and case ids embed the
+charger id (``case_aus_0123``), so every row routes to a region without a
+lookup. A region with an entry in ``DATABASE_SHARDS`` lives in its own
+database; every other region lives in the primary database, shard ``None``.
+With no shards configured everything is a single-shard no-op.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+from app.db import session as db_session
+
+T = TypeVar("T")
+Shard = Optional[str]
+
+_SEPARATOR = re.compile(r"[^a-zA-Z0-9]+")
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = Lock()
+
+
+def sharding_enabled() -> bool:
+    return bool(db_session.shard_engines)
+
+
+def all_shards() -> List[Shard]:
+    return [None, *sorted(db_session.shard_engines)]
+
+
+def region_of_charger(charger_id: str) -> str:
+    return _SEPARATOR.split(charger_id.strip(), maxsplit=1)[0].upper()
+
+
+def region_of_case(case_id: str) -> str:
+    return region_of_charger(case_id[len("case_") :] if case_id.startswith("case_") else case_id)
+
+
+def shard_for_region(region: str) -> Shard:
+    return region if region in db_session.shard_engines else None
+
+
+def shard_for_charger(charger_id: str) -> Shard:
+    return shard_for_region(region_of_charger(charger_id)) if sharding_enabled() else None
+
+
+def shard_for_case(case_id: str) -> Shard:
+    return shard_for_region(region_of_case(case_id)) if sharding_enabled() else None
+
+
+def partition(items: Iterable[T], shard_of: Callable[[T], Shard]) -> Dict[Shard, List[T]]:
+    """Split ``items`` by shard, keeping their relative order."""
+    parts: Dict[Shard, List[T]] = defaultdict(list)
+    for item in items:
+        parts[shard_of(item)].append(item)
+    return parts
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="shard")
+        return _executor
+
+
+def fan_out(fn: Callable[[Shard], T], shards: Optional[Sequence[Shard]] = None) -> List[T]:
+    """Run ``fn`` once per shard (all shards by default), in parallel when there are several.
+
+    Each call runs in a copy of the caller's context so request-scoped
+    instrumentation (spans, query accounting) still sees the work, and
+    primary writes keep the caller's later reads off the replicas.
+    """
+    targets = list(all_shards() if shards is None else shards)
+    if len(targets) <= 1:
+        return [fn(shard) for shard in targets]
+    db_session.share_primary_writes()
+    futures = [_pool().submit(contextvars.copy_context().run, fn, shard) for shard in targets]
+    return [future.result() for future in futures]
+
+
+def require_unsharded(operation: str) -> None:
+    if sharding_enabled():
+        raise RuntimeError(f"{operation} writes the primary database only and does not support DATABASE_SHARDS")
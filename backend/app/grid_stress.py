@@ -0,0 +1,196 @@
+"""Grid stress lookups: which zone a charger sits in and the zone's stress at a time.
+
+A :class:`GridStressSnapshot` holds a :class:`ZoneIndex` of zone polygons and
+one :class:`StressSeries` per zone. Triage takes one snapshot per run and asks
+it for every charger:
+
+- The zone index buckets polygon bounding boxes into ``GRID_ZONE_CELL_DEG``
+  cells. A lookup tests only the polygons registered in the charger's cell.
+- Each series keeps its readings sorted by time. The level in effect at a
+  timestamp is one ``bisect``, so a lookup is O(log n) in the zone's readings.
+
+Snapshots come from a :class:`GridStressProvider`. The file-backed mock in
+:mod:`app.adapters.grid_stress_mock` is the default. ``GRID_STRESS_PROVIDER=feed``
+selects the cached live feed in :mod:`app.adapters.grid_stress_ercot_optional`,
+whose refresher the app starts and stops with :func:`start_grid_stress_refresh`.
+``GRID_STRESS_PROVIDER=none`` turns lookups off. Without a reading, triage
+falls back to :func:`app.scoring.compute_grid_stress_level`.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol, Sequence, Tuple
+
+from app.models import GridStressLevel
+
+GRID_STRESS_PROVIDER = os.getenv("GRID_STRESS_PROVIDER", "mock")
+GRID_ZONE_CELL_DEG = float(os.getenv("GRID_ZONE_CELL_DEG", "0.05"))
+
+_LEVELS: Tuple[GridStressLevel, ...] = ("normal", "elevated", "high")
+
+
+def _parse_time(raw: Any) -> float:
+    if isinstance(raw, datetime):
+        return raw.timestamp()
+    return datetime.fromisoformat(str(raw).replace("Z", "+00:00")).timestamp()
+
+
+@dataclass(frozen=True)
+class GridZone:
+    name: str
+    # (lon, lat) vertices; the ring closes implicitly.
+    polygon: Tuple[Tuple[float, float], ...]
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """Even-odd ray cast; points on a shared edge belong to one side only."""
+        inside = False
+        vertices = self.polygon
+        x1, y1 = vertices[-1]
+        for x2, y2 in vertices:
+            if (y1 > lat) != (y2 > lat) and lon < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+            x1, y1 = x2, y2
+        return inside
+
+
+class ZoneIndex:
+    """Point-in-zone lookups over polygons bucketed by bounding box."""
+
+    def __init__(self, zones: Iterable[GridZone], cell_deg: float = GRID_ZONE_CELL_DEG) -> None:
+        self.zones: List[GridZone] = list(zones)
+        self.cell_deg = cell_deg
+        self._cells: Dict[Tuple[int, int], List[GridZone]] = {}
+        for zone in self.zones:
+            lons = [lon for lon, _ in zone.polygon]
+            lats = [lat for _, lat in zone.polygon]
+            for x in range(self._cell(min(lons)), self._cell(max(lons)) + 1):
+                for y in range(self._cell(min(lats)), self._cell(max(lats)) + 1):
+                    self._cells.setdefault((x, y), []).append(zone)
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.cell_deg)
+
+    def zone_at(self, lon: float, lat: float) -> Optional[str]:
+        """Name of the first zone containing the point, in input order."""
+        for zone in self._cells.get((self._cell(lon), self._cell(lat)), ()):
+            if zone.contains(lon, lat):
+                return zone.name
+        return None
+
+
+@dataclass(frozen=True)
+class StressSeries:
+    times: Tuple[float, ...]
+    levels: Tuple[GridStressLevel, ...]
+
+    @classmethod
+    def from_readings(cls, readings: Iterable[Tuple[float, GridStressLevel]]) -> "StressSeries":
+        ordered = sorted(readings, key=lambda reading: reading[0])
+        return cls(tuple(time for time, _ in ordered), tuple(level for _, level in ordered))
+
+    def level_at(self, timestamp: float) -> Optional[GridStressLevel]:
+        """Level of the newest reading at or before ``timestamp``; None before the first."""
+        position = bisect_right(self.times, timestamp)
+        return self.levels[position - 1] if position else None
+
+
+@dataclass(frozen=True)
+class GridStressSnapshot:
+    zones: ZoneIndex
+    series: Mapping[str, StressSeries] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(
+        cls, zone_rows: Sequence[Mapping[str, Any]], stress_rows: Sequence[Mapping[str, Any]]
+    ) -> "GridStressSnapshot":
+        """Build from ``{zone, polygon}`` rows and ``{zone, timestamp, stress_level}`` rows."""
+        zones = ZoneIndex(
+            GridZone(str(row["zone"]), tuple((float(lon), float(lat)) for lon, lat in row["polygon"]))
+            for row in zone_rows
+        )
+        readings: Dict[str, List[Tuple[float, GridStressLevel]]] = {}
+        for row in stress_rows:
+            level = row["stress_level"]
+            if level not in _LEVELS:
+                raise ValueError(f"unknown stress level {level!r} for zone {row['zone']!r}")
+            readings.setdefault(str(row["zone"]), []).append((_parse_time(row["timestamp"]), level))
+        return cls(zones, {zone: StressSeries.from_readings(items) for zone, items in readings.items()})
+
+    def level_at(self, lon: float, lat: float, timestamp: datetime) -> Optional[GridStressLevel]:
+        zone = self.zones.zone_at(lon, lat)
+        if zone is None:
+            return None
+        series = self.series.get(zone)
+        return series.level_at(timestamp.timestamp()) if series is not None else None
+
+
+EMPTY_SNAPSHOT = GridStressSnapshot(ZoneIndex(()))
+
+
+class GridStressProvider(Protocol):
+    def snapshot(self) -> GridStressSnapshot:
+        """Current zones and readings; must be cheap to call once per triage run."""
+        ...
+
+
+_provider: Optional[GridStressProvider] = None
+_provider_lock = Lock()
+
+
+def _default_provider() -> Optional[GridStressProvider]:
+    if GRID_STRESS_PROVIDER == "none":
+        return None
+    from app.adapters.grid_stress_mock import FileGridStressProvider
+
+    if GRID_STRESS_PROVIDER == "feed":
+        from app.adapters.grid_stress_ercot_optional import feed_provider_from_env
+
+        return feed_provider_from_env() or FileGridStressProvider()
+    return FileGridStressProvider()
+
+
+def configure_grid_stress(provider: Optional[GridStressProvider]) -> None:
+    """Replace the process-wide provider; ``None`` restores the configured default."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
+
+
+def _current_provider() -> Optional[GridStressProvider]:
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = _default_provider()
+        return _provider
+
+
+def grid_stress_snapshot() -> GridStressSnapshot:
+    provider = _current_provider()
+    return provider.snapshot() if provider is not None else EMPTY_SNAPSHOT
+
+
+def start_grid_stress_refresh() -> None:
+    """Start the provider's background refresher, for providers that have one."""
+    start = getattr(_current_provider(), "start", None)
+    if start is not None:
+        start()
+
+
+def stop_grid_stress_refresh() -> None:
+    stop = getattr(_current_provider(), "stop", None)
+    if stop is not None:
+        stop()
+
+
+def grid_stress_stats() -> Dict[str, Any]:
+    provider = _current_provider()
+    stats = getattr(provider, "stats", None)
+    if stats is not None:
+        return stats()
+    return {"source": "off" if provider is None else type(provider).__name__}
@@ -2,21 +2,45 @@
 
 from fastapi import FastAPI
 
-from app.db.bootstrap import ensure_demo_cases
-from app.db.session import init_database
-from app.routes import cases, demo, metrics
+from app.db.async_session import async_engine
+from app.grid_stress import start_grid_stress_refresh, stop_grid_stress_refresh
+from app.middleware.admission import AdmissionMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.query_accounting import QueryAccountingMiddleware
+from app.observability.memory import MemoryTrackingMiddleware
+from app.observability.spans import PerfSpanMiddleware
+from app.routes import cases, demo, health, metrics
+from app.scoring_rules import scoring_rules
+from app.services import cpu_offload
+from app.services.startup_service import run_startup
 
 app = FastAPI(title="EV Grid Ops API", version="0.1.0")
+app.add_middleware(QueryAccountingMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(MemoryTrackingMiddleware)
+app.add_middleware(AdmissionMiddleware)
+# Added last so it is outermost and request timings include admission waits.
+app.add_middleware(PerfSpanMiddleware)
 
 
 @app.on_event("startup")
 def on_startup() -> None:
-    init_database()
-    ensure_demo_cases()
+    run_startup()
+    scoring_rules.start()
+    start_grid_stress_refresh()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    cpu_offload.shutdown()
+    stop_grid_stress_refresh()
+    scoring_rules.stop()
+    await async_engine.dispose()
 
 app.include_router(cases.router, prefix="/api")
 app.include_router(metrics.router, prefix="/api")
 app.include_router(demo.router, prefix="/api")
+app.include_router(health.router, prefix="/api")
 
 # Member 2 owns triage routes; include them when their router is available.
 try:
@@ -0,0 +1 @@
+"""ASGI middleware for request admission and instrumentation."""
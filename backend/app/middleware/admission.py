@@ -0,0 +1,236 @@
+"""Admission control and backpressure for triage writes and dashboard reads.
+
+Each budget caps how many requests run concurrently and how many may wait for
+a slot. When the queue is full the request is rejected immediately with 429;
+when a queued request does not get a slot within the queue timeout it is
+rejected with 503. Both responses carry ``Retry-After`` and the standard
+error envelope, so overload never reaches the threadpool or the DB pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter_ns
+from typing import Deque, Dict, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.observability.spans import record_stage
+
+TRIAGE_BUDGET = "triage"
+READ_BUDGET = "reads"
+
+_READ_PATHS = ("/api/cases", "/api/cases/clusters", "/api/metrics/compare")
+
+
+@dataclass(frozen=True)
+class BudgetConfig:
+    max_concurrent: int
+    max_queue: int
+    queue_timeout_s: float
+
+
+class AdmissionRejected(Exception):
+    """Raised when a budget cannot admit a request."""
+
+    def __init__(self, status_code: int, message: str, retry_after_s: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.retry_after_s = retry_after_s
+
+
+class _Waiter:
+    __slots__ = ("loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.future: asyncio.Future[None] = loop.create_future()
+        self.granted = False
+
+
+def _wake(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdmissionBudget:
+    """Concurrency budget with a bounded FIFO wait queue.
+
+    Slots are handed directly from a releasing request to the oldest waiter,
+    so queued requests are served in arrival order. The budget is safe to use
+    from several event loops and threads at once.
+    """
+
+    def __init__(self, name: str, config: BudgetConfig) -> None:
+        self.name = name
+        self.config = config
+        self._lock = Lock()
+        self._active = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._admitted = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+
+    @property
+    def retry_after_s(self) -> int:
+        return max(1, math.ceil(self.config.queue_timeout_s))
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if self._active < self.config.max_concurrent and not self._waiters:
+                self._active += 1
+                self._admitted += 1
+                return
+            if len(self._waiters) >= self.config.max_queue:
+                self._rejected_queue_full += 1
+                raise AdmissionRejected(
+                    429, f"{self.name} queue is full; retry later", self.retry_after_s
+                )
+            waiter = _Waiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter.future, timeout=self.config.queue_timeout_s)
+        except BaseException as exc:
+            with self._lock:
+                if waiter.granted:
+                    # A slot was handed over just as we gave up waiting.
+                    if isinstance(exc, asyncio.TimeoutError):
+                        self._admitted += 1
+                        return
+                else:
+                    self._waiters.remove(waiter)
+                    if isinstance(exc, asyncio.TimeoutError):
+                        self._rejected_timeout += 1
+                        raise AdmissionRejected(
+                            503,
+                            f"{self.name} capacity exhausted; retry later",
+                            self.retry_after_s,
+                        ) from None
+            if waiter.granted:
+                self.release()
+            raise
+
+        with self._lock:
+            self._admitted += 1
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                try:
+                    waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+                except RuntimeError:
+                    # The waiter's event loop is gone; offer the slot to the next one.
+                    continue
+                return
+            self._active -= 1
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "active": self._active,
+                "queued": len(self._waiters),
+                "max_concurrent": self.config.max_concurrent,
+                "max_queue": self.config.max_queue,
+                "queue_timeout_s": self.config.queue_timeout_s,
+                "admitted": self._admitted,
+                "rejected_queue_full": self._rejected_queue_full,
+                "rejected_timeout": self._rejected_timeout,
+            }
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+class AdmissionController:
+    """Route requests to the budget that governs them."""
+
+    def __init__(self, budgets: Dict[str, AdmissionBudget]) -> None:
+        self.budgets = budgets
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        return cls(
+            {
+                TRIAGE_BUDGET: AdmissionBudget(
+                    TRIAGE_BUDGET,
+                    BudgetConfig(
+                        max_concurrent=_env_int("ADMISSION_TRIAGE_MAX_CONCURRENT", 2),
+                        max_queue=_env_int("ADMISSION_TRIAGE_MAX_QUEUE", 8),
+                        queue_timeout_s=_env_float("ADMISSION_TRIAGE_QUEUE_TIMEOUT_S", 10.0),
+                    ),
+                ),
+                READ_BUDGET: AdmissionBudget(
+                    READ_BUDGET,
+                    BudgetConfig(
+                        max_concurrent=_env_int("ADMISSION_READ_MAX_CONCURRENT", 12),
+                        max_queue=_env_int("ADMISSION_READ_MAX_QUEUE", 64),
+                        queue_timeout_s=_env_float("ADMISSION_READ_QUEUE_TIMEOUT_S", 2.0),
+                    ),
+                ),
+            }
+        )
+
+    def classify(self, method: str, path: str) -> Optional[AdmissionBudget]:
+        if method == "POST" and path.startswith("/api/triage/"):
+            return self.budgets.get(TRIAGE_BUDGET)
+        if method == "GET" and path in _READ_PATHS:
+            return self.budgets.get(READ_BUDGET)
+        return None
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {name: budget.snapshot() for name, budget in self.budgets.items()}
+
+
+admission_controller = AdmissionController.from_env()
+
+
+class AdmissionMiddleware:
+    """Pure ASGI middleware enforcing :class:`AdmissionController` budgets."""
+
+    def __init__(self, app: ASGIApp, controller: Optional[AdmissionController] = None) -> None:
+        self.app = app
+        self.controller = controller or admission_controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = self.controller.classify(scope["method"], scope["path"])
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        wait_start_ns = perf_counter_ns()
+        try:
+            await budget.acquire()
+        except AdmissionRejected as exc:
+            record_stage("admission_wait", perf_counter_ns() - wait_start_ns)
+            response = JSONResponse(
+                status_code=exc.status_code,
+                content={"ok": False, "data": None, "error": exc.message},
+                headers={"Retry-After": str(exc.retry_after_s)},
+            )
+            await response(scope, receive, send)
+            return
+        record_stage("admission_wait", perf_counter_ns() - wait_start_ns)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            budget.release()
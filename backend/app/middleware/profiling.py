@@ -0,0 +1,291 @@
+"""Opt-in per-request profiling.
+
+A request is profiled when it carries ``X-Profile: <PROFILE_TOKEN>`` or is
+picked by ``PROFILE_SAMPLE_RATE``. Its endpoint then runs under either
+``cProfile`` (``PROFILE_MODE=cprofile``, writes ``.pstats``) or a stack sampler
+(``PROFILE_MODE=sampling``, writes flamegraph-ready ``.collapsed`` stacks).
+Files are tagged with the route and request id, written to ``PROFILE_DIR`` and
+rotated to keep at most ``PROFILE_MAX_FILES``.
+
+Overhead is capped: at most ``PROFILE_MAX_CONCURRENT`` requests are profiled
+at once and at most ``PROFILE_MAX_PER_MINUTE`` per minute; the sampler also
+stops after ``PROFILE_MAX_DURATION_S``. With no token configured and a zero
+sample rate the middleware passes requests straight through, and unprofiled
+requests only pay one context variable lookup at the endpoint.
+
+Endpoints are hooked through :class:`ProfiledRoute` because sync handlers run
+on threadpool workers, which a profiler started in the middleware would miss.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import inspect
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Awaitable, Callable, Optional
+
+from anyio import to_thread
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.observability.spans import mark_decode_start, route_label
+
+PROFILE_HEADER = "x-profile"
+REQUEST_ID_HEADER = "x-request-id"
+
+
+@dataclass(frozen=True)
+class ProfilingConfig:
+    token: Optional[str] = None
+    sample_rate: float = 0.0
+    mode: str = "cprofile"
+    output_dir: Path = Path("profiles")
+    max_files: int = 50
+    max_concurrent: int = 1
+    max_per_minute: int = 6
+    sampling_interval_s: float = 0.005
+    max_duration_s: float = 30.0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token) or self.sample_rate > 0
+
+    @classmethod
+    def from_env(cls) -> "ProfilingConfig":
+        return cls(
+            token=os.getenv("PROFILE_TOKEN") or None,
+            sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+            mode=os.getenv("PROFILE_MODE", "cprofile"),
+            output_dir=Path(os.getenv("PROFILE_DIR", "profiles")),
+            max_files=int(os.getenv("PROFILE_MAX_FILES", "50")),
+            max_concurrent=int(os.getenv("PROFILE_MAX_CONCURRENT", "1")),
+            max_per_minute=int(os.getenv("PROFILE_MAX_PER_MINUTE", "6")),
+            sampling_interval_s=float(os.getenv("PROFILE_SAMPLING_INTERVAL_S", "0.005")),
+            max_duration_s=float(os.getenv("PROFILE_MAX_DURATION_S", "30")),
+        )
+
+
+class StackSampler:
+    """Sample one thread's Python stack into collapsed-stack counts."""
+
+    def __init__(self, thread_ident: int, interval_s: float, max_duration_s: float) -> None:
+        self.thread_ident = thread_ident
+        self.interval_s = interval_s
+        self.max_duration_s = max_duration_s
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self.max_duration_s
+        while not self._stop.wait(self.interval_s) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(self.thread_ident)
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            if frames:
+                # The sampler's own frames are never on the target thread.
+                self.stacks[";".join(reversed(frames))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class _ProfiledRequest:
+    __slots__ = ("config", "request_id", "profiler", "sampler")
+
+    def __init__(self, config: ProfilingConfig, request_id: str) -> None:
+        self.config = config
+        self.request_id = request_id
+        self.profiler: Optional[cProfile.Profile] = None
+        self.sampler: Optional[StackSampler] = None
+
+    def _start(self) -> None:
+        if self.config.mode == "sampling":
+            self.sampler = StackSampler(
+                threading.get_ident(), self.config.sampling_interval_s, self.config.max_duration_s
+            )
+            self.sampler.start()
+        else:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def _stop(self) -> None:
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        self._start()
+        try:
+            return fn()
+        finally:
+            self._stop()
+
+    async def run_async(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Other tasks scheduled on the event loop while awaiting are captured too.
+        self._start()
+        try:
+            return await fn()
+        finally:
+            self._stop()
+
+
+_active_profile: ContextVar[Optional[_ProfiledRequest]] = ContextVar("active_profile", default=None)
+
+
+def profiled_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap ``endpoint`` so it runs under the request's profiler when one is active."""
+    signature = inspect.signature(endpoint, eval_str=True)
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            active = _active_profile.get()
+            if active is None:
+                return await endpoint(*args, **kwargs)
+            return await active.run_async(lambda: endpoint(*args, **kwargs))
+
+        async_wrapper.__signature__ = signature  # type: ignore[attr-defined]
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        active = _active_profile.get()
+        if active is None:
+            return endpoint(*args, **kwargs)
+        return active.run(lambda: endpoint(*args, **kwargs))
+
+    # Resolved annotations keep FastAPI independent of the wrapper's globals.
+    wrapper.__signature__ = signature  # type: ignore[attr-defined]
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """``APIRoute`` whose endpoint can be profiled by :class:`ProfilingMiddleware`.
+
+    It also marks where body decoding starts for the ``decode_validate`` span.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, profiled_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            mark_decode_start()
+            return await handler(request)
+
+        return route_handler
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9]+", "_", value).strip("_").lower()
+
+
+class ProfilingMiddleware:
+    """Select requests for profiling and write their profiles to disk."""
+
+    def __init__(self, app: ASGIApp, config: Optional[ProfilingConfig] = None) -> None:
+        self.app = app
+        self.config = config or ProfilingConfig.from_env()
+        self._lock = Lock()
+        # Profiles are written on worker threads; one rotation at a time.
+        self._rotate_lock = Lock()
+        self._running = 0
+        self._recent: list[float] = []
+        self.written = 0
+
+    def _selected(self, scope: Scope) -> bool:
+        config = self.config
+        if config.token:
+            supplied = Headers(scope=scope).get(PROFILE_HEADER)
+            if supplied is not None and secrets.compare_digest(supplied, config.token):
+                return True
+        return config.sample_rate > 0 and random.random() < config.sample_rate
+
+    def _reserve(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._recent = [started for started in self._recent if now - started < 60.0]
+            if self._running >= self.config.max_concurrent or len(self._recent) >= self.config.max_per_minute:
+                return False
+            self._running += 1
+            self._recent.append(now)
+            return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.config.enabled or not self._selected(scope) or not self._reserve():
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+        profiled = _ProfiledRequest(self.config, _slug(request_id)[:64] or uuid.uuid4().hex)
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = profiled.request_id
+            await send(message)
+
+        token = _active_profile.set(profiled)
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            _active_profile.reset(token)
+            try:
+                # Dumping and rotating profiles is file I/O; keep it off the event loop.
+                await to_thread.run_sync(self._write, route_label(scope), profiled)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+    def _write(self, route: str, profiled: _ProfiledRequest) -> None:
+        if profiled.profiler is None and profiled.sampler is None:
+            return
+        output_dir = self.config.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{time.strftime('%Y%m%dT%H%M%S')}_{_slug(route)}_{profiled.request_id}"
+        if profiled.profiler is not None:
+            profiled.profiler.dump_stats(str(output_dir / f"{stem}.pstats"))
+        if profiled.sampler is not None:
+            (output_dir / f"{stem}.collapsed").write_text(profiled.sampler.collapsed(), encoding="utf-8")
+        with self._lock:
+            self.written += 1
+        with self._rotate_lock:
+            self._rotate(output_dir)
+
+    def _rotate(self, output_dir: Path) -> None:
+        files = sorted(
+            (path for path in output_dir.iterdir() if path.suffix in {".pstats", ".collapsed"}),
+            key=lambda path: path.stat().st_mtime,
+        )
+        for path in files[: max(0, len(files) - self.config.max_files)]:
+            path.unlink(missing_ok=True)
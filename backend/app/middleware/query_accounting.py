@@ -0,0 +1,49 @@
+"""Per-request SQL statement accounting and debug response headers."""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import QueryStats, track_queries
+from app.observability.spans import record_stage
+
+DEBUG_HEADERS = os.getenv("SQL_DEBUG_HEADERS", "0").lower() in {"1", "true", "yes"}
+
+
+class QueryAccountingMiddleware:
+    """Count SQL statements, rows and DB time for each HTTP request.
+
+    DB time is recorded as the ``db`` stage of the request's perf spans. When
+    ``SQL_DEBUG_HEADERS`` is on, totals are also returned as ``X-DB-Statements``,
+    ``X-DB-Rows`` and ``X-DB-Time-Ms`` response headers.
+    """
+
+    def __init__(self, app: ASGIApp, debug_headers: Optional[bool] = None) -> None:
+        self.app = app
+        self.debug_headers = DEBUG_HEADERS if debug_headers is None else debug_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(keep_statements=False)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.debug_headers:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Statements"] = str(stats.statements)
+                headers["X-DB-Rows"] = str(stats.rows)
+                headers["X-DB-Time-Ms"] = f"{stats.duration_ms:.3f}"
+            await send(message)
+
+        with track_queries(stats):
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                if stats.statements:
+                    record_stage("db", stats.duration_ns)
@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 SignalSource = Literal["charger_api", "311", "ugc"]
 SignalStatus = Literal["down", "degraded", "online", "unknown"]
 RootCauseTag = Literal["payment_terminal", "connector", "network", "unknown"]
-RecommendedAction = Literal["dispatch_field_tech", "remote_reset", "needs_verification"]
+RecommendedAction = Literal["dispatch_field_tech", "remote_reset", "needs_verification", "covered_by_incident"]
 GridStressLevel = Literal["normal", "elevated", "high"]
 WorkOrderState = Literal["created", "in_progress", "done"]
 VerificationStatus = Literal["open", "done"]
@@ -46,6 +46,20 @@ class Case(BaseModel):
     explanation: str
     uncertainty_reasons: List[str] = Field(default_factory=list)
     verification_required: bool = False
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    incident_id: Optional[str] = None
+    rules_version: Optional[str] = None
+
+
+class Incident(BaseModel):
+    id: str
+    primary_case_id: str
+    case_ids: List[str]
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    max_priority_score: int
+    suppressed_dispatches: int
 
 
 class VerificationTask(BaseModel):
@@ -82,6 +96,7 @@ class BaselineTriageResponseData(BaseModel):
 class CertaintyTriageResponseData(BaseModel):
     cases: List[Case]
     verification_tasks: List[VerificationTask] = Field(default_factory=list)
+    incidents: List[Incident] = Field(default_factory=list)
 
 
 class CasesResponseData(BaseModel):
@@ -89,6 +104,23 @@ class CasesResponseData(BaseModel):
     cases: List[Case]
 
 
+class CaseCluster(BaseModel):
+    lat: float
+    lon: float
+    count: int
+    max_priority_score: int
+    # Set when the cluster is a single case.
+    case_id: Optional[str] = None
+    # Zoom level at which the cluster splits; null for single cases.
+    expansion_zoom: Optional[int] = None
+
+
+class CaseClustersResponseData(BaseModel):
+    mode: CaseMode
+    zoom: int
+    clusters: List[CaseCluster]
+
+
 class DispatchRequest(BaseModel):
     assigned_team: str
     due_at: datetime
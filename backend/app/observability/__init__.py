@@ -0,0 +1 @@
+"""Runtime performance instrumentation and exporters."""
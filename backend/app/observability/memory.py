@@ -0,0 +1,231 @@
+"""tracemalloc-based peak memory tracking per pipeline stage.
+
+A measurement covers one triage run. Each :func:`app.observability.spans.span`
+inside it also records the stage's peak memory above the stage's starting
+point, its net retained memory and, optionally, its top allocation sites.
+Finished measurements go into a bounded history that
+``GET /api/metrics/memory`` reads.
+
+tracemalloc slows allocation-heavy code noticeably and its peak counter is
+process-wide, so tracking is opt-in (``MEMORY_TRACKING_ENABLED=1``) and only
+one measurement runs at a time; concurrent requests are simply not measured.
+
+Open stages are kept on a per-context stack, so nested spans and spans run in
+parallel by ``fan_out`` each get their own record. The peak counter is only
+reset when a stage opens with no other stage open. A stage that opens inside
+or beside another one counts the peak only if it rises while the stage runs,
+and falls back to its net growth otherwise.
+"""
+
+from __future__ import annotations
+
+import os
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+HISTORY_SIZE = int(os.getenv("MEMORY_HISTORY_SIZE", "50"))
+TOP_SITES = int(os.getenv("MEMORY_TOP_SITES", "5"))
+
+
+@dataclass
+class StageMemory:
+    stage: str
+    peak_bytes: int
+    net_bytes: int
+    duration_ms: float
+    top_sites: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _OpenStage:
+    stage: str
+    start_bytes: int
+    start_peak: int
+    start_ns: int
+    snapshot: Optional[tracemalloc.Snapshot]
+
+
+_open_stages: ContextVar[Tuple[_OpenStage, ...]] = ContextVar("memory_open_stages", default=())
+
+
+@dataclass
+class MemoryMeasurement:
+    label: str
+    started_at: str
+    signals: int = 0
+    peak_bytes: int = 0
+    stages: List[StageMemory] = field(default_factory=list)
+    top_sites: int = TOP_SITES
+    _baseline: int = 0
+    _active: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    @property
+    def peak_bytes_per_signal(self) -> float:
+        return self.peak_bytes / self.signals if self.signals else 0.0
+
+    def _observe_peak(self, peak: int) -> None:
+        self.peak_bytes = max(self.peak_bytes, peak - self._baseline)
+
+    def begin_stage(self, stage: str) -> None:
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self._observe_peak(peak)
+            if not self._active:
+                # Nothing else is open, so the process-wide peak is ours to reset.
+                tracemalloc.reset_peak()
+                peak = current
+            self._active += 1
+        snapshot = tracemalloc.take_snapshot() if self.top_sites else None
+        _open_stages.set(_open_stages.get() + (_OpenStage(stage, current, peak, perf_counter_ns(), snapshot),))
+
+    def end_stage(self) -> None:
+        stack = _open_stages.get()
+        if not stack:
+            return
+        opened = stack[-1]
+        _open_stages.set(stack[:-1])
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self._observe_peak(peak)
+            self._active -= 1
+        start_bytes = opened.start_bytes
+        peak_bytes = peak - start_bytes if peak > opened.start_peak else max(current - start_bytes, 0)
+        sites: List[Dict[str, Any]] = []
+        if opened.snapshot is not None:
+            for stat in tracemalloc.take_snapshot().compare_to(opened.snapshot, "lineno")[: self.top_sites]:
+                frame = stat.traceback[0]
+                sites.append(
+                    {"site": f"{frame.filename}:{frame.lineno}", "size_bytes": stat.size_diff, "count": stat.count_diff}
+                )
+        record = StageMemory(
+            stage=opened.stage,
+            peak_bytes=peak_bytes,
+            net_bytes=current - start_bytes,
+            duration_ms=round((perf_counter_ns() - opened.start_ns) / 1e6, 3),
+            top_sites=sites,
+        )
+        with self._lock:
+            self.stages.append(record)
+
+    def record_since_start(self, stage: str) -> None:
+        """Record everything since the measurement started as one stage."""
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self._observe_peak(peak)
+            self.stages.append(
+                StageMemory(
+                    stage=stage, peak_bytes=peak - self._baseline, net_bytes=current - self._baseline, duration_ms=0.0
+                )
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "signals": self.signals,
+            "peak_bytes": self.peak_bytes,
+            "peak_bytes_per_signal": round(self.peak_bytes_per_signal, 1),
+            "stages": [stage.__dict__ for stage in self.stages],
+        }
+
+
+class MemoryTracker:
+    """Runs one measurement at a time and keeps the last N results."""
+
+    def __init__(self, enabled: bool, history_size: int = HISTORY_SIZE) -> None:
+        self.enabled = enabled
+        self._lock = Lock()
+        self._busy = False
+        self._history: Deque[MemoryMeasurement] = deque(maxlen=history_size)
+
+    @contextmanager
+    def measure(self, label: str, signals: int = 0, top_sites: int = TOP_SITES) -> Iterator[Optional[MemoryMeasurement]]:
+        """Measure the block; yields ``None`` when another measurement is running."""
+        with self._lock:
+            if self._busy:
+                acquired = False
+            else:
+                self._busy = acquired = True
+        if not acquired:
+            yield None
+            return
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        measurement = MemoryMeasurement(
+            label=label,
+            started_at=datetime.now(timezone.utc).isoformat(),
+            signals=signals,
+            top_sites=top_sites,
+            _baseline=tracemalloc.get_traced_memory()[0],
+        )
+        token = _current_measurement.set(measurement)
+        stages_token = _open_stages.set(())
+        try:
+            yield measurement
+        finally:
+            _open_stages.reset(stages_token)
+            _current_measurement.reset(token)
+            measurement._observe_peak(tracemalloc.get_traced_memory()[1])
+            if started_tracing:
+                tracemalloc.stop()
+            with self._lock:
+                self._history.append(measurement)
+                self._busy = False
+
+    def recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            items = list(self._history)[-limit:] if limit > 0 else []
+        return [item.to_dict() for item in reversed(items)]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._history.clear()
+
+
+tracker = MemoryTracker(enabled=os.getenv("MEMORY_TRACKING_ENABLED", "0").lower() in {"1", "true", "yes"})
+
+_current_measurement: ContextVar[Optional[MemoryMeasurement]] = ContextVar("memory_measurement", default=None)
+
+
+def current_measurement() -> Optional[MemoryMeasurement]:
+    return _current_measurement.get()
+
+
+def record_signal_count(count: int) -> None:
+    measurement = _current_measurement.get()
+    if measurement is not None:
+        measurement.signals = count
+
+
+class MemoryTrackingMiddleware:
+    """Measure triage requests when memory tracking is enabled."""
+
+    def __init__(self, app: ASGIApp, memory_tracker: Optional[MemoryTracker] = None) -> None:
+        self.app = app
+        self.tracker = memory_tracker or tracker
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.tracker.enabled
+            or scope["method"] != "POST"
+            or not scope["path"].startswith("/api/triage/")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        with self.tracker.measure(f"POST {scope['path']}"):
+            await self.app(scope, receive, send)
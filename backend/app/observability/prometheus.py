@@ -0,0 +1,94 @@
+"""Prometheus text exposition for in-process performance metrics."""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from app.middleware.admission import admission_controller
+from app.observability.spans import BUCKET_BOUNDS_S, registry
+from app.services.ingest_dedup import seen_signals
+from app.services.singleflight import read_coalescer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_PREFIX = "ev_grid_ops"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _stage_histograms() -> List[str]:
+    name = f"{_PREFIX}_stage_duration_seconds"
+    lines = [
+        f"# HELP {name} Time spent per pipeline stage, by route.",
+        f"# TYPE {name} histogram",
+    ]
+    bounds = [repr(bound) for bound in BUCKET_BOUNDS_S] + ["+Inf"]
+    for (route, stage), histogram in registry.histograms().items():
+        cumulative = 0
+        for bound, bucket_count in zip(bounds, histogram.counts):
+            cumulative += bucket_count
+            lines.append(f"{name}_bucket{{{_labels(route=route, stage=stage, le=bound)}}} {cumulative}")
+        lines.append(f"{name}_sum{{{_labels(route=route, stage=stage)}}} {histogram.sum_ns / 1e9:.9f}")
+        lines.append(f"{name}_count{{{_labels(route=route, stage=stage)}}} {histogram.count}")
+    return lines
+
+
+def _admission_gauges() -> List[str]:
+    snapshot = admission_controller.snapshot()
+    lines: List[str] = []
+    for field, kind, help_text in (
+        ("active", "gauge", "Requests currently holding an admission slot."),
+        ("queued", "gauge", "Requests waiting for an admission slot."),
+        ("rejected_queue_full", "counter", "Requests rejected because the queue was full."),
+        ("rejected_timeout", "counter", "Requests rejected after waiting past the queue timeout."),
+    ):
+        name = f"{_PREFIX}_admission_{field}"
+        if kind == "counter":
+            name = f"{name}_total"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for budget, values in snapshot.items():
+            lines.append(f"{name}{{{_labels(budget=budget)}}} {values[field]}")
+    return lines
+
+
+def _coalescing_counters() -> List[str]:
+    stats: Dict[str, Dict[str, int]] = read_coalescer.stats()
+    lines: List[str] = []
+    for field in ("calls", "executions", "coalesced"):
+        name = f"{_PREFIX}_read_{field}_total"
+        lines.append(f"# HELP {name} Singleflight {field} per read key.")
+        lines.append(f"# TYPE {name} counter")
+        for key, values in stats.items():
+            lines.append(f"{name}{{{_labels(key=key)}}} {values[field]}")
+    return lines
+
+
+def _ingest_counters() -> List[str]:
+    stats = seen_signals.stats()
+    lines: List[str] = []
+    for field, help_text in (
+        ("signals", "Signals received by triage posts."),
+        ("lru_hits", "Signal ids found in the recent-signal LRU."),
+        ("lru_misses", "Signal ids not in the recent-signal LRU."),
+        ("bloom_negatives", "LRU misses the Bloom filter proved new without a lookup."),
+        ("bloom_false_positives", "LRU misses the Bloom filter reported seen that were not stored."),
+        ("repeats_dropped", "Exact resends dropped before the database."),
+        ("rescoring_skipped", "Triage posts answered from stored cases without rescoring."),
+    ):
+        name = f"{_PREFIX}_ingest_{field}_total"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name} {stats[field]}")
+    return lines
+
+
+def render_prometheus() -> str:
+    """Render all exported metrics in Prometheus text format 0.0.4."""
+    lines = _stage_histograms() + _admission_gauges() + _coalescing_counters() + _ingest_counters()
+    return "\n".join(lines) + "\n"
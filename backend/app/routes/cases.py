@@ -1,15 +1,17 @@
 """Case lifecycle routes for /api/cases endpoints."""
 
-from typing import cast
+from typing import Optional, cast
 
 from fastapi import APIRouter, Body, Path, Query
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
+from app.middleware.profiling import ProfiledRoute
 from app.models import ApiResponse, CaseMode, DispatchRequest, VerifyRequest
 from app.services import case_service
+from app.spatial import WORLD, parse_bbox
 
-router = APIRouter(prefix="/cases", tags=["cases"])
+router = APIRouter(prefix="/cases", tags=["cases"], route_class=ProfiledRoute)
 
 
 def _dump(model: ApiResponse) -> dict:
@@ -24,19 +26,45 @@ def _error_response(status_code: int, message: str) -> JSONResponse:
 
 
 @router.get("", response_model=ApiResponse)
-def get_cases(mode: str = Query(..., description="baseline or certainty")):
+async def get_cases(
+    mode: str = Query(..., description="baseline or certainty"),
+    bbox: Optional[str] = Query(None, description="minLon,minLat,maxLon,maxLat"),
+):
+    if mode not in {"baseline", "certainty"}:
+        return _error_response(400, "mode must be 'baseline' or 'certainty'")
+
+    try:
+        if bbox is not None:
+            data = await case_service.list_cases_in_bbox_async(cast(CaseMode, mode), parse_bbox(bbox))
+        else:
+            data = await case_service.list_cases_async(cast(CaseMode, mode))
+    except ValueError as exc:
+        return _error_response(400, str(exc))
+    return ApiResponse(ok=True, data=data, error=None)
+
+
+@router.get("/clusters", response_model=ApiResponse)
+async def get_case_clusters(
+    zoom: int = Query(..., description="Map zoom level"),
+    mode: str = Query("certainty", description="baseline or certainty"),
+    bbox: Optional[str] = Query(None, description="minLon,minLat,maxLon,maxLat"),
+):
     if mode not in {"baseline", "certainty"}:
         return _error_response(400, "mode must be 'baseline' or 'certainty'")
+    if zoom < 0:
+        return _error_response(400, "zoom must be >= 0")
 
     try:
-        data = case_service.list_cases(cast(CaseMode, mode))
+        data = await case_service.list_case_clusters_async(
+            cast(CaseMode, mode), zoom, parse_bbox(bbox) if bbox is not None else WORLD
+        )
     except ValueError as exc:
         return _error_response(400, str(exc))
     return ApiResponse(ok=True, data=data, error=None)
 
 
 @router.post("/{id}/dispatch", response_model=ApiResponse)
-def dispatch_case(
+async def dispatch_case(
     payload: dict = Body(...),
     id: str = Path(..., description="Case identifier"),
 ):
@@ -46,14 +74,14 @@ def dispatch_case(
         return _error_response(400, str(exc))
 
     try:
-        data = case_service.dispatch_case(id, request)
+        data = await case_service.dispatch_case_async(id, request)
     except ValueError as exc:
         return _error_response(404, str(exc))
     return ApiResponse(ok=True, data=data, error=None)
 
 
 @router.post("/{id}/verify", response_model=ApiResponse)
-def verify_case(
+async def verify_case(
     payload: dict = Body(...),
     id: str = Path(..., description="Case identifier"),
 ):
@@ -63,7 +91,7 @@ def verify_case(
         return _error_response(400, str(exc))
 
     try:
-        data = case_service.verify_case(id, request)
+        data = await case_service.verify_case_async(id, request)
     except ValueError as exc:
         return _error_response(404, str(exc))
     return ApiResponse(ok=True, data=data, error=None)
@@ -3,10 +3,11 @@
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
+from app.middleware.profiling import ProfiledRoute
 from app.models import ApiResponse
 from app.seed_data.load_demo_seed import load_demo_seed
 
-router = APIRouter(prefix="/demo", tags=["demo"])
+router = APIRouter(prefix="/demo", tags=["demo"], route_class=ProfiledRoute)
 
 
 def _dump(model: ApiResponse) -> dict:
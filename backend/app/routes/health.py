@@ -0,0 +1,32 @@
+"""Liveness and readiness routes for /api/health endpoints."""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.db.session import replica_status
+from app.middleware.profiling import ProfiledRoute
+from app.models import ApiResponse
+from app.services.startup_service import startup_state
+
+router = APIRouter(prefix="/health", tags=["health"], route_class=ProfiledRoute)
+
+
+def _dump(model: ApiResponse) -> dict:
+    return model.model_dump() if hasattr(model, "model_dump") else model.dict()
+
+
+@router.get("/live", response_model=ApiResponse)
+def get_liveness():
+    return ApiResponse(ok=True, data={"status": "alive"}, error=None)
+
+
+@router.get("/ready", response_model=ApiResponse)
+def get_readiness():
+    snapshot = {**startup_state.snapshot(), "replicas": replica_status()}
+    if startup_state.ready:
+        return ApiResponse(ok=True, data=snapshot, error=None)
+    return JSONResponse(
+        status_code=503,
+        content=_dump(ApiResponse(ok=False, data=snapshot, error=f"not ready: {snapshot['status']}")),
+        headers={"Retry-After": "1"},
+    )
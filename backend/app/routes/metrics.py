@@ -1,14 +1,87 @@
 """Metrics routes for /api/metrics endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
 
+from app.db.async_session import all_engines
+from app.db.pool_stats import pool_snapshot
+from app.db.profiles import DB_PROFILE
+from app.grid_stress import grid_stress_stats
+from app.middleware.admission import admission_controller
+from app.middleware.profiling import ProfiledRoute
 from app.models import ApiResponse
-from app.services.metrics_service import compare_metrics
+from app.observability.memory import tracker as memory_tracker
+from app.observability.prometheus import CONTENT_TYPE, render_prometheus
+from app.observability.spans import registry as span_registry
+from app.scoring_rules import scoring_rules
+from app.services.ingest_dedup import seen_signals
+from app.services.metrics_service import compare_metrics_async
+from app.services.singleflight import read_coalescer
 
-router = APIRouter(prefix="/metrics", tags=["metrics"])
+router = APIRouter(prefix="/metrics", tags=["metrics"], route_class=ProfiledRoute)
 
 
 @router.get("/compare", response_model=ApiResponse)
-def get_compare_metrics():
-    metrics = compare_metrics()
+async def get_compare_metrics():
+    metrics = await compare_metrics_async()
     return ApiResponse(ok=True, data=metrics, error=None)
+
+
+@router.get("/coalescing", response_model=ApiResponse)
+def get_coalescing_metrics():
+    return ApiResponse(ok=True, data=read_coalescer.stats(), error=None)
+
+
+@router.get("/admission", response_model=ApiResponse)
+def get_admission_metrics():
+    return ApiResponse(ok=True, data=admission_controller.snapshot(), error=None)
+
+
+@router.get("/perf", response_model=ApiResponse)
+def get_perf_metrics():
+    return ApiResponse(
+        ok=True,
+        data={"enabled": span_registry.enabled, "routes": span_registry.snapshot()},
+        error=None,
+    )
+
+
+@router.get("/memory", response_model=ApiResponse)
+def get_memory_metrics(limit: int = Query(default=10, ge=1, le=100)):
+    return ApiResponse(
+        ok=True,
+        data={"enabled": memory_tracker.enabled, "measurements": memory_tracker.recent(limit)},
+        error=None,
+    )
+
+
+@router.get("/db-pool", response_model=ApiResponse)
+def get_db_pool_metrics():
+    return ApiResponse(
+        ok=True,
+        data={
+            "profile": DB_PROFILE,
+            "pools": {label: pool_snapshot(pool_engine) for label, pool_engine in all_engines().items()},
+        },
+        error=None,
+    )
+
+
+@router.get("/grid-stress", response_model=ApiResponse)
+def get_grid_stress_metrics():
+    return ApiResponse(ok=True, data=grid_stress_stats(), error=None)
+
+
+@router.get("/ingest", response_model=ApiResponse)
+def get_ingest_metrics():
+    return ApiResponse(ok=True, data=seen_signals.stats(), error=None)
+
+
+@router.get("/scoring-rules", response_model=ApiResponse)
+def get_scoring_rules_metrics():
+    return ApiResponse(ok=True, data=scoring_rules.stats(), error=None)
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+def get_prometheus_metrics():
+    return PlainTextResponse(render_prometheus(), media_type=CONTENT_TYPE)
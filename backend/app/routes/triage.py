@@ -2,73 +2,105 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import List, Sequence
 
+from anyio import to_thread
 from fastapi import APIRouter
 
-from app import store
+from app import async_store
+from app.middleware.profiling import ProfiledRoute
 from app.models import (
     ApiResponse,
     BaselineTriageResponseData,
-    CertaintyTriageResponseData,
     Case,
+    CertaintyTriageResponseData,
+    Signal,
     TriageRequest,
-    VerificationTask,
 )
-from app.triage.baseline import run_baseline_triage
-from app.triage.certainty import run_certainty_triage
-
-router = APIRouter(prefix="/triage", tags=["triage"])
-
+from app.observability.memory import record_signal_count
+from app.observability.spans import mark_handler_entry, span
+from app.scoring_rules import current_rules
+from app.services.case_index import case_index
+from app.services.cpu_offload import run_cpu
+from app.services.ingest_dedup import IngestPlan, seen_signals
+from app.triage.certainty import CONFIDENCE_THRESHOLD
+from app.triage.correlation import incidents_from_cases
+from app.triage.sharded import run_sharded_baseline_triage, run_sharded_certainty_triage
 
-def _safe_set_attr(name: str, values: Iterable[object]) -> None:
-    if hasattr(store, name):
-        setattr(store, name, list(values))
+router = APIRouter(prefix="/triage", tags=["triage"], route_class=ProfiledRoute)
 
 
-def _persist_baseline_cases(cases: list[Case]) -> None:
-    """Persist baseline triage output using Member 1 store helpers when available."""
-    setter = getattr(store, "set_baseline_cases", None)
-    if callable(setter):
-        setter(cases)
-        return
+async def _ingest(signals: Sequence[Signal]) -> IngestPlan:
+    """Store the new and changed signals of a batch; exact resends are dropped."""
+    with span("dedup_signals"):
+        plan = await seen_signals.plan(signals)
+    with span("set_signals"):
+        if plan.to_write:
+            await async_store.set_signals(plan.to_write)
+    await to_thread.run_sync(seen_signals.remember, plan)
+    return plan
 
-    # Compatibility fallback for scaffold store state.
-    _safe_set_attr("baseline_cases", cases)
-    _safe_set_attr("CASES", cases)
 
-
-def _persist_certainty_cases(cases: list[Case], tasks: list[VerificationTask]) -> None:
-    """Persist certainty triage output using Member 1 store helpers when available."""
-    setter = getattr(store, "set_certainty_cases", None)
-    if callable(setter):
-        setter(cases, tasks)
-        return
-
-    # Compatibility fallback for scaffold store state.
-    _safe_set_attr("certainty_cases", cases)
-    _safe_set_attr("VERIFICATION_TASKS", tasks)
+def _triage_order(cases: Sequence[Case]) -> List[Case]:
+    """Stored cases in the order the pipelines return them."""
+    return sorted(cases, key=lambda case: (-case.priority_score, case.charger_id))
 
 
 @router.post("/baseline", response_model=ApiResponse)
-def triage_baseline(payload: TriageRequest) -> ApiResponse:
-    signal_setter = getattr(store, "set_signals", None)
-    if callable(signal_setter):
-        signal_setter(payload.signals)
-    cases = run_baseline_triage(payload.signals)
-    _persist_baseline_cases(cases)
+async def triage_baseline(payload: TriageRequest) -> ApiResponse:
+    mark_handler_entry()
+    record_signal_count(len(payload.signals))
+    plan = await _ingest(payload.signals)
+    # One rules snapshot per request: a reload mid-request cannot mix versions.
+    rules = current_rules()
+    if plan.unchanged:
+        index = await case_index.get("baseline")
+        if seen_signals.can_skip_scoring("baseline", plan, index.token, rules.version):
+            return ApiResponse(ok=True, data=BaselineTriageResponseData(cases=_triage_order(index.cases)), error=None)
+    # Scoring is CPU-bound; keep it off the event loop.
+    cases = await run_cpu(run_sharded_baseline_triage, payload.signals, rules)
+    with span("persist_cases"):
+        await async_store.set_baseline_cases(cases)
+    with span("index_cases"):
+        index = await case_index.refresh("baseline")
+    seen_signals.mark_scored("baseline", plan, index.token, rules.version)
     return ApiResponse(ok=True, data=BaselineTriageResponseData(cases=cases), error=None)
 
 
 @router.post("/certainty", response_model=ApiResponse)
-def triage_certainty(payload: TriageRequest) -> ApiResponse:
-    signal_setter = getattr(store, "set_signals", None)
-    if callable(signal_setter):
-        signal_setter(payload.signals)
-    cases, verification_tasks = run_certainty_triage(payload.signals)
-    _persist_certainty_cases(cases, verification_tasks)
+async def triage_certainty(payload: TriageRequest) -> ApiResponse:
+    mark_handler_entry()
+    record_signal_count(len(payload.signals))
+    plan = await _ingest(payload.signals)
+    rules = current_rules()
+    if plan.unchanged:
+        index = await case_index.get("certainty")
+        if seen_signals.can_skip_scoring("certainty", plan, index.token, rules.version):
+            cases = _triage_order(index.cases)
+            tasks = await async_store.get_verification_tasks_map()
+            return ApiResponse(
+                ok=True,
+                data=CertaintyTriageResponseData(
+                    cases=cases,
+                    verification_tasks=sorted(tasks.values(), key=lambda task: task.case_id),
+                    incidents=incidents_from_cases(cases),
+                ),
+                error=None,
+            )
+    cases, verification_tasks = await run_cpu(
+        run_sharded_certainty_triage, payload.signals, CONFIDENCE_THRESHOLD, rules
+    )
+    with span("persist_cases"):
+        await async_store.set_certainty_cases(cases, verification_tasks)
+    with span("index_cases"):
+        index = await case_index.refresh("certainty")
+    seen_signals.mark_scored("certainty", plan, index.token, rules.version)
     return ApiResponse(
         ok=True,
-        data=CertaintyTriageResponseData(cases=cases, verification_tasks=verification_tasks),
+        data=CertaintyTriageResponseData(
+            cases=cases,
+            verification_tasks=verification_tasks,
+            incidents=incidents_from_cases(cases),
+        ),
         error=None,
     )
@@ -1,25 +1,20 @@
-"""Deterministic scoring helpers for baseline and certainty triage."""
+"""Deterministic scoring helpers for baseline and certainty triage.
+
+Weights, keywords, SLA bands and confidence adjustments come from the
+versioned rules in :mod:`app.scoring_rules`. Every helper takes the
+:class:`CompiledRules` of the run and defaults to the active rules.
+"""
 
 from __future__ import annotations
 
+import operator
 import re
 from collections import defaultdict
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from app.grid_stress import GridStressSnapshot
 from app.models import GridStressLevel, RootCauseTag, Signal
-
-STATUS_WEIGHTS = {
-    "down": 1.0,
-    "degraded": 0.65,
-    "unknown": 0.4,
-    "online": 0.0,
-}
-
-ROOT_CAUSE_KEYWORDS = {
-    "payment_terminal": ("payment", "card", "tap", "terminal", "reader"),
-    "connector": ("connector", "plug", "cable", "port", "bent"),
-    "network": ("network", "timeout", "offline", "latency", "ping", "modem", "router"),
-}
+from app.scoring_rules import CompiledRules, current_rules
 
 
 def group_signals_by_charger(signals: Sequence[Signal]) -> Dict[str, List[Signal]]:
@@ -34,19 +29,25 @@ def group_signals_by_charger(signals: Sequence[Signal]) -> Dict[str, List[Signal
     return dict(sorted(grouped.items(), key=lambda item: item[0]))
 
 
-def status_weight(status: str) -> float:
-    """Map status to deterministic severity weight."""
-    return STATUS_WEIGHTS.get(status, STATUS_WEIGHTS["unknown"])
+def compute_priority_score(
+    signals: Sequence[Signal], counts: Optional[Sequence[int]] = None, rules: Optional[CompiledRules] = None
+) -> int:
+    """Compute a 0-100 priority score from statuses, source diversity, and volume.
 
-
-def compute_priority_score(signals: Sequence[Signal]) -> int:
-    """Compute a 0-100 priority score from statuses, source diversity, and volume."""
+    ``counts`` gives how many reports each signal stands for after near-duplicate
+    collapsing. They weight the average status; volume counts distinct signals.
+    """
     if not signals:
         return 0
 
-    weights = [status_weight(signal.status) for signal in signals]
+    rules = rules or current_rules()
+    lookup, unknown = rules.status_weights.get, rules.unknown_weight
+    weights = [lookup(signal.status, unknown) for signal in signals]
     max_component = max(weights) * 70
-    average_component = (sum(weights) / len(weights)) * 20
+    if counts is None:
+        average_component = (sum(weights) / len(weights)) * 20
+    else:
+        average_component = (sum(map(operator.mul, weights, counts)) / sum(counts)) * 20
     source_diversity_bonus = min(len({signal.source for signal in signals}), 3) * 3
     volume_bonus = min(len(signals), 5) * 2
 
@@ -54,19 +55,8 @@ def compute_priority_score(signals: Sequence[Signal]) -> int:
     return max(0, min(100, score))
 
 
-def compute_sla_hours(priority_score: int) -> int:
-    """Map priority to response SLA hours."""
-    if priority_score >= 85:
-        return 2
-    if priority_score >= 70:
-        return 4
-    if priority_score >= 50:
-        return 8
-    return 24
-
-
 def compute_grid_stress_level(priority_score: int) -> GridStressLevel:
-    """Approximate local grid stress from case severity for MVP demo purposes."""
+    """Approximate local grid stress from case severity when no zone reading applies."""
     if priority_score >= 80:
         return "high"
     if priority_score >= 60:
@@ -74,16 +64,36 @@ def compute_grid_stress_level(priority_score: int) -> GridStressLevel:
     return "normal"
 
 
-def infer_root_cause_tag(signals: Sequence[Signal]) -> RootCauseTag:
-    """Infer root cause from signal text using keyword voting."""
-    text_blob = " ".join(signal.text.lower() for signal in signals)
+def resolve_grid_stress_level(stress: GridStressSnapshot, newest: Signal, priority_score: int) -> GridStressLevel:
+    """Stress of the charger's zone when its newest signal arrived, else the severity estimate."""
+    level = stress.level_at(newest.lon, newest.lat, newest.timestamp)
+    return level if level is not None else compute_grid_stress_level(priority_score)
+
+
+def infer_root_cause_tag(
+    signals: Sequence[Signal], counts: Optional[Sequence[int]] = None, rules: Optional[CompiledRules] = None
+) -> RootCauseTag:
+    """Infer root cause from signal text using keyword voting, each text voting ``counts`` times."""
+    rules = rules or current_rules()
+    votes: Dict[str, int] = {}
+    if counts is None:
+        for signal in signals:
+            votes[signal.text] = votes.get(signal.text, 0) + 1
+    else:
+        for signal, count in zip(signals, counts):
+            votes[signal.text] = votes.get(signal.text, 0) + count
+
+    totals = [0] * len(rules.tags)
+    for text, count in votes.items():
+        for index, hits in enumerate(rules.keyword_hits(text)):
+            if hits:
+                totals[index] += hits * count
+
     best_tag: RootCauseTag = "unknown"
     best_hits = 0
-
-    for tag, keywords in ROOT_CAUSE_KEYWORDS.items():
-        hits = sum(text_blob.count(keyword) for keyword in keywords)
+    for tag, hits in zip(rules.tags, totals):
         if hits > best_hits:
-            best_tag = tag  # type: ignore[assignment]
+            best_tag = tag
             best_hits = hits
 
     return best_tag
@@ -108,48 +118,49 @@ def _dedupe_preserve_order(values: Iterable[str]) -> List[str]:
     return output
 
 
-def compute_confidence(signals: Sequence[Signal]) -> Tuple[float, List[str]]:
+def compute_confidence(
+    signals: Sequence[Signal], rules: Optional[CompiledRules] = None
+) -> Tuple[float, List[str]]:
     """Compute confidence and explicit uncertainty reasons for certainty triage."""
     if not signals:
         return 0.0, ["no_evidence"]
 
-    confidence = 0.88
+    rules = rules or current_rules()
+    penalties, bonuses = rules.penalties, rules.bonuses
+    confidence = rules.confidence_base
     reasons: List[str] = []
     statuses = {signal.status for signal in signals}
 
     if len(signals) == 1:
-        confidence -= 0.24
         reasons.append("low_evidence_volume")
     elif len(signals) == 2:
-        confidence -= 0.10
         reasons.append("limited_evidence_volume")
 
     if len(statuses) > 1:
-        confidence -= 0.16
         reasons.append("cross_source_disagreement")
 
     if "online" in statuses and ({"down", "degraded"} & statuses):
-        confidence -= 0.24
         reasons.append("status_conflict_recent")
 
     if "unknown" in statuses and len(statuses) > 1:
-        confidence -= 0.08
         reasons.append("ambiguous_unknown_status")
 
-    if _is_flapping(signals):
-        confidence -= 0.20
+    if len(statuses) > 1 and _is_flapping(signals):
         reasons.append("status_flapping")
 
-    if all(signal.status == "down" for signal in signals):
-        confidence += 0.07
+    for reason in reasons:
+        confidence -= penalties[reason]
+
+    if statuses == {"down"}:
+        confidence += bonuses["all_down"]
 
     if len(signals) >= 3 and len(statuses) == 1:
-        confidence += 0.05
+        confidence += bonuses["consistent_volume"]
 
     if len({signal.source for signal in signals}) >= 2:
-        confidence += 0.03
+        confidence += bonuses["multi_source"]
 
-    confidence = max(0.05, min(0.99, confidence))
+    confidence = max(rules.confidence_min, min(rules.confidence_max, confidence))
     return round(confidence, 2), _dedupe_preserve_order(reasons)
 
 
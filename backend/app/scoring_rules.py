@@ -0,0 +1,263 @@
+"""Versioned scoring rules, compiled at load time and hot-reloaded from a file.
+
+Status weights, root-cause keywords, SLA bands and confidence adjustments live
+in ``SCORING_RULES_PATH`` (default: ``scoring_rules.json`` next to this
+module). :func:`compile_rules` validates a rules document and turns it into a
+:class:`CompiledRules`:
+
+- SLA bands become a table with one entry per priority score, so an SLA is an
+  index lookup.
+- Root-cause keywords become a per-text tally of hits per tag. The last
+  ``SCORING_KEYWORD_CACHE_SIZE`` texts are cached, because report texts
+  repeat heavily.
+
+A watcher thread polls the file every ``SCORING_RULES_RELOAD_S`` seconds (0
+turns it off). A changed file is compiled off to the side and swapped in with
+one reference assignment. Triage takes :func:`current_rules` once per run, so
+in-flight runs finish on the rules they started with. A file that fails to
+compile, or that reuses any version seen before with different content, is
+rejected and the active rules stay. Every case records the ``rules_version``
+that scored it, so a version always names one set of rules.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Event, Lock
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.models import RootCauseTag
+
+SCORING_RULES_PATH = Path(os.getenv("SCORING_RULES_PATH", str(Path(__file__).with_name("scoring_rules.json"))))
+SCORING_RULES_RELOAD_S = float(os.getenv("SCORING_RULES_RELOAD_S", "5"))
+
+logger = logging.getLogger(__name__)
+
+STATUSES = ("down", "degraded", "online", "unknown")
+ROOT_CAUSE_TAGS: Tuple[RootCauseTag, ...] = ("payment_terminal", "connector", "network")
+CONFIDENCE_PENALTIES = (
+    "low_evidence_volume",
+    "limited_evidence_volume",
+    "cross_source_disagreement",
+    "status_conflict_recent",
+    "ambiguous_unknown_status",
+    "status_flapping",
+)
+CONFIDENCE_BONUSES = ("all_down", "consistent_volume", "multi_source")
+MAX_PRIORITY = 100
+SCORING_KEYWORD_CACHE_SIZE = int(os.getenv("SCORING_KEYWORD_CACHE_SIZE", "4096"))
+
+
+def _require_keys(section: str, values: Mapping[str, Any], expected: Tuple[str, ...]) -> None:
+    missing = [key for key in expected if key not in values]
+    unknown = [key for key in values if key not in expected]
+    if missing or unknown:
+        raise ValueError(f"{section}: missing {missing}, unknown {unknown}")
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledRules:
+    version: str
+    status_weights: Mapping[str, float]
+    unknown_weight: float
+    tags: Tuple[RootCauseTag, ...]
+    keywords: Tuple[Tuple[str, ...], ...]
+    sla_by_priority: Tuple[int, ...]
+    confidence_base: float
+    confidence_min: float
+    confidence_max: float
+    penalties: Mapping[str, float]
+    bonuses: Mapping[str, float]
+    source: Mapping[str, Any]
+    _hits: Dict[str, Tuple[int, ...]] = field(default_factory=dict, repr=False)
+
+    def __reduce__(self):
+        # Process-pool workers get the rules document and compile their own copy.
+        return compile_rules, (self.source,)
+
+    def sla_hours(self, priority_score: int) -> int:
+        if 0 <= priority_score <= MAX_PRIORITY:
+            return self.sla_by_priority[priority_score]
+        return self.sla_by_priority[0 if priority_score < 0 else MAX_PRIORITY]
+
+    def keyword_hits(self, text: str) -> Tuple[int, ...]:
+        """Keyword hits per tag in ``text``, in :attr:`tags` order."""
+        hits = self._hits.get(text)
+        if hits is None:
+            lowered = text.lower()
+            hits = tuple(sum(lowered.count(keyword) for keyword in keywords) for keywords in self.keywords)
+            if len(self._hits) >= SCORING_KEYWORD_CACHE_SIZE:
+                self._hits.clear()
+            self._hits[text] = hits
+        return hits
+
+
+def source_digest(document: Mapping[str, Any]) -> str:
+    """Digest of a rules document's content, independent of key order and whitespace."""
+    return hashlib.sha256(json.dumps(document, sort_keys=True).encode()).hexdigest()
+
+
+def compile_rules(document: Mapping[str, Any]) -> CompiledRules:
+    """Validate a rules document and build its lookup tables; raises ``ValueError``."""
+    try:
+        version = document["version"]
+        if not isinstance(version, str) or not version.strip():
+            raise ValueError("version must be a non-empty string")
+
+        status_weights = {status: float(weight) for status, weight in document["status_weights"].items()}
+        _require_keys("status_weights", status_weights, STATUSES)
+
+        keywords = document["root_cause_keywords"]
+        unknown_tags = [tag for tag in keywords if tag not in ROOT_CAUSE_TAGS]
+        if unknown_tags:
+            raise ValueError(f"root_cause_keywords: unknown tags {unknown_tags}")
+        tags = tuple(keywords)
+        compiled_keywords = tuple(tuple(str(keyword).lower() for keyword in keywords[tag]) for tag in tags)
+
+        bands = sorted(
+            ((int(band["min_priority"]), int(band["hours"])) for band in document["sla_bands"]), reverse=True
+        )
+        if not bands or bands[-1][0] > 0:
+            raise ValueError("sla_bands must include a band with min_priority 0")
+        sla_by_priority: List[int] = []
+        for score in range(MAX_PRIORITY + 1):
+            sla_by_priority.append(next(hours for minimum, hours in bands if score >= minimum))
+
+        confidence = document["confidence"]
+        penalties = {reason: float(value) for reason, value in confidence["penalties"].items()}
+        _require_keys("confidence.penalties", penalties, CONFIDENCE_PENALTIES)
+        bonuses = {reason: float(value) for reason, value in confidence["bonuses"].items()}
+        _require_keys("confidence.bonuses", bonuses, CONFIDENCE_BONUSES)
+
+        return CompiledRules(
+            version=version,
+            status_weights=status_weights,
+            unknown_weight=status_weights["unknown"],
+            tags=tags,
+            keywords=compiled_keywords,
+            sla_by_priority=tuple(sla_by_priority),
+            confidence_base=float(confidence["base"]),
+            confidence_min=float(confidence["min"]),
+            confidence_max=float(confidence["max"]),
+            penalties=penalties,
+            bonuses=bonuses,
+            source=document,
+        )
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise ValueError(f"malformed scoring rules: {exc!r}") from exc
+
+
+class ScoringRulesFile:
+    """The active rules compiled from ``path``, reloaded when the file changes."""
+
+    def __init__(self, path: Path = SCORING_RULES_PATH, reload_s: float = SCORING_RULES_RELOAD_S) -> None:
+        self.path = path
+        self.reload_s = reload_s
+        self._rules: Optional[CompiledRules] = None
+        # Every version loaded (or rejected for content) -> digest of its document.
+        self._seen: Dict[str, str] = {}
+        self._lock = Lock()
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._loaded_at: Optional[datetime] = None
+        self._counts = {"reloads": 0, "failures": 0}
+        self._last_error: Optional[str] = None
+        self._stop = Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def current(self) -> CompiledRules:
+        rules = self._rules
+        if rules is None:
+            with self._lock:
+                if self._rules is None:
+                    # No rules to fall back on yet: a bad file fails loudly here.
+                    self._rules, self._file_state = self._compile()
+                    self._seen[self._rules.version] = source_digest(self._rules.source)
+                    self._loaded_at = datetime.now(timezone.utc)
+                rules = self._rules
+        return rules
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _compile(self) -> Tuple[CompiledRules, Tuple[int, int]]:
+        file_state = self._stat()
+        return compile_rules(json.loads(self.path.read_text())), file_state
+
+    def reload(self, force: bool = False) -> bool:
+        """Swap in the file's rules if it changed; False when unchanged or rejected."""
+        active = self.current()
+        with self._lock:
+            try:
+                if not force and self._stat() == self._file_state:
+                    return False
+                rules, file_state = self._compile()
+                digest = source_digest(rules.source)
+                seen = self._seen.get(rules.version)
+                if seen is not None and seen != digest:
+                    raise ValueError(f"version {rules.version!r} was already used for different rules")
+            except (OSError, ValueError) as exc:
+                self._counts["failures"] += 1
+                self._last_error = str(exc)
+                # Do not retry the same bad file every poll.
+                try:
+                    self._file_state = self._stat()
+                except OSError:
+                    pass
+                logger.warning("scoring rules reload rejected: %s", exc)
+                return False
+            self._file_state = file_state
+            self._seen[rules.version] = digest
+            if rules.source == active.source:
+                return False
+            self._rules = rules
+            self._loaded_at = datetime.now(timezone.utc)
+            self._counts["reloads"] += 1
+            self._last_error = None
+        logger.info("scoring rules %s loaded from %s", rules.version, self.path)
+        return True
+
+    def start(self) -> None:
+        """Load the rules now, then poll the file every ``reload_s`` on a daemon thread."""
+        self.current()
+        if self.reload_s <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="scoring-rules-reload", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.reload_s):
+            self.reload()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        rules = self._rules
+        with self._lock:
+            return {
+                "version": rules.version if rules is not None else None,
+                "path": str(self.path),
+                "loaded_at": self._loaded_at.isoformat() if self._loaded_at is not None else None,
+                "reload_interval_s": self.reload_s,
+                **self._counts,
+                "last_error": self._last_error,
+            }
+
+
+scoring_rules = ScoringRulesFile()
+
+
+def current_rules() -> CompiledRules:
+    return scoring_rules.current()
@@ -0,0 +1,362 @@
+"""Resumable bulk backfill of historical signals.
+
+Streams CSV (with a header row) or NDJSON files in fixed-size chunks. Parser
+workers validate each chunk against the signal schema in parallel, and the
+main process upserts the chunks in file order, one transaction per chunk.
+After each commit a checkpoint file records how many records of each file are
+done, so a rerun after an interruption resumes at the next chunk. Rows that
+fail validation are skipped, counted and optionally written to a rejects file.
+
+    python -m app.seed_data.backfill history/311_2024.csv history/telemetry_*.ndjson --workers 8 --triage
+
+Triage normally runs per request; here it runs once at the end (``--triage``)
+over every stored signal.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from app import store
+from app.db.models import SignalRecord
+from app.db.session import session_scope
+from app.db.sharding import partition, shard_for_charger
+from app.models import Signal
+from app.seed_data.bulk_load import _signal_values
+from app.triage.sharded import run_sharded_baseline_triage, run_sharded_certainty_triage
+
+CHUNK_SIZE = 10_000
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT = Path("backfill_checkpoint.json")
+
+# (record number within the file, raw record) pairs handed to parser workers.
+RawChunk = List[Tuple[int, Any]]
+
+
+@dataclass
+class ParsedChunk:
+    rows: List[Dict[str, Any]]
+    rejects: List[Dict[str, Any]]
+
+
+def parse_chunk(file_format: str, header: Optional[List[str]], records: RawChunk) -> ParsedChunk:
+    """Validate raw CSV rows or NDJSON lines into signal column values."""
+    rows: List[Dict[str, Any]] = []
+    rejects: List[Dict[str, Any]] = []
+    for record_no, raw in records:
+        try:
+            if file_format == "csv":
+                assert header is not None
+                if len(raw) != len(header):
+                    raise ValueError(f"expected {len(header)} fields, got {len(raw)}")
+                payload = dict(zip(header, raw))
+            else:
+                payload = json.loads(raw)
+            rows.append(_signal_values(Signal.model_validate(payload)))
+        except ValidationError as exc:
+            rejects.append({"record": record_no, "error": _short_error(exc)})
+        except ValueError as exc:
+            rejects.append({"record": record_no, "error": str(exc)})
+    return ParsedChunk(rows=rows, rejects=rejects)
+
+
+def _short_error(exc: ValidationError) -> str:
+    first = exc.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" + (f" (+{exc.error_count() - 1} more)" if exc.error_count() > 1 else "")
+
+
+def _file_format(path: Path) -> str:
+    if path.suffix == ".csv":
+        return "csv"
+    if path.suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    raise ValueError(f"unsupported backfill file {path}; expected .csv, .ndjson or .jsonl")
+
+
+def _iter_records(handle: TextIO, file_format: str) -> Iterator[Any]:
+    if file_format == "csv":
+        yield from csv.reader(handle)
+        return
+    for line in handle:
+        yield line
+
+
+def _chunks(records: Iterator[Any], chunk_size: int, skip: int) -> Iterator[RawChunk]:
+    chunk: RawChunk = []
+    for record_no, raw in enumerate(records, start=1):
+        if record_no <= skip:
+            continue
+        if isinstance(raw, str) and not raw.strip():
+            continue
+        chunk.append((record_no, raw))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def upsert_signal_rows(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """Insert or overwrite signals by id with a single set-based statement."""
+    if not rows:
+        return
+    table = SignalRecord.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        statement = dialect_insert(table)
+        updated = {name: statement.excluded[name] for name in rows[0] if name != "id"}
+        session.execute(statement.on_conflict_do_update(index_elements=["id"], set_=updated), rows)
+        return
+    session.execute(delete(table).where(table.c.id.in_([row["id"] for row in rows])))
+    session.execute(insert(table), rows)
+
+
+@dataclass
+class FileProgress:
+    size: int
+    mtime_ns: int
+    records_done: int = 0
+    rows_written: int = 0
+    rejected: int = 0
+    done: bool = False
+
+
+@dataclass
+class Checkpoint:
+    path: Path
+    files: Dict[str, FileProgress] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint":
+        if not path.exists():
+            return cls(path)
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"checkpoint {path} has unsupported version {payload.get('version')}")
+        return cls(path, {name: FileProgress(**progress) for name, progress in payload["files"].items()})
+
+    def progress_for(self, source: Path) -> FileProgress:
+        stat = source.stat()
+        key = str(source.resolve())
+        progress = self.files.get(key)
+        if progress is not None and (progress.size, progress.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            raise ValueError(f"{source} changed since it was checkpointed; rerun with --restart")
+        if progress is None:
+            progress = self.files[key] = FileProgress(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        return progress
+
+    def save(self) -> None:
+        payload = {"version": CHECKPOINT_VERSION, "files": {name: vars(item) for name, item in self.files.items()}}
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        temporary.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+class _InlineExecutor:
+    """Run parses on the calling thread when no worker processes are wanted."""
+
+    def submit(self, fn: Callable[..., ParsedChunk], *args: Any) -> Future:
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@dataclass
+class BackfillSummary:
+    files: int = 0
+    records_read: int = 0
+    rows_written: int = 0
+    rejected: int = 0
+    resumed_records: int = 0
+    elapsed_s: float = 0.0
+    triage: Optional[Dict[str, int]] = None
+    triage_s: float = 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.records_read / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+def _backfill_file(
+    source: Path,
+    progress: FileProgress,
+    checkpoint: Checkpoint,
+    executor: Any,
+    chunk_size: int,
+    in_flight: int,
+    summary: BackfillSummary,
+    rejects_handle: Optional[TextIO],
+    report: Callable[[BackfillSummary], None],
+) -> None:
+    file_format = _file_format(source)
+    summary.resumed_records += progress.records_done
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        records = _iter_records(handle, file_format)
+        header: Optional[List[str]] = None
+        if file_format == "csv":
+            header = [name.strip() for name in next(records, [])]
+        pending: Deque[Tuple[int, Future]] = deque()
+
+        def commit_oldest() -> None:
+            last_record, future = pending.popleft()
+            parsed: ParsedChunk = future.result()
+            # Later duplicates in a chunk win, as they would with row-by-row upserts.
+            rows = list({row["id"]: row for row in parsed.rows}.values())
+            # Upserts are idempotent, so a crash between shards is repaired on resume.
+            for shard, shard_rows in partition(rows, lambda row: shard_for_charger(row["charger_id"])).items():
+                with session_scope(shard) as session:
+                    upsert_signal_rows(session, shard_rows)
+            for reject in parsed.rejects:
+                if rejects_handle is not None:
+                    rejects_handle.write(json.dumps({"file": str(source), **reject}) + "\n")
+            progress.records_done = last_record
+            progress.rows_written += len(rows)
+            progress.rejected += len(parsed.rejects)
+            checkpoint.save()
+            summary.records_read += len(parsed.rows) + len(parsed.rejects)
+            summary.rows_written += len(rows)
+            summary.rejected += len(parsed.rejects)
+            report(summary)
+
+        for chunk in _chunks(records, chunk_size, progress.records_done):
+            pending.append((chunk[-1][0], executor.submit(parse_chunk, file_format, header, chunk)))
+            if len(pending) >= in_flight:
+                commit_oldest()
+        while pending:
+            commit_oldest()
+
+    progress.done = True
+    checkpoint.save()
+
+
+def run_triage() -> Dict[str, int]:
+    """Triage every stored signal once and replace both case sets."""
+    signals = store.get_signals()
+    baseline_cases = run_sharded_baseline_triage(signals)
+    certainty_cases, verification_tasks = run_sharded_certainty_triage(signals)
+    store.set_baseline_cases(baseline_cases)
+    store.set_certainty_cases(certainty_cases, verification_tasks)
+    return {
+        "signals": len(signals),
+        "baseline_cases": len(baseline_cases),
+        "certainty_cases": len(certainty_cases),
+        "verification_tasks": len(verification_tasks),
+    }
+
+
+def backfill(
+    sources: Sequence[Path],
+    checkpoint_path: Path = DEFAULT_CHECKPOINT,
+    *,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 0,
+    restart: bool = False,
+    triage: bool = False,
+    rejects_path: Optional[Path] = None,
+    report: Callable[[BackfillSummary], None] = lambda summary: None,
+) -> BackfillSummary:
+    """Backfill ``sources`` in order, resuming from ``checkpoint_path`` unless ``restart``.
+
+    ``workers`` > 0 parses chunks in that many processes; 0 parses inline.
+    """
+    checkpoint = Checkpoint(checkpoint_path) if restart else Checkpoint.load(checkpoint_path)
+    summary = BackfillSummary()
+    started = time.perf_counter()
+    executor: Any = ProcessPoolExecutor(max_workers=workers) if workers > 0 else _InlineExecutor()
+    rejects_handle = rejects_path.open("a", encoding="utf-8") if rejects_path is not None else None
+    try:
+        for source in sources:
+            progress = checkpoint.progress_for(source)
+            summary.files += 1
+            if progress.done:
+                continue
+            _backfill_file(
+                source,
+                progress,
+                checkpoint,
+                executor,
+                chunk_size,
+                max(2, workers * 2),
+                summary,
+                rejects_handle,
+                report,
+            )
+    finally:
+        summary.elapsed_s = time.perf_counter() - started
+        if isinstance(executor, Executor):
+            executor.shutdown(cancel_futures=True)
+        if rejects_handle is not None:
+            rejects_handle.close()
+
+    if triage:
+        triage_started = time.perf_counter()
+        summary.triage = run_triage()
+        summary.triage_s = time.perf_counter() - triage_started
+    return summary
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Resumable bulk backfill of historical signals.")
+    parser.add_argument("sources", nargs="+", type=Path, help=".csv (with header) or .ndjson/.jsonl files")
+    parser.add_argument("--checkpoint", type=Path, default=DEFAULT_CHECKPOINT)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="parser processes (0 = inline)")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and start over")
+    parser.add_argument("--triage", action="store_true", help="triage all stored signals once at the end")
+    parser.add_argument("--rejects", type=Path, help="append rows that fail validation to this .ndjson file")
+    args = parser.parse_args(argv)
+
+    def report(summary: BackfillSummary) -> None:
+        elapsed = time.perf_counter() - started
+        rate = summary.records_read / elapsed if elapsed > 0 else 0.0
+        print(
+            f"\r{summary.records_read:,} records, {summary.rows_written:,} written, "
+            f"{summary.rejected:,} rejected, {rate:,.0f} rows/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    started = time.perf_counter()
+    summary = backfill(
+        args.sources,
+        args.checkpoint,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        restart=args.restart,
+        triage=args.triage,
+        rejects_path=args.rejects,
+        report=report,
+    )
+    print(file=sys.stderr)
+    print(f"Backfill finished in {summary.elapsed_s:.1f}s ({summary.rows_per_s:,.0f} rows/s):")
+    print(f"- files: {summary.files}")
+    print(f"- records read: {summary.records_read} (resumed past {summary.resumed_records})")
+    print(f"- rows written: {summary.rows_written}")
+    print(f"- rejected: {summary.rejected}")
+    if summary.triage is not None:
+        print(f"- triage took {summary.triage_s:.1f}s")
+        for key, value in summary.triage.items():
+            print(f"- triage {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Bulk loader for seed files and generated staging datasets.
+
+Streams signal rows from ``.json`` arrays or ``.ndjson`` files (or straight
+from the workload generator), replaces all persisted state in one transaction
+and writes signals, cases, verification tasks and outcomes with batched
+set-based inserts. Verification outcomes are applied in memory with the same
+rules as :func:`app.store.complete_verification`, so the result matches a row
+by row replay without a session and count query per outcome.
+
+    python -m app.seed_data.bulk_load --signals staging_signals.ndjson --outcomes outcomes.json
+    python -m app.seed_data.bulk_load --generate 2000000 --chargers 50000 --skip-triage
+
+Triage needs every signal in memory; pass ``--skip-triage`` to load only the
+signals of very large datasets.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from app.db.models import (
+    DEMO_SEED_MARKER_KEY,
+    BootstrapMarkerRecord,
+    CaseRecord,
+    SignalRecord,
+    VerificationOutcomeRecord,
+    VerificationTaskRecord,
+    WorkOrderRecord,
+)
+from app.db.session import session_scope
+from app.db.sharding import require_unsharded
+from app.models import Signal, VerificationTask
+from app.store import _case_values, _ensure_tz, notify_signals_cleared
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+
+BATCH_SIZE = 5_000
+VERIFICATION_RESULTS = {"confirmed_issue", "false_alarm", "needs_more_data"}
+
+_JSON_SEPARATORS = " \t\r\n,"
+
+
+def _iter_json_array(handle: TextIO, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array without reading the whole file."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    opened = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = handle.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return not eof
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _JSON_SEPARATORS:
+            pos += 1
+        if pos == len(buffer):
+            if not fill():
+                raise ValueError("unexpected end of JSON array")
+            continue
+        if not opened:
+            if buffer[pos] != "[":
+                raise ValueError("expected a top-level JSON array")
+            opened = True
+            pos += 1
+            continue
+        if buffer[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if not fill():
+                raise
+            continue
+        # A value ending exactly at the buffer edge may be truncated.
+        if end == len(buffer) and fill():
+            continue
+        yield item
+        pos = end
+
+
+def iter_json_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream rows from a ``.ndjson`` file or a ``.json`` array file."""
+    with path.open("r", encoding="utf-8") as handle:
+        if path.suffix == ".ndjson":
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        yield from _iter_json_array(handle)
+
+
+def _batches(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _insert_rows(session: Session, model: Any, rows: Iterable[Dict[str, Any]], batch_size: int) -> int:
+    count = 0
+    statement = insert(model.__table__)
+    for batch in _batches(rows, batch_size):
+        session.execute(statement, batch)
+        count += len(batch)
+    return count
+
+
+def _clear_state(session: Session) -> None:
+    """Delete all operational rows (children first) and the demo seed marker."""
+    for model in (VerificationOutcomeRecord, VerificationTaskRecord, WorkOrderRecord, CaseRecord, SignalRecord):
+        session.execute(delete(model))
+    session.execute(delete(BootstrapMarkerRecord).where(BootstrapMarkerRecord.key == DEMO_SEED_MARKER_KEY))
+
+
+def _signal_values(signal: Signal) -> Dict[str, Any]:
+    return {
+        "id": signal.id,
+        "source": signal.source,
+        "timestamp": _ensure_tz(signal.timestamp),
+        "charger_id": signal.charger_id,
+        "lat": signal.lat,
+        "lon": signal.lon,
+        "status": signal.status,
+        "text": signal.text,
+    }
+
+
+def _task_values(task: VerificationTask) -> Dict[str, Any]:
+    return {
+        "id": task.id,
+        "case_id": task.case_id,
+        "question": task.question,
+        "owner": task.owner,
+        "status": task.status,
+        "result": task.result,
+    }
+
+
+def bulk_load(
+    signal_rows: Iterable[Mapping[str, Any]],
+    outcome_rows: Iterable[Mapping[str, Any]] = (),
+    *,
+    triage: bool = True,
+    batch_size: int = BATCH_SIZE,
+) -> Dict[str, int]:
+    """Replace all persisted state with ``signal_rows`` and their triage output.
+
+    Later rows reusing a signal id are skipped and counted as ``duplicate_signals``.
+    """
+    require_unsharded("bulk_load")
+    summary = {
+        "signals": 0,
+        "duplicate_signals": 0,
+        "baseline_cases": 0,
+        "certainty_cases": 0,
+        "verification_tasks": 0,
+        "verification_outcomes": 0,
+    }
+    signals: List[Signal] = []
+    seen_ids: set[str] = set()
+
+    def accepted_signals() -> Iterator[Dict[str, Any]]:
+        for row in signal_rows:
+            signal = Signal.model_validate(row)
+            if signal.id in seen_ids:
+                summary["duplicate_signals"] += 1
+                continue
+            seen_ids.add(signal.id)
+            if triage:
+                signals.append(signal)
+            yield _signal_values(signal)
+
+    with session_scope() as session:
+        _clear_state(session)
+
+        summary["signals"] = _insert_rows(session, SignalRecord, accepted_signals(), batch_size)
+
+        charger_by_case: Dict[str, str] = {}
+        tasks: Dict[str, Dict[str, Any]] = {}
+        if triage:
+            baseline_cases = run_baseline_triage(signals)
+            certainty_cases, verification_tasks = run_certainty_triage(signals)
+            summary["baseline_cases"] = _insert_rows(
+                session, CaseRecord, (_case_values(case, "baseline") for case in baseline_cases), batch_size
+            )
+            summary["certainty_cases"] = _insert_rows(
+                session, CaseRecord, (_case_values(case, "certainty") for case in certainty_cases), batch_size
+            )
+            # Certainty cases win, matching the lookup order of complete_verification.
+            charger_by_case = {case.id: case.charger_id for case in baseline_cases}
+            charger_by_case.update((case.id, case.charger_id) for case in certainty_cases)
+            tasks = {task.case_id: _task_values(task) for task in verification_tasks}
+            summary["verification_tasks"] = len(verification_tasks)
+            signals.clear()
+
+        outcomes: List[Dict[str, Any]] = []
+        for row in outcome_rows:
+            result = row.get("result")
+            if result not in VERIFICATION_RESULTS:
+                continue
+            case_id = row["case_id"]
+            task = tasks.get(case_id)
+            if task is None:
+                task = tasks[case_id] = {
+                    "id": f"ver_{len(tasks) + 1:03d}",
+                    "case_id": case_id,
+                    "question": f"Is charger {charger_by_case.get(case_id, case_id)} physically offline?",
+                    "owner": "FieldOps",
+                }
+            task["status"] = "done"
+            task["result"] = result
+            outcomes.append(
+                {
+                    "case_id": case_id,
+                    "result": result,
+                    "notes": row.get("notes"),
+                    "timestamp": datetime.now(timezone.utc),
+                }
+            )
+
+        _insert_rows(session, VerificationTaskRecord, tasks.values(), batch_size)
+        summary["verification_outcomes"] = _insert_rows(session, VerificationOutcomeRecord, outcomes, batch_size)
+
+    notify_signals_cleared()
+    return summary
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Replace persisted state with a seed file or generated dataset.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--signals", type=Path, help=".json array or .ndjson signal file")
+    source.add_argument("--generate", type=int, metavar="N", help="stream N generated signals instead of a file")
+    parser.add_argument("--chargers", type=int, help="chargers for --generate (default N/20)")
+    parser.add_argument("--seed", type=int, default=42, help="seed for --generate")
+    parser.add_argument("--outcomes", type=Path, help=".json array or .ndjson verification outcome file")
+    parser.add_argument("--skip-triage", action="store_true", help="load signals only")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    if args.generate is not None:
+        from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+
+        chargers = args.chargers or max(1, args.generate // 20)
+        signal_rows: Iterable[Dict[str, Any]] = generate_signal_rows(
+            WorkloadConfig(signals=args.generate, chargers=chargers, seed=args.seed)
+        )
+    else:
+        signal_rows = iter_json_rows(args.signals)
+
+    started = time.perf_counter()
+    summary = bulk_load(
+        signal_rows,
+        iter_json_rows(args.outcomes) if args.outcomes else (),
+        triage=not args.skip_triage,
+        batch_size=args.batch_size,
+    )
+    elapsed = time.perf_counter() - started
+    print(f"Bulk load finished in {elapsed:.1f}s ({summary['signals'] / elapsed:,.0f} signals/s):")
+    for key, value in summary.items():
+        print(f"- {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Deterministic synthetic signal workloads for scale testing.
+
+Produces time-ordered signal streams of any size from a seed: chargers are
+clustered around Austin hot spots, each with a fault profile (stable, flapping
+or conflicting reports) and a root cause that drives the report text. The same
+config always yields the same stream, so benchmark runs are comparable.
+
+Write a dataset to disk:
+
+    python -m app.seed_data.generate_signals --signals 100000 --chargers 5000 --out signals_100k.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+from app.models import Signal
+
+# (name, lat, lon, weight) of the metro clusters chargers are placed around.
+AUSTIN_CLUSTERS: Tuple[Tuple[str, float, float, float], ...] = (
+    ("downtown", 30.2672, -97.7431, 0.35),
+    ("domain", 30.4021, -97.7253, 0.20),
+    ("east", 30.2620, -97.7120, 0.15),
+    ("south_congress", 30.2450, -97.7500, 0.15),
+    ("airport", 30.1975, -97.6664, 0.10),
+    ("mueller", 30.2990, -97.7060, 0.05),
+)
+
+ROOT_CAUSES = ("payment_terminal", "connector", "network", "unknown")
+
+_REPORT_TEXT: Dict[str, Tuple[str, ...]] = {
+    "payment_terminal": (
+        "payment terminal issue",
+        "payment reader rejects all cards",
+        "tap to pay not working",
+        "card reader frozen",
+    ),
+    "connector": (
+        "connector not working",
+        "connector bent and will not latch",
+        "plug intermittently disconnects",
+        "cable damaged at handle",
+    ),
+    "network": (
+        "station completely offline",
+        "app says charger offline",
+        "network timeout while authorizing session",
+        "charger stuck connecting",
+    ),
+    "unknown": (
+        "charger dead",
+        "charger screen black, no response",
+        "not charging",
+        "won't start session",
+    ),
+}
+_TELEMETRY_TEXT: Dict[str, Tuple[str, ...]] = {
+    "payment_terminal": ("payment terminal fault code", "card reader timeout"),
+    "connector": ("connector lock fault", "session start failures"),
+    "network": ("network timeout", "modem heartbeat missed", "router ping loss"),
+    "unknown": ("telemetry stale for 15 minutes", "session start failures"),
+}
+_ONLINE_TEXT = ("heartbeat online", "came back online", "charging fine now", "working again")
+_UNKNOWN_TEXT = ("not sure if it works", "telemetry stale for 15 minutes", "status unclear")
+
+
+@dataclass(frozen=True)
+class WorkloadConfig:
+    signals: int = 1_000
+    chargers: int = 100
+    seed: int = 42
+    region: str = "AUS"
+    source_mix: Mapping[str, float] = field(
+        default_factory=lambda: {"charger_api": 0.55, "311": 0.20, "ugc": 0.25}
+    )
+    # Dominant status of a charger's fault profile.
+    status_mix: Mapping[str, float] = field(
+        default_factory=lambda: {"down": 0.40, "degraded": 0.25, "online": 0.25, "unknown": 0.10}
+    )
+    flapping_rate: float = 0.08
+    conflict_rate: float = 0.12
+    start: datetime = datetime(2026, 2, 20, 12, 0, tzinfo=timezone.utc)
+    duration_hours: float = 24.0
+    cluster_spread_deg: float = 0.02
+    # Higher values concentrate signals on fewer chargers.
+    hotspot_skew: float = 1.5
+
+
+@dataclass
+class _ChargerProfile:
+    charger_id: str
+    lat: float
+    lon: float
+    status: str
+    root_cause: str
+    behavior: str
+    reports: int = 0
+
+
+def _weighted_picker(rng: random.Random, mix: Mapping[str, float]) -> Callable[[], str]:
+    population: List[str] = list(mix.keys())
+    cum_weights = list(accumulate(mix.values()))
+
+    def pick() -> str:
+        return rng.choices(population, cum_weights=cum_weights, k=1)[0]
+
+    return pick
+
+
+def _build_chargers(config: WorkloadConfig, rng: random.Random) -> List[_ChargerProfile]:
+    width = max(4, len(str(max(config.chargers - 1, 0))))
+    cluster_weights = list(accumulate(cluster[3] for cluster in AUSTIN_CLUSTERS))
+    pick_status = _weighted_picker(rng, config.status_mix)
+    chargers: List[_ChargerProfile] = []
+    for index in range(config.chargers):
+        _, lat, lon, _ = rng.choices(AUSTIN_CLUSTERS, cum_weights=cluster_weights, k=1)[0]
+        roll = rng.random()
+        if roll < config.flapping_rate:
+            behavior = "flapping"
+        elif roll < config.flapping_rate + config.conflict_rate:
+            behavior = "conflict"
+        else:
+            behavior = "stable"
+        chargers.append(
+            _ChargerProfile(
+                charger_id=f"{config.region}_{index:0{width}d}",
+                lat=round(rng.gauss(lat, config.cluster_spread_deg), 5),
+                lon=round(rng.gauss(lon, config.cluster_spread_deg), 5),
+                status=pick_status(),
+                root_cause=rng.choice(ROOT_CAUSES),
+                behavior=behavior,
+            )
+        )
+    return chargers
+
+
+def _next_status(charger: _ChargerProfile, rng: random.Random) -> str:
+    if charger.behavior == "flapping":
+        return charger.status if charger.reports % 2 == 0 else "online"
+    if charger.behavior == "conflict" and rng.random() < 0.35:
+        return "online" if charger.status != "online" else "down"
+    if rng.random() < 0.05:
+        return "unknown"
+    return charger.status
+
+
+def _report_text(source: str, status: str, root_cause: str, rng: random.Random) -> str:
+    if status == "online":
+        return rng.choice(_ONLINE_TEXT)
+    if status == "unknown":
+        return rng.choice(_UNKNOWN_TEXT)
+    if source == "charger_api":
+        return rng.choice(_TELEMETRY_TEXT[root_cause])
+    return rng.choice(_REPORT_TEXT[root_cause])
+
+
+def generate_signal_rows(config: WorkloadConfig) -> Iterator[Dict[str, Any]]:
+    """Yield JSON-ready signal rows in timestamp order."""
+    if config.signals <= 0 or config.chargers <= 0:
+        return
+
+    rng = random.Random(config.seed)
+    chargers = _build_chargers(config, rng)
+    pick_source = _weighted_picker(rng, config.source_mix)
+    width = max(6, len(str(config.signals - 1)))
+    step_s = config.duration_hours * 3600.0 / config.signals
+
+    for index in range(config.signals):
+        charger = chargers[int(len(chargers) * (rng.random() ** config.hotspot_skew))]
+        source = pick_source()
+        status = _next_status(charger, rng)
+        charger.reports += 1
+        timestamp = config.start + timedelta(seconds=index * step_s + rng.random() * step_s)
+        yield {
+            "id": f"sig_gen_{index:0{width}d}",
+            "source": source,
+            "timestamp": timestamp.isoformat().replace("+00:00", "Z"),
+            "charger_id": charger.charger_id,
+            "lat": charger.lat,
+            "lon": charger.lon,
+            "status": status,
+            "text": _report_text(source, status, charger.root_cause, rng),
+        }
+
+
+def generate_signals(config: WorkloadConfig) -> Iterator[Signal]:
+    """Yield validated :class:`Signal` models for ``config``."""
+    for row in generate_signal_rows(config):
+        yield Signal.model_validate(row)
+
+
+def write_signal_rows(rows: Iterator[Dict[str, Any]], path: Path) -> int:
+    """Write rows as a JSON array (``.json``) or one object per line (``.ndjson``)."""
+    count = 0
+    with path.open("w", encoding="utf-8") as handle:
+        if path.suffix == ".ndjson":
+            for row in rows:
+                handle.write(json.dumps(row))
+                handle.write("\n")
+                count += 1
+            return count
+
+        handle.write("[\n")
+        for row in rows:
+            if count:
+                handle.write(",\n")
+            handle.write(json.dumps(row))
+            count += 1
+        handle.write("\n]\n")
+    return count
+
+
+def _parse_mix(raw: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in raw.split(","):
+        key, _, weight = part.partition("=")
+        mix[key.strip()] = float(weight)
+    return mix
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic signal workload.")
+    parser.add_argument("--signals", type=int, default=1_000)
+    parser.add_argument("--chargers", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--region", default="AUS")
+    parser.add_argument("--flapping-rate", type=float, default=WorkloadConfig.flapping_rate)
+    parser.add_argument("--conflict-rate", type=float, default=WorkloadConfig.conflict_rate)
+    parser.add_argument("--source-mix", help="e.g. charger_api=0.5,311=0.2,ugc=0.3")
+    parser.add_argument("--status-mix", help="e.g. down=0.4,degraded=0.3,online=0.2,unknown=0.1")
+    parser.add_argument("--out", type=Path, required=True, help="output .json or .ndjson path")
+    args = parser.parse_args(argv)
+
+    overrides: Dict[str, Any] = {}
+    if args.source_mix:
+        overrides["source_mix"] = _parse_mix(args.source_mix)
+    if args.status_mix:
+        overrides["status_mix"] = _parse_mix(args.status_mix)
+    config = WorkloadConfig(
+        signals=args.signals,
+        chargers=args.chargers,
+        seed=args.seed,
+        region=args.region,
+        flapping_rate=args.flapping_rate,
+        conflict_rate=args.conflict_rate,
+        **overrides,
+    )
+    count = write_signal_rows(generate_signal_rows(config), args.out)
+    print(f"Wrote {count} signals for {config.chargers} chargers to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""Binary columnar snapshots of the full operational state.
+
+A snapshot holds every row of the ORM tables in ``app/db/models.py`` (signals,
+both case sets, work orders, verification tasks and outcomes), one section per
+column:
+
+- integers and timestamps (UTC microseconds) as ``int64`` arrays, floats as
+  ``float64`` and booleans as ``int8``;
+- strings and JSON values as an ``int64`` offset array plus a UTF-8 blob;
+- nullable columns add an ``int8`` null mask.
+
+Layout: a 32-byte header (magic, format version, manifest offset and length),
+8-byte aligned column sections, then a JSON manifest describing tables, row
+counts and section offsets. Numeric sections are read as zero-copy
+``memoryview`` casts over an ``mmap`` of the file, so loading needs no parsing
+beyond the manifest.
+
+    python -m app.seed_data.snapshot export state.evsnap
+    python -m app.seed_data.snapshot import state.evsnap
+    python -m app.seed_data.snapshot info state.evsnap
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, JSON, Table, func, select, text
+
+from app.db.bootstrap import schema_fingerprint
+from app.db.models import CaseRecord, SignalRecord, VerificationOutcomeRecord, VerificationTaskRecord, WorkOrderRecord
+from app.db.session import session_scope
+from app.db.sharding import require_unsharded
+from app.seed_data.bulk_load import BATCH_SIZE, _clear_state, _insert_rows
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"EVGSNAP\0"
+FORMAT_VERSION = 1
+ALIGNMENT = 8
+_HEADER = struct.Struct("<8sIIQQ")
+
+# Insert order; parents before children.
+SNAPSHOT_MODELS = (SignalRecord, CaseRecord, WorkOrderRecord, VerificationTaskRecord, VerificationOutcomeRecord)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_TYPECODES = {"i64": "q", "ts": "q", "f64": "d", "bool": "b"}
+
+
+def _column_kind(column: Any) -> str:
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return "bool"
+    if isinstance(column_type, Integer):
+        return "i64"
+    if isinstance(column_type, Float):
+        return "f64"
+    if isinstance(column_type, DateTime):
+        return "ts"
+    if isinstance(column_type, JSON):
+        return "json"
+    return "str"
+
+
+class _ColumnBuffer:
+    """Accumulates one column's values in their on-disk representation."""
+
+    def __init__(self, kind: str, nullable: bool) -> None:
+        self.kind = kind
+        self.nulls: Optional[array] = array("b") if nullable else None
+        if kind in ("str", "json"):
+            self.offsets = array("q", [0])
+            self.data = bytearray()
+        else:
+            self.values = array(_TYPECODES[kind])
+
+    def append(self, value: Any) -> None:
+        if self.nulls is not None:
+            self.nulls.append(1 if value is None else 0)
+        kind = self.kind
+        if kind in ("str", "json"):
+            if value is not None:
+                encoded = json.dumps(value, separators=(",", ":")) if kind == "json" else value
+                self.data += encoded.encode("utf-8")
+            self.offsets.append(len(self.data))
+        elif value is None:
+            self.values.append(0)
+        elif kind == "ts":
+            stamp = value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+            self.values.append((stamp - _EPOCH) // _MICROSECOND)
+        else:
+            self.values.append(value)
+
+    def sections(self) -> Dict[str, Any]:
+        sections: Dict[str, Any] = (
+            {"offsets": self.offsets, "data": self.data} if self.kind in ("str", "json") else {"values": self.values}
+        )
+        if self.nulls is not None:
+            sections["nulls"] = self.nulls
+        return sections
+
+
+def _write_aligned(handle: BinaryIO, data: Any) -> List[int]:
+    handle.write(b"\0" * (-handle.tell() % ALIGNMENT))
+    offset = handle.tell()
+    view = memoryview(data)
+    handle.write(view)
+    return [offset, view.nbytes]
+
+
+def _export_table(connection: Any, table: Table, handle: BinaryIO) -> Dict[str, Any]:
+    buffers = {column.name: _ColumnBuffer(_column_kind(column), bool(column.nullable)) for column in table.columns}
+    names = list(buffers)
+    appenders = [buffers[name].append for name in names]
+    rows = 0
+    result = connection.execution_options(stream_results=True, yield_per=10_000).execute(
+        select(table).order_by(*table.primary_key.columns)
+    )
+    for row in result:
+        for append, value in zip(appenders, row):
+            append(value)
+        rows += 1
+
+    columns: Dict[str, Any] = {}
+    for name in names:
+        buffer = buffers.pop(name)
+        columns[name] = {
+            "kind": buffer.kind,
+            "sections": {key: _write_aligned(handle, data) for key, data in buffer.sections().items()},
+        }
+    return {"rows": rows, "columns": columns}
+
+
+def export_snapshot(path: Path) -> Dict[str, int]:
+    """Write every operational table to ``path``; returns row counts per table."""
+    require_unsharded("export_snapshot")
+    temporary = path.with_name(path.name + ".tmp")
+    manifest: Dict[str, Any] = {
+        "format_version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "schema": schema_fingerprint(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "tables": {},
+    }
+    with session_scope() as session, temporary.open("wb") as handle:
+        connection = session.connection()
+        handle.write(b"\0" * _HEADER.size)
+        for model in SNAPSHOT_MODELS:
+            table = model.__table__
+            manifest["tables"][table.name] = _export_table(connection, table, handle)
+
+        manifest_bytes = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+        manifest_offset = _write_aligned(handle, manifest_bytes)[0]
+        handle.seek(0)
+        handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, manifest_offset, len(manifest_bytes)))
+    os.replace(temporary, path)
+    return {name: table["rows"] for name, table in manifest["tables"].items()}
+
+
+class SnapshotColumn:
+    """Read-only view of one column; numeric sections are zero-copy over the mmap."""
+
+    def __init__(self, snapshot: "Snapshot", spec: Dict[str, Any]) -> None:
+        self.kind: str = spec["kind"]
+        sections = spec["sections"]
+        self.nulls = snapshot._section(sections["nulls"], "b") if "nulls" in sections else None
+        if self.kind in ("str", "json"):
+            self.offsets = snapshot._section(sections["offsets"], "q")
+            self.data = snapshot._section(sections["data"], None)
+        else:
+            self.values = snapshot._section(sections["values"], _TYPECODES[self.kind])
+
+    def __getitem__(self, index: int) -> Any:
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        kind = self.kind
+        if kind in ("str", "json"):
+            raw = str(self.data[self.offsets[index] : self.offsets[index + 1]], "utf-8")
+            return json.loads(raw) if kind == "json" else raw
+        value = self.values[index]
+        if kind == "ts":
+            return _EPOCH + value * _MICROSECOND
+        if kind == "bool":
+            return bool(value)
+        return value
+
+
+class Snapshot:
+    """Memory-mapped snapshot file. Use as a context manager."""
+
+    def __init__(self, path: Path) -> None:
+        self._handle = path.open("rb")
+        self._mmap = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        magic, version, _, manifest_offset, manifest_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an EV Grid Ops snapshot")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"unsupported snapshot format version {version} (expected {FORMAT_VERSION})")
+        self.manifest: Dict[str, Any] = json.loads(self._mmap[manifest_offset : manifest_offset + manifest_length])
+        self._swap = self.manifest["byteorder"] != sys.byteorder
+
+    def _section(self, location: Sequence[int], typecode: Optional[str]) -> Any:
+        offset, length = location
+        view = memoryview(self._mmap)[offset : offset + length]
+        self._views.append(view)
+        if typecode is None:
+            return view
+        if self._swap:
+            values = array(typecode)
+            values.frombytes(view)
+            values.byteswap()
+            return values
+        cast = view.cast(typecode)
+        self._views.append(cast)
+        return cast
+
+    def table_rows(self, name: str) -> int:
+        return int(self.manifest["tables"].get(name, {}).get("rows", 0))
+
+    def columns(self, name: str, only: Optional[Sequence[str]] = None) -> Dict[str, SnapshotColumn]:
+        specs = self.manifest["tables"].get(name, {}).get("columns", {})
+        return {
+            column: SnapshotColumn(self, spec)
+            for column, spec in specs.items()
+            if only is None or column in only
+        }
+
+    def iter_rows(self, name: str, only: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        columns = list(self.columns(name, only).items())
+        for index in range(self.table_rows(name)):
+            yield {column: view[index] for column, view in columns}
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._mmap.close()
+        self._handle.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _sync_sequences(session: Any) -> None:
+    """Move Postgres serial sequences past explicitly inserted ids."""
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    for model, column in ((CaseRecord, "pk"), (VerificationOutcomeRecord, "id")):
+        table = model.__table__.name
+        current = session.scalar(select(func.max(model.__table__.c[column])))
+        if current:
+            session.execute(
+                text("SELECT setval(pg_get_serial_sequence(:table, :column), :value)"),
+                {"table": table, "column": column, "value": current},
+            )
+
+
+def import_snapshot(path: Path, batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    """Replace all operational state with the snapshot at ``path``; returns rows per table."""
+    require_unsharded("import_snapshot")
+    summary: Dict[str, int] = {}
+    with Snapshot(path) as snapshot, session_scope() as session:
+        if snapshot.manifest["schema"] != schema_fingerprint():
+            logger.warning("snapshot %s was taken with a different schema; loading shared columns only", path)
+        _clear_state(session)
+        for model in SNAPSHOT_MODELS:
+            table = model.__table__
+            rows = snapshot.iter_rows(table.name, only=[column.name for column in table.columns])
+            summary[table.name] = _insert_rows(session, model, rows, batch_size)
+        _sync_sequences(session)
+    return summary
+
+
+def _describe(path: Path) -> List[Tuple[str, int, int]]:
+    with Snapshot(path) as snapshot:
+        return [
+            (
+                name,
+                table["rows"],
+                sum(location[1] for column in table["columns"].values() for location in column["sections"].values()),
+            )
+            for name, table in snapshot.manifest["tables"].items()
+        ]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Export or import a binary snapshot of the operational state.")
+    parser.add_argument("command", choices=("export", "import", "info"))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows per insert on import")
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        for name, rows, size in _describe(args.path):
+            print(f"- {name}: {rows} rows, {size / 1024:.1f} KiB")
+        return
+
+    started = time.perf_counter()
+    if args.command == "export":
+        summary = export_snapshot(args.path)
+    else:
+        summary = import_snapshot(args.path, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - started
+    print(f"Snapshot {args.command} of {args.path} finished in {elapsed:.2f}s:")
+    for key, value in summary.items():
+        print(f"- {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Per-mode spatial index over persisted cases for map viewport queries.
+
+Each worker keeps the cases of a mode in priority order next to a
+:class:`~app.spatial.GridIndex` of their coordinates and a
+:class:`~app.clustering.ClusterIndex` for zoomed-out views. Every lookup first
+reads :func:`app.store.cases_token` (one indexed aggregate per shard) and
+rebuilds the index only when the stored cases were replaced, so workers never
+serve cases from a superseded triage run. Triage posts refresh the index right
+after persisting, so the next map request does not pay for the rebuild.
+Concurrent rebuilds of a mode share one build, as long as it started after the
+caller's write.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from app import async_store
+from app.clustering import ClusterIndex
+from app.models import Case, CaseCluster, CaseMode
+from app.services.cpu_offload import run_cpu
+from app.services.singleflight import read_coalescer
+from app.spatial import BBox, GridIndex
+
+
+@dataclass(frozen=True)
+class CaseIndex:
+    token: Tuple
+    cases: Sequence[Case]
+    grid: GridIndex
+    clusters: ClusterIndex
+
+    @classmethod
+    def build(cls, token: Tuple, cases: Sequence[Case]) -> "CaseIndex":
+        located = [case.lat is not None and case.lon is not None for case in cases]
+        return cls(
+            token=token,
+            cases=cases,
+            grid=GridIndex((case.lon, case.lat) if ok else None for case, ok in zip(cases, located)),
+            clusters=ClusterIndex(
+                (case.lon, case.lat, case.priority_score) if ok else None for case, ok in zip(cases, located)
+            ),
+        )
+
+    def within(self, bbox: BBox) -> List[Case]:
+        return self.grid.select(self.cases, bbox)
+
+    def clusters_within(self, zoom: int, bbox: BBox) -> List[CaseCluster]:
+        result: List[CaseCluster] = []
+        for cluster in self.clusters.clusters(zoom, bbox):
+            if cluster.leaf is not None:
+                case = self.cases[cluster.leaf]
+                result.append(
+                    CaseCluster(
+                        lat=case.lat,
+                        lon=case.lon,
+                        count=1,
+                        max_priority_score=case.priority_score,
+                        case_id=case.id,
+                    )
+                )
+            else:
+                result.append(
+                    CaseCluster(
+                        lat=cluster.lat,
+                        lon=cluster.lon,
+                        count=cluster.count,
+                        max_priority_score=cluster.max_priority,
+                        expansion_zoom=cluster.expansion_zoom,
+                    )
+                )
+        return result
+
+
+class CaseIndexCache:
+    def __init__(self) -> None:
+        self._indexes: Dict[CaseMode, CaseIndex] = {}
+
+    async def _build(self, mode: CaseMode) -> CaseIndex:
+        # Read the token first: a write racing the load leaves a stale token and
+        # forces one extra rebuild rather than pinning outdated cases.
+        token = await async_store.cases_token(mode)
+        cases = await async_store.get_cases(mode)
+        index = await run_cpu(CaseIndex.build, token, cases)
+        self._indexes[mode] = index
+        return index
+
+    async def refresh(self, mode: CaseMode) -> CaseIndex:
+        """Index the cases stored now, including any the caller just wrote."""
+        return await self.get(mode)
+
+    async def get(self, mode: CaseMode) -> CaseIndex:
+        token = await async_store.cases_token(mode)
+        index = self._indexes.get(mode)
+        if index is not None and index.token == token:
+            return index
+        key = f"case_index:{mode}"
+        index = await read_coalescer.do_async(key, lambda: self._build(mode))
+        if index.token != token:
+            # The shared build started before the cases behind ``token`` were
+            # written. Any build that starts now reads them (or newer ones).
+            index = await read_coalescer.do_async(key, lambda: self._build(mode))
+        return index
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+
+case_index = CaseIndexCache()
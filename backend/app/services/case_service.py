@@ -1,7 +1,8 @@
 """Case lifecycle service operations."""
 
-from app import store
+from app import async_store, store
 from app.models import (
+    CaseClustersResponseData,
     CaseMode,
     CasesResponseData,
     DispatchRequest,
@@ -9,12 +10,19 @@ from app.models import (
     VerifyRequest,
     VerifyResponseData,
 )
+from app.services.case_index import case_index
+from app.services.singleflight import read_coalescer
+from app.spatial import BBox
 
 
-def list_cases(mode: CaseMode) -> CasesResponseData:
+def _load_cases(mode: CaseMode) -> CasesResponseData:
     return CasesResponseData(mode=mode, cases=store.get_cases(mode))
 
 
+def list_cases(mode: CaseMode) -> CasesResponseData:
+    return read_coalescer.do(f"list_cases:{mode}", lambda: _load_cases(mode))
+
+
 def dispatch_case(case_id: str, payload: DispatchRequest) -> DispatchResponseData:
     case = store.find_case(case_id)
     if case is None:
@@ -40,3 +48,50 @@ def verify_case(case_id: str, payload: VerifyRequest) -> VerifyResponseData:
         notes=payload.notes,
     )
     return VerifyResponseData(verification_task=verification_task)
+
+
+async def _load_cases_async(mode: CaseMode) -> CasesResponseData:
+    return CasesResponseData(mode=mode, cases=await async_store.get_cases(mode))
+
+
+async def list_cases_async(mode: CaseMode) -> CasesResponseData:
+    return await read_coalescer.do_async(f"list_cases:{mode}", lambda: _load_cases_async(mode))
+
+
+async def list_cases_in_bbox_async(mode: CaseMode, bbox: BBox) -> CasesResponseData:
+    index = await case_index.get(mode)
+    return CasesResponseData(mode=mode, cases=index.within(bbox))
+
+
+async def list_case_clusters_async(mode: CaseMode, zoom: int, bbox: BBox) -> CaseClustersResponseData:
+    index = await case_index.get(mode)
+    return CaseClustersResponseData(
+        mode=mode, zoom=index.clusters.clamp_zoom(zoom), clusters=index.clusters_within(zoom, bbox)
+    )
+
+
+async def dispatch_case_async(case_id: str, payload: DispatchRequest) -> DispatchResponseData:
+    case = await async_store.find_case(case_id)
+    if case is None:
+        raise ValueError(f"Case not found: {case_id}")
+
+    work_order = await async_store.create_or_update_work_order(
+        case_id=case.id,
+        assigned_team=payload.assigned_team,
+        due_at=payload.due_at,
+        state=payload.state,
+    )
+    return DispatchResponseData(work_order=work_order)
+
+
+async def verify_case_async(case_id: str, payload: VerifyRequest) -> VerifyResponseData:
+    case = await async_store.find_case(case_id)
+    if case is None:
+        raise ValueError(f"Case not found: {case_id}")
+
+    verification_task = await async_store.complete_verification(
+        case_id=case.id,
+        result=payload.result,
+        notes=payload.notes,
+    )
+    return VerifyResponseData(verification_task=verification_task)
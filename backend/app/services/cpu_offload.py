@@ -0,0 +1,60 @@
+"""Run CPU-bound work (triage scoring, metric aggregation) off the event loop.
+
+``CPU_OFFLOAD=thread`` (default) uses a pool of ``CPU_OFFLOAD_WORKERS``
+threads. The work runs in a copy of the caller's context, so spans, query
+accounting and memory tracking still attribute it to the request. Scoring
+is pure Python and holds the GIL, but the loop keeps getting switch
+intervals to accept connections and serve polls.
+
+``CPU_OFFLOAD=process`` uses a spawn-based process pool instead, for real
+parallelism across cores. Arguments and results are pickled, and spans
+recorded inside the workers are not reported.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+CPU_OFFLOAD = os.getenv("CPU_OFFLOAD", "thread")
+CPU_OFFLOAD_WORKERS = int(os.getenv("CPU_OFFLOAD_WORKERS", str(os.cpu_count() or 1)))
+
+_executor: Optional[Executor] = None
+_executor_lock = Lock()
+
+
+def _pool() -> Executor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            if CPU_OFFLOAD == "process":
+                _executor = ProcessPoolExecutor(
+                    max_workers=CPU_OFFLOAD_WORKERS, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                _executor = ThreadPoolExecutor(max_workers=CPU_OFFLOAD_WORKERS, thread_name_prefix="cpu")
+        return _executor
+
+
+async def run_cpu(fn: Callable[..., T], *args: Any) -> T:
+    """Await ``fn(*args)`` computed on the offload pool."""
+    loop = asyncio.get_running_loop()
+    if CPU_OFFLOAD == "process":
+        return await loop.run_in_executor(_pool(), functools.partial(fn, *args))
+    return await loop.run_in_executor(_pool(), contextvars.copy_context().run, fn, *args)
+
+
+def shutdown() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
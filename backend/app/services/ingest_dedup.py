@@ -0,0 +1,280 @@
+"""Drop resent signals before they reach the database or the scorer.
+
+Upstream sources resend the same ``sig_*`` ids with unchanged content. Each
+worker keeps:
+
+- an LRU of the ``INGEST_LRU_SIZE`` most recently seen ids and a digest of
+  their content, and
+- a Bloom filter of every id in the ``signals`` table, seeded on startup (or
+  on first use) and sized for ``INGEST_BLOOM_CAPACITY`` ids at
+  ``INGEST_BLOOM_ERROR_RATE`` false positives.
+
+:meth:`SeenSignalFilter.plan` sorts a batch into new, changed and repeated
+signals. LRU hits are decided in memory. Ids the Bloom filter has never seen
+are new without a lookup. Only the remaining "maybe seen" ids are read back
+from the database, in one chunked query, to compare content. Triage routes
+write only new and changed signals. A batch with neither that matches the
+batch behind the stored cases is not rescored.
+
+Digesting and classifying a batch is CPU work, so :meth:`SeenSignalFilter.plan`
+runs it, the lookup merge and seeding on worker threads, off the event loop.
+
+The filter is per worker. An id this worker has never seen but another worker
+wrote is treated as new or changed, which costs one redundant upsert. The
+reverse is not covered: if another worker stores different content for an id
+this worker still has in its LRU, a resend of the content this worker saw is
+dropped as a repeat and the other worker's version stays in the table. Run one
+worker, or send edits through a single worker, where that matters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from anyio import to_thread
+
+from app import async_store, store
+from app.models import CaseMode, Signal
+
+INGEST_LRU_SIZE = int(os.getenv("INGEST_LRU_SIZE", "200000"))
+INGEST_BLOOM_CAPACITY = int(os.getenv("INGEST_BLOOM_CAPACITY", "2000000"))
+INGEST_BLOOM_ERROR_RATE = float(os.getenv("INGEST_BLOOM_ERROR_RATE", "0.01"))
+
+_MASK64 = (1 << 64) - 1
+
+
+def signal_digest(signal: Signal) -> int:
+    """Content digest of a signal; equal for exact resends within this process."""
+    return hash(store.signal_content(signal))
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = max(1, capacity)
+        self.bits = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.bits for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        array = self._array
+        for position in self._positions(key):
+            array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        array = self._array
+        return all(array[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+@dataclass
+class IngestPlan:
+    signals: Sequence[Signal]
+    digests: List[int]
+    new: List[Signal] = field(default_factory=list)
+    changed: List[Signal] = field(default_factory=list)
+    repeats: int = 0
+
+    @property
+    def to_write(self) -> List[Signal]:
+        return self.new + self.changed
+
+    @property
+    def unchanged(self) -> bool:
+        return not self.new and not self.changed
+
+    @property
+    def fingerprint(self) -> Tuple[int, int]:
+        """Order-independent digest of the whole batch."""
+        return len(self.digests), sum(self.digests) & _MASK64
+
+
+class SeenSignalFilter:
+    def __init__(
+        self,
+        lru_size: int = INGEST_LRU_SIZE,
+        bloom_capacity: int = INGEST_BLOOM_CAPACITY,
+        bloom_error_rate: float = INGEST_BLOOM_ERROR_RATE,
+    ) -> None:
+        self.lru_size = lru_size
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self._lock = Lock()
+        self._seed_lock = Lock()
+        self._recent: "OrderedDict[str, int]" = OrderedDict()
+        self._bloom: Optional[BloomFilter] = None
+        self._scored: Dict[CaseMode, Tuple[Tuple[int, int], Tuple, str]] = {}
+        self._counts: Dict[str, int] = {}
+        self.clear()
+        store.on_signals_cleared(self.clear)
+
+    def clear(self) -> None:
+        """Forget everything; the Bloom filter is reseeded from the database on next use."""
+        with self._lock:
+            self._recent.clear()
+            self._bloom = None
+            self._scored.clear()
+            self._counts = dict.fromkeys(
+                (
+                    "signals",
+                    "lru_hits",
+                    "lru_misses",
+                    "bloom_negatives",
+                    "bloom_false_positives",
+                    "db_checks",
+                    "repeats_dropped",
+                    "changed",
+                    "new",
+                    "rescoring_skipped",
+                    "seeded_ids",
+                ),
+                0,
+            )
+
+    def seed(self) -> int:
+        """Build the Bloom filter from the ids in the ``signals`` table, if not built yet."""
+        with self._seed_lock:
+            with self._lock:
+                if self._bloom is not None:
+                    return self._bloom.count
+            ids = store.iter_signal_ids()
+            bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+            for signal_id in ids:
+                bloom.add(signal_id)
+            # Ids remembered while seeding ran are already in the table or the LRU.
+            with self._lock:
+                for signal_id in self._recent:
+                    bloom.add(signal_id)
+                if bloom.count > bloom.capacity:
+                    self.bloom_capacity = bloom.count * 2
+                self._bloom = bloom
+                self._counts["seeded_ids"] = bloom.count
+            return bloom.count
+
+    def _classify(self, plan: IngestPlan) -> List[Tuple[Signal, int]]:
+        """Decide what the LRU and the Bloom filter can; return the signals that need a lookup."""
+        maybe_seen: List[Tuple[Signal, int]] = []
+        counts = self._counts
+        with self._lock:
+            recent, bloom = self._recent, self._bloom
+            counts["signals"] += len(plan.signals)
+            for signal, digest in zip(plan.signals, plan.digests):
+                known = recent.get(signal.id)
+                if known is not None:
+                    counts["lru_hits"] += 1
+                    recent.move_to_end(signal.id)
+                    if known == digest:
+                        plan.repeats += 1
+                    else:
+                        plan.changed.append(signal)
+                    continue
+                counts["lru_misses"] += 1
+                if bloom is not None and signal.id not in bloom:
+                    counts["bloom_negatives"] += 1
+                    plan.new.append(signal)
+                else:
+                    maybe_seen.append((signal, digest))
+        return maybe_seen
+
+    def _resolve(
+        self, plan: IngestPlan, maybe_seen: List[Tuple[Signal, int]], stored: Sequence[store.SignalContent]
+    ) -> None:
+        stored_digests = {content[0]: hash(content) for content in stored}
+        with self._lock:
+            self._counts["db_checks"] += len(maybe_seen)
+            for signal, digest in maybe_seen:
+                known = stored_digests.get(signal.id)
+                if known is None:
+                    self._counts["bloom_false_positives"] += 1
+                    plan.new.append(signal)
+                elif known == digest:
+                    plan.repeats += 1
+                else:
+                    plan.changed.append(signal)
+            self._counts["repeats_dropped"] += plan.repeats
+            self._counts["changed"] += len(plan.changed)
+            self._counts["new"] += len(plan.new)
+
+    def _start(self, signals: Sequence[Signal]) -> Tuple[IngestPlan, List[Tuple[Signal, int]]]:
+        plan = IngestPlan(signals, [signal_digest(signal) for signal in signals])
+        return plan, self._classify(plan)
+
+    def plan_sync(self, signals: Sequence[Signal]) -> IngestPlan:
+        if self._bloom is None:
+            self.seed()
+        plan, maybe_seen = self._start(signals)
+        stored = store.get_signal_contents([signal.id for signal, _ in maybe_seen]) if maybe_seen else []
+        self._resolve(plan, maybe_seen, stored)
+        return plan
+
+    async def plan(self, signals: Sequence[Signal]) -> IngestPlan:
+        if self._bloom is None:
+            await to_thread.run_sync(self.seed)
+        plan, maybe_seen = await to_thread.run_sync(self._start, signals)
+        stored = await async_store.get_signal_contents([signal.id for signal, _ in maybe_seen]) if maybe_seen else []
+        await to_thread.run_sync(self._resolve, plan, maybe_seen, stored)
+        return plan
+
+    def remember(self, plan: IngestPlan) -> None:
+        """Record a batch once it is stored; later exact resends are dropped in memory."""
+        with self._lock:
+            recent, bloom = self._recent, self._bloom
+            for signal, digest in zip(plan.signals, plan.digests):
+                recent[signal.id] = digest
+                recent.move_to_end(signal.id)
+            for signal in plan.new:
+                if bloom is not None:
+                    bloom.add(signal.id)
+            while len(recent) > self.lru_size:
+                recent.popitem(last=False)
+            if bloom is not None and bloom.count > bloom.capacity:
+                # Past capacity the error rate climbs; reseed at twice the size.
+                self.bloom_capacity = bloom.count * 2
+                self._bloom = None
+
+    def mark_scored(self, mode: CaseMode, plan: IngestPlan, cases_token: Tuple, rules_version: str) -> None:
+        with self._lock:
+            self._scored[mode] = (plan.fingerprint, cases_token, rules_version)
+
+    def can_skip_scoring(self, mode: CaseMode, plan: IngestPlan, cases_token: Tuple, rules_version: str) -> bool:
+        """True when ``plan`` resends exactly the batch behind the stored ``mode`` cases, under the same rules."""
+        if not plan.unchanged:
+            return False
+        with self._lock:
+            skip = self._scored.get(mode) == (plan.fingerprint, cases_token, rules_version)
+            if skip:
+                self._counts["rescoring_skipped"] += 1
+        return skip
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            bloom = self._bloom
+            recent = len(self._recent)
+        lookups = counts["lru_hits"] + counts["lru_misses"]
+        return {
+            **counts,
+            "lru_size": recent,
+            "lru_capacity": self.lru_size,
+            "lru_hit_rate": round(counts["lru_hits"] / lookups, 4) if lookups else 0.0,
+            "repeat_rate": round(counts["repeats_dropped"] / counts["signals"], 4) if counts["signals"] else 0.0,
+            "bloom_ids": bloom.count if bloom is not None else None,
+            "bloom_bits": bloom.bits if bloom is not None else None,
+        }
+
+
+seen_signals = SeenSignalFilter()
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable
+import asyncio
+from typing import Dict, Iterable, Mapping, Sequence
 
-from app import store
-from app.models import Case, CompareMetrics
+from app import async_store, store
+from app.models import Case, CompareMetrics, VerificationTask
+from app.services.cpu_offload import run_cpu
+from app.services.singleflight import read_coalescer
 
 
 def _pct_reduction(baseline_value: float, certainty_value: float) -> float:
@@ -18,13 +21,13 @@ def _critical_cases(cases: Iterable[Case]) -> list[Case]:
     return [case for case in cases if case.priority_score >= 80]
 
 
-def compare_metrics() -> CompareMetrics:
-    """Return baseline vs certainty metric deltas derived from persisted state."""
-    baseline = store.get_cases("baseline")
-    certainty = store.get_cases("certainty")
-    verification_tasks = store.get_verification_tasks_map()
-    verification_outcomes = store.get_verification_outcomes()
-
+def compute_compare_metrics(
+    baseline: Sequence[Case],
+    certainty: Sequence[Case],
+    verification_tasks: Mapping[str, VerificationTask],
+    verification_outcomes: Sequence[store.VerificationOutcome],
+) -> CompareMetrics:
+    """Derive the KPI deltas from explicit state rather than the persisted store."""
     baseline_dispatches = sum(1 for case in baseline if case.recommended_action == "dispatch_field_tech")
     certainty_dispatches = sum(1 for case in certainty if case.recommended_action == "dispatch_field_tech")
     false_dispatch_reduction_pct = _pct_reduction(float(baseline_dispatches), float(certainty_dispatches))
@@ -45,7 +48,8 @@ def compare_metrics() -> CompareMetrics:
     )
     certainty_caught = 0
     for case in certainty_critical:
-        if case.recommended_action == "dispatch_field_tech":
+        # A case covered by an incident is caught by the incident's dispatch.
+        if case.recommended_action in ("dispatch_field_tech", "covered_by_incident"):
             certainty_caught += 1
             continue
         if outcomes_by_case.get(case.id) == "confirmed_issue":
@@ -64,3 +68,32 @@ def compare_metrics() -> CompareMetrics:
         triage_time_reduction_pct=round(triage_time_reduction_pct, 2),
         critical_catch_rate_delta_pct=round(critical_catch_rate_delta_pct, 2),
     )
+
+
+def _compute_compare_metrics() -> CompareMetrics:
+    return compute_compare_metrics(
+        store.get_cases("baseline"),
+        store.get_cases("certainty"),
+        store.get_verification_tasks_map(),
+        store.get_verification_outcomes(),
+    )
+
+
+def compare_metrics() -> CompareMetrics:
+    """Return baseline vs certainty metric deltas derived from persisted state."""
+    return read_coalescer.do("compare_metrics", _compute_compare_metrics)
+
+
+async def _compute_compare_metrics_async() -> CompareMetrics:
+    baseline, certainty, tasks, outcomes = await asyncio.gather(
+        async_store.get_cases("baseline"),
+        async_store.get_cases("certainty"),
+        async_store.get_verification_tasks_map(),
+        async_store.get_verification_outcomes(),
+    )
+    return await run_cpu(compute_compare_metrics, baseline, certainty, tasks, outcomes)
+
+
+async def compare_metrics_async() -> CompareMetrics:
+    """Async :func:`compare_metrics`; concurrent callers share one computation."""
+    return await read_coalescer.do_async("compare_metrics", _compute_compare_metrics_async)
@@ -0,0 +1,114 @@
+"""Request coalescing for hot read paths.
+
+Concurrent identical calls share one in-flight computation: the first caller
+(the leader) runs the function, later callers with the same key block until
+the leader finishes and receive the same result object (or exception).
+Nothing is cached once the computation completes. :meth:`SingleFlight.do_async`
+does the same for coroutines, with followers awaiting the leader's task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _InFlightCall:
+    done: Event = field(default_factory=Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class _KeyStats:
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._in_flight: Dict[str, _InFlightCall] = {}
+        self._in_flight_async: Dict[str, "asyncio.Future[Any]"] = {}
+        self._stats: Dict[str, _KeyStats] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` once for all concurrent callers of ``key``."""
+        with self._lock:
+            stats = self._stats.setdefault(key, _KeyStats())
+            stats.calls += 1
+            call = self._in_flight.get(key)
+            if call is None:
+                call = _InFlightCall()
+                self._in_flight[key] = call
+                stats.executions += 1
+                leader = True
+            else:
+                stats.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            call.done.set()
+        return call.result  # type: ignore[no-any-return]
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()`` once for all concurrent awaiters of ``key``."""
+        with self._lock:
+            stats = self._stats.setdefault(key, _KeyStats())
+            stats.calls += 1
+            task = self._in_flight_async.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._in_flight_async[key] = task
+                task.add_done_callback(lambda done: self._forget_async(key, done))
+                stats.executions += 1
+            else:
+                stats.coalesced += 1
+        # A cancelled caller must not cancel the computation the others are waiting on.
+        return await asyncio.shield(task)  # type: ignore[no-any-return]
+
+    def _forget_async(self, key: str, task: "asyncio.Future[Any]") -> None:
+        with self._lock:
+            if self._in_flight_async.get(key) is task:
+                del self._in_flight_async[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return per-key call, execution and coalesced counters."""
+        with self._lock:
+            return {
+                key: {
+                    "calls": value.calls,
+                    "executions": value.executions,
+                    "coalesced": value.coalesced,
+                    "in_flight": int(key in self._in_flight or key in self._in_flight_async),
+                }
+                for key, value in sorted(self._stats.items())
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+read_coalescer = SingleFlight()
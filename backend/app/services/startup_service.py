@@ -0,0 +1,150 @@
+"""Application startup with timed phases and background warm-up.
+
+Only the persisted-marker checks run before the app accepts traffic. Demo
+seeding (when its marker is stale) and query warm-up run on a background
+thread unless ``STARTUP_WARMUP=inline``; ``GET /api/health/ready`` reports
+``503`` until they finish. Phase timings are kept on :data:`startup_state`
+and recorded as stages of the ``startup`` route in ``/api/metrics/perf``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from app.db.bootstrap import demo_seed_current, ensure_demo_cases, prepare_database
+from app.observability.spans import registry as span_registry
+from app.services.case_service import list_cases
+from app.services.ingest_dedup import seen_signals
+from app.services.metrics_service import compare_metrics
+
+logger = logging.getLogger(__name__)
+
+STARTUP_ROUTE = "startup"
+WARMUP_MODE = os.getenv("STARTUP_WARMUP", "background")
+
+T = TypeVar("T")
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    duration_ms: float
+    background: bool
+    result: Optional[str] = None
+
+
+class StartupState:
+    """Progress of the current startup: pending, warming, ready or failed."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.status = "pending"
+            self.error: Optional[str] = None
+            self.started_at: Optional[datetime] = None
+            self.ready_at: Optional[datetime] = None
+            self.phases: List[StartupPhase] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def begin(self) -> None:
+        self.reset()
+        with self._lock:
+            self.status = "warming"
+            self.started_at = datetime.now(timezone.utc)
+
+    def record(self, phase: StartupPhase) -> None:
+        with self._lock:
+            self.phases.append(phase)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.status = "failed" if error else "ready"
+            self.error = error
+            self.ready_at = datetime.now(timezone.utc)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total_ms = (
+                round((self.ready_at - self.started_at).total_seconds() * 1000, 3)
+                if self.started_at and self.ready_at
+                else None
+            )
+            return {
+                "status": self.status,
+                "error": self.error,
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "ready_at": self.ready_at.isoformat() if self.ready_at else None,
+                "total_ms": total_ms,
+                "phases": [asdict(phase) for phase in self.phases],
+            }
+
+
+startup_state = StartupState()
+
+
+def _timed(name: str, fn: Callable[[], T], background: bool) -> T:
+    start_ns = perf_counter_ns()
+    result = fn()
+    duration_ns = perf_counter_ns() - start_ns
+    if span_registry.enabled:
+        span_registry.observe(STARTUP_ROUTE, name, duration_ns)
+    startup_state.record(
+        StartupPhase(name=name, duration_ms=round(duration_ns / 1e6, 3), background=background, result=repr(result))
+    )
+    return result
+
+
+def _warm_queries() -> int:
+    """Run the dashboard reads once so connections and statement caches are primed."""
+    cases = list_cases("certainty").cases
+    list_cases("baseline")
+    compare_metrics()
+    return len(cases)
+
+
+def _warm_up(seed_current: bool, background: bool) -> None:
+    try:
+        if not seed_current:
+            _timed("ensure_demo_cases", ensure_demo_cases, background)
+        _timed("warm_queries", _warm_queries, background)
+        _timed("seed_signal_filter", seen_signals.seed, background)
+    except Exception as exc:
+        logger.exception("startup warm-up failed")
+        startup_state.finish(error=f"{type(exc).__name__}: {exc}")
+        return
+    startup_state.finish()
+
+
+def run_startup(warmup_mode: str = WARMUP_MODE) -> Optional[threading.Thread]:
+    """Run the blocking startup checks and start warm-up.
+
+    Returns the warm-up thread in ``background`` mode, ``None`` otherwise.
+    """
+    startup_state.begin()
+    try:
+        _timed("prepare_database", prepare_database, background=False)
+        seed_current = _timed("check_seed_marker", demo_seed_current, background=False)
+    except Exception as exc:
+        startup_state.finish(error=f"{type(exc).__name__}: {exc}")
+        raise
+
+    if warmup_mode != "background":
+        _warm_up(seed_current, background=False)
+        return None
+
+    thread = threading.Thread(target=_warm_up, args=(seed_current, True), name="startup-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,151 @@
+"""Uniform-grid spatial index for bounding-box lookups over lon/lat points."""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass
+from itertools import compress
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+# ~250 m at Austin's latitude; a downtown viewport touches about a thousand cells.
+SPATIAL_CELL_DEG = float(os.getenv("SPATIAL_CELL_DEG", "0.0025"))
+# Above 1/16 of the indexed points, marking a bitmap beats sorting per-cell runs.
+_MASK_FRACTION = 16
+
+Cell = Tuple[int, int]
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class BBox:
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+    def contains(self, lon: float, lat: float) -> bool:
+        return self.min_lon <= lon <= self.max_lon and self.min_lat <= lat <= self.max_lat
+
+
+WORLD = BBox(-180.0, -90.0, 180.0, 90.0)
+
+
+def parse_bbox(raw: str) -> BBox:
+    """Parse ``minLon,minLat,maxLon,maxLat``; raises ValueError when malformed."""
+    parts = raw.split(",")
+    if len(parts) != 4:
+        raise ValueError("bbox must be minLon,minLat,maxLon,maxLat")
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(part) for part in parts)
+    except ValueError:
+        raise ValueError("bbox must be minLon,minLat,maxLon,maxLat") from None
+    if not all(math.isfinite(value) for value in (min_lon, min_lat, max_lon, max_lat)):
+        raise ValueError("bbox coordinates must be finite")
+    if not (-180.0 <= min_lon <= max_lon <= 180.0) or not (-90.0 <= min_lat <= max_lat <= 90.0):
+        raise ValueError("bbox must satisfy -180 <= minLon <= maxLon <= 180 and -90 <= minLat <= maxLat <= 90")
+    return BBox(min_lon, min_lat, max_lon, max_lat)
+
+
+class GridIndex:
+    """Buckets point positions into square cells of ``cell_deg`` degrees.
+
+    Matches come back in position order, so an index built from a ranked
+    sequence (cases by priority) answers in rank order without re-sorting
+    the items themselves.
+    """
+
+    def __init__(self, points: Iterable[Optional[Tuple[float, float]]], cell_deg: float = SPATIAL_CELL_DEG) -> None:
+        self.cell_deg = cell_deg
+        self._lons: List[float] = []
+        self._lats: List[float] = []
+        self._cells: Dict[Cell, List[int]] = {}
+        located = bytearray()
+        for position, point in enumerate(points):
+            if point is None:
+                self._lons.append(math.nan)
+                self._lats.append(math.nan)
+                located.append(0)
+                continue
+            lon, lat = point
+            self._lons.append(lon)
+            self._lats.append(lat)
+            located.append(1)
+            self._cells.setdefault(self._cell(lon, lat), []).append(position)
+        self.size = len(located)
+        self._located = bytes(located)
+        lons = list(compress(self._lons, located))
+        lats = list(compress(self._lats, located))
+        self.extent: Optional[BBox] = BBox(min(lons), min(lats), max(lons), max(lats)) if lons else None
+
+    def _cell(self, lon: float, lat: float) -> Cell:
+        return math.floor(lon / self.cell_deg), math.floor(lat / self.cell_deg)
+
+    def _cells_in(self, x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int, List[int]]]:
+        # Zoomed out, the range spans more cells than are occupied; walk the occupied ones instead.
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(self._cells):
+            cells = self._cells
+            return [
+                (x, y, cells[(x, y)]) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1) if (x, y) in cells
+            ]
+        return [
+            (x, y, positions)
+            for (x, y), positions in self._cells.items()
+            if x0 <= x <= x1 and y0 <= y <= y1
+        ]
+
+    def candidates(self, bbox: BBox) -> int:
+        """Number of points in the cells ``bbox`` overlaps: the most :meth:`select` checks."""
+        x0, y0 = self._cell(bbox.min_lon, bbox.min_lat)
+        x1, y1 = self._cell(bbox.max_lon, bbox.max_lat)
+        return sum(len(positions) for _, _, positions in self._cells_in(x0, y0, x1, y1))
+
+    def select(self, items: Sequence[T], bbox: BBox) -> List[T]:
+        """Return the members of ``items`` (the sequence the index was built from) inside ``bbox``."""
+        extent = self.extent
+        if extent is None:
+            return []
+        if (
+            bbox.min_lon <= extent.min_lon
+            and bbox.min_lat <= extent.min_lat
+            and bbox.max_lon >= extent.max_lon
+            and bbox.max_lat >= extent.max_lat
+        ):
+            return list(compress(items, self._located))
+
+        x0, y0 = self._cell(bbox.min_lon, bbox.min_lat)
+        x1, y1 = self._cell(bbox.max_lon, bbox.max_lat)
+        cells = self._cells_in(x0, y0, x1, y1)
+        lons, lats = self._lons, self._lats
+        min_lon, min_lat, max_lon, max_lat = bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat
+
+        def inside(x: int, y: int, positions: List[int]) -> Iterable[int]:
+            # Only cells on the bbox edge need per-point checks, and only along the edge's axis.
+            lon_edge = x == x0 or x == x1
+            lat_edge = y == y0 or y == y1
+            if lon_edge and lat_edge:
+                return (p for p in positions if min_lon <= lons[p] <= max_lon and min_lat <= lats[p] <= max_lat)
+            if lon_edge:
+                return (p for p in positions if min_lon <= lons[p] <= max_lon)
+            if lat_edge:
+                return (p for p in positions if min_lat <= lats[p] <= max_lat)
+            return positions
+
+        candidates = sum(len(positions) for _, _, positions in cells)
+        if candidates * _MASK_FRACTION < self.size:
+            matches: List[int] = []
+            for x, y, positions in cells:
+                matches.extend(inside(x, y, positions))
+            matches.sort()
+            return [items[p] for p in matches]
+
+        # Large results: sorting many per-cell runs costs more than one pass over a bitmap.
+        mask = bytearray(self.size)
+        for x, y, positions in cells:
+            for p in inside(x, y, positions):
+                mask[p] = 1
+        return list(compress(items, mask))
+
+    def query(self, bbox: BBox) -> List[int]:
+        """Positions of the points inside ``bbox``, ascending."""
+        return self.select(range(self.size), bbox)
@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Sequence, TypedDict, cast
+from heapq import merge
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypedDict, cast
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import case as sql_case, delete, func, select
 from sqlalchemy.orm import Session
 
 from app.db.models import (
+    DEMO_SEED_MARKER_KEY,
+    BootstrapMarkerRecord,
     CaseRecord,
     SignalRecord,
     VerificationOutcomeRecord,
     VerificationTaskRecord,
     WorkOrderRecord,
 )
-from app.db.session import session_scope
+from app.db.session import run_readonly, session_scope
+from app.db.sharding import Shard, all_shards, fan_out, partition, shard_for_case, shard_for_charger
 from app.models import (
     Case,
     CaseMode,
@@ -42,22 +46,30 @@ def _ensure_tz(value: datetime) -> datetime:
     return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
 
 
+def _case_values(case: Case, mode: CaseMode) -> Dict[str, object]:
+    return {
+        "case_id": case.id,
+        "mode": mode,
+        "charger_id": case.charger_id,
+        "priority_score": case.priority_score,
+        "sla_hours": case.sla_hours,
+        "root_cause_tag": case.root_cause_tag,
+        "confidence": case.confidence,
+        "recommended_action": case.recommended_action,
+        "evidence_ids": list(case.evidence_ids),
+        "grid_stress_level": case.grid_stress_level,
+        "explanation": case.explanation,
+        "uncertainty_reasons": list(case.uncertainty_reasons),
+        "verification_required": case.verification_required,
+        "lat": case.lat,
+        "lon": case.lon,
+        "incident_id": case.incident_id,
+        "rules_version": case.rules_version,
+    }
+
+
 def _case_to_record(case: Case, mode: CaseMode) -> CaseRecord:
-    return CaseRecord(
-        case_id=case.id,
-        mode=mode,
-        charger_id=case.charger_id,
-        priority_score=case.priority_score,
-        sla_hours=case.sla_hours,
-        root_cause_tag=case.root_cause_tag,
-        confidence=case.confidence,
-        recommended_action=case.recommended_action,
-        evidence_ids=list(case.evidence_ids),
-        grid_stress_level=case.grid_stress_level,
-        explanation=case.explanation,
-        uncertainty_reasons=list(case.uncertainty_reasons),
-        verification_required=case.verification_required,
-    )
+    return CaseRecord(**_case_values(case, mode))
 
 
 def _record_to_case(record: CaseRecord) -> Case:
@@ -74,6 +86,23 @@ def _record_to_case(record: CaseRecord) -> Case:
         explanation=record.explanation,
         uncertainty_reasons=list(record.uncertainty_reasons or []),
         verification_required=record.verification_required,
+        lat=record.lat,
+        lon=record.lon,
+        incident_id=record.incident_id,
+        rules_version=record.rules_version,
+    )
+
+
+def _record_to_signal(record: SignalRecord) -> Signal:
+    return Signal(
+        id=record.id,
+        source=record.source,  # type: ignore[arg-type]
+        timestamp=_ensure_tz(record.timestamp),
+        charger_id=record.charger_id,
+        lat=record.lat,
+        lon=record.lon,
+        status=record.status,  # type: ignore[arg-type]
+        text=record.text,
     )
 
 
@@ -98,194 +127,281 @@ def _record_to_verification_task(record: VerificationTaskRecord) -> Verification
     )
 
 
-def _next_work_order_id(session: Session) -> str:
-    current = session.scalar(select(func.count()).select_from(WorkOrderRecord)) or 0
-    return f"wo_{int(current) + 1:03d}"
+def _work_order_id(case_id: str) -> str:
+    """A case has at most one work order, so its id follows from the case id (no counter query)."""
+    return f"wo_{case_id[len('case_'):] if case_id.startswith('case_') else case_id}"
 
 
-def _next_verification_task_id(session: Session) -> str:
+def _next_verification_task_id(session: Session, shard: Shard = None) -> str:
     current = session.scalar(select(func.count()).select_from(VerificationTaskRecord)) or 0
-    return f"ver_{int(current) + 1:03d}"
+    return f"ver_{_id_prefix(shard)}{int(current) + 1:03d}"
+
+
+def _id_prefix(shard: Shard) -> str:
+    """Counters are per database, so shard-issued ids carry the region to stay unique."""
+    return f"{shard.lower()}_" if shard is not None else ""
 
 
 def _find_case_record(session: Session, case_id: str) -> Optional[CaseRecord]:
-    for mode in ("certainty", "baseline"):
-        record = session.scalar(
-            select(CaseRecord).where(CaseRecord.case_id == case_id, CaseRecord.mode == mode)
-        )
-        if record is not None:
-            return record
-    return None
+    """Return the certainty record for ``case_id``, else the baseline one, in one query."""
+    return session.scalar(
+        select(CaseRecord)
+        .where(CaseRecord.case_id == case_id, CaseRecord.mode.in_(("certainty", "baseline")))
+        .order_by(sql_case((CaseRecord.mode == "certainty", 0), else_=1))
+        .limit(1)
+    )
+
+
+def _case_shard(case: Case) -> Shard:
+    return shard_for_charger(case.charger_id)
+
+
+_signals_cleared_listeners: List[Callable[[], None]] = []
+
+
+def on_signals_cleared(listener: Callable[[], None]) -> None:
+    """Call ``listener`` whenever stored signals are wiped in bulk, so in-process caches can drop them."""
+    _signals_cleared_listeners.append(listener)
+
+
+def notify_signals_cleared() -> None:
+    for listener in _signals_cleared_listeners:
+        listener()
 
 
 def reset_store() -> None:
-    """Clear persisted state. Intended for unit tests."""
-    with session_scope() as session:
-        session.execute(delete(VerificationOutcomeRecord))
-        session.execute(delete(VerificationTaskRecord))
-        session.execute(delete(WorkOrderRecord))
-        session.execute(delete(CaseRecord))
-        session.execute(delete(SignalRecord))
+    """Clear persisted state on every shard. Intended for unit tests."""
+
+    def reset(shard: Shard) -> None:
+        with session_scope(shard) as session:
+            session.execute(delete(VerificationOutcomeRecord))
+            session.execute(delete(VerificationTaskRecord))
+            session.execute(delete(WorkOrderRecord))
+            session.execute(delete(CaseRecord))
+            session.execute(delete(SignalRecord))
+            if shard is None:
+                _clear_demo_seed_marker(session)
+
+    fan_out(reset)
+    notify_signals_cleared()
+
+
+def _clear_demo_seed_marker(session: Session) -> None:
+    """Drop the demo seed marker so the next boot recounts the cases it vouched for."""
+    session.execute(delete(BootstrapMarkerRecord).where(BootstrapMarkerRecord.key == DEMO_SEED_MARKER_KEY))
+
+
+# Session-level bodies. The public helpers below run them on the right shard;
+# app.async_store runs them on an AsyncSession through ``run_sync``.
+
+
+def _upsert_signals(session: Session, items: Sequence[Signal]) -> None:
+    ids = list({signal.id for signal in items})
+    existing_by_id: Dict[str, SignalRecord] = {}
+    # Chunk the IN list to stay under backend bound-parameter limits.
+    for start in range(0, len(ids), 500):
+        for record in session.scalars(select(SignalRecord).where(SignalRecord.id.in_(ids[start : start + 500]))):
+            existing_by_id[record.id] = record
+
+    for signal in items:
+        existing = existing_by_id.get(signal.id)
+        if existing is None:
+            record = SignalRecord(
+                id=signal.id,
+                source=signal.source,
+                timestamp=_ensure_tz(signal.timestamp),
+                charger_id=signal.charger_id,
+                lat=signal.lat,
+                lon=signal.lon,
+                status=signal.status,
+                text=signal.text,
+            )
+            session.add(record)
+            existing_by_id[signal.id] = record
+        else:
+            existing.source = signal.source
+            existing.timestamp = _ensure_tz(signal.timestamp)
+            existing.charger_id = signal.charger_id
+            existing.lat = signal.lat
+            existing.lon = signal.lon
+            existing.status = signal.status
+            existing.text = signal.text
+
+
+def _load_signals(session: Session) -> List[Signal]:
+    records = session.scalars(select(SignalRecord).order_by(SignalRecord.timestamp.asc(), SignalRecord.id.asc()))
+    return [_record_to_signal(record) for record in records]
+
+
+SignalContent = Tuple[str, str, datetime, str, float, float, str, str]
+
+_SIGNAL_CONTENT_COLUMNS = (
+    SignalRecord.id,
+    SignalRecord.source,
+    SignalRecord.timestamp,
+    SignalRecord.charger_id,
+    SignalRecord.lat,
+    SignalRecord.lon,
+    SignalRecord.status,
+    SignalRecord.text,
+)
 
 
-def set_signals(items: Sequence[Signal]) -> None:
-    """Upsert incoming triage signals for traceability."""
-    with session_scope() as session:
-        for signal in items:
-            existing = session.get(SignalRecord, signal.id)
-            if existing is None:
-                session.add(
-                    SignalRecord(
-                        id=signal.id,
-                        source=signal.source,
-                        timestamp=_ensure_tz(signal.timestamp),
-                        charger_id=signal.charger_id,
-                        lat=signal.lat,
-                        lon=signal.lon,
-                        status=signal.status,
-                        text=signal.text,
-                    )
-                )
-            else:
-                existing.source = signal.source
-                existing.timestamp = _ensure_tz(signal.timestamp)
-                existing.charger_id = signal.charger_id
-                existing.lat = signal.lat
-                existing.lon = signal.lon
-                existing.status = signal.status
-                existing.text = signal.text
+def signal_content(signal: Signal) -> SignalContent:
+    """The stored fields of a signal, in :data:`SignalContent` order."""
+    return (
+        signal.id,
+        signal.source,
+        _ensure_tz(signal.timestamp),
+        signal.charger_id,
+        signal.lat,
+        signal.lon,
+        signal.status,
+        signal.text,
+    )
 
 
-def set_baseline_cases(cases: Sequence[Case]) -> None:
-    with session_scope() as session:
-        session.execute(delete(CaseRecord).where(CaseRecord.mode == "baseline"))
-        for case in cases:
-            session.add(_case_to_record(case, "baseline"))
+def _load_signal_contents(session: Session, ids: Sequence[str]) -> List[SignalContent]:
+    contents: List[SignalContent] = []
+    # Plain column rows: no ORM identity map or model validation per signal.
+    for start in range(0, len(ids), 500):
+        rows = session.execute(select(*_SIGNAL_CONTENT_COLUMNS).where(SignalRecord.id.in_(ids[start : start + 500])))
+        contents.extend(
+            (signal_id, source, _ensure_tz(timestamp), charger_id, lat, lon, status, text)
+            for signal_id, source, timestamp, charger_id, lat, lon, status, text in rows
+        )
+    return contents
 
 
-def set_certainty_cases(cases: Sequence[Case], tasks: Sequence[VerificationTask]) -> None:
-    with session_scope() as session:
-        session.execute(delete(CaseRecord).where(CaseRecord.mode == "certainty"))
-        session.execute(delete(VerificationTaskRecord))
-
-        for case in cases:
-            session.add(_case_to_record(case, "certainty"))
-
-        for task in tasks:
-            session.add(
-                VerificationTaskRecord(
-                    id=task.id,
-                    case_id=task.case_id,
-                    question=task.question,
-                    owner=task.owner,
-                    status=task.status,
-                    result=task.result,
-                )
+def _replace_baseline_cases(session: Session, cases: Sequence[Case]) -> None:
+    session.execute(delete(CaseRecord).where(CaseRecord.mode == "baseline"))
+    for case in cases:
+        session.add(_case_to_record(case, "baseline"))
+
+
+def _replace_certainty_cases(session: Session, cases: Sequence[Case], tasks: Sequence[VerificationTask]) -> None:
+    session.execute(delete(CaseRecord).where(CaseRecord.mode == "certainty"))
+    session.execute(delete(VerificationTaskRecord))
+
+    for case in cases:
+        session.add(_case_to_record(case, "certainty"))
+
+    for task in tasks:
+        session.add(
+            VerificationTaskRecord(
+                id=task.id,
+                case_id=task.case_id,
+                question=task.question,
+                owner=task.owner,
+                status=task.status,
+                result=task.result,
             )
+        )
 
 
-def get_cases(mode: CaseMode) -> List[Case]:
-    with session_scope() as session:
-        records = session.scalars(
-            select(CaseRecord)
-            .where(CaseRecord.mode == mode)
-            .order_by(CaseRecord.priority_score.desc(), CaseRecord.updated_at.desc())
-        ).all()
+def _load_cases(session: Session, mode: CaseMode) -> List[Case]:
+    records = session.scalars(
+        select(CaseRecord)
+        .where(CaseRecord.mode == mode)
+        .order_by(CaseRecord.priority_score.desc(), CaseRecord.updated_at.desc())
+    ).all()
     return [_record_to_case(record) for record in records]
 
 
-def find_case(case_id: str) -> Optional[Case]:
-    with session_scope() as session:
-        record = _find_case_record(session, case_id)
+def _count_cases(session: Session, mode: CaseMode) -> int:
+    return int(session.scalar(select(func.count()).select_from(CaseRecord).where(CaseRecord.mode == mode)) or 0)
+
+
+def _load_cases_token(session: Session, mode: CaseMode) -> Tuple[Optional[int], Optional[datetime]]:
+    # Cases are only ever replaced wholesale with fresh rows, so the newest pk and
+    # updated_at change on every write. Separate subqueries keep each one an index seek.
+    newest_pk = select(func.max(CaseRecord.pk)).where(CaseRecord.mode == mode).scalar_subquery()
+    newest_at = select(func.max(CaseRecord.updated_at)).where(CaseRecord.mode == mode).scalar_subquery()
+    pk, updated_at = session.execute(select(newest_pk, newest_at)).one()
+    return pk, updated_at
+
+
+def _load_case(session: Session, case_id: str) -> Optional[Case]:
+    record = _find_case_record(session, case_id)
     return _record_to_case(record) if record is not None else None
 
 
-def create_or_update_work_order(
+def _upsert_work_order(
+    session: Session,
     case_id: str,
     assigned_team: str,
     due_at: datetime,
-    state: WorkOrderState = "created",
+    state: WorkOrderState,
 ) -> WorkOrder:
-    with session_scope() as session:
-        record = session.scalar(select(WorkOrderRecord).where(WorkOrderRecord.case_id == case_id))
-
-        if record is None:
-            record = WorkOrderRecord(
-                id=_next_work_order_id(session),
-                case_id=case_id,
-                assigned_team=assigned_team,
-                due_at=_ensure_tz(due_at),
-                state=state,
-            )
-            session.add(record)
-        else:
-            record.assigned_team = assigned_team
-            record.due_at = _ensure_tz(due_at)
-            record.state = state
+    record = session.scalar(select(WorkOrderRecord).where(WorkOrderRecord.case_id == case_id))
+
+    if record is None:
+        record = WorkOrderRecord(
+            id=_work_order_id(case_id),
+            case_id=case_id,
+            assigned_team=assigned_team,
+            due_at=_ensure_tz(due_at),
+            state=state,
+        )
+        session.add(record)
+    else:
+        record.assigned_team = assigned_team
+        record.due_at = _ensure_tz(due_at)
+        record.state = state
 
-        session.flush()
-        session.refresh(record)
-        return _record_to_work_order(record)
+    session.flush()
+    return _record_to_work_order(record)
 
 
-def complete_verification(
+def _record_verification(
+    session: Session,
+    shard: Shard,
     case_id: str,
     result: VerificationResult,
     notes: Optional[str],
 ) -> VerificationTask:
-    with session_scope() as session:
-        record = session.scalar(
-            select(VerificationTaskRecord).where(VerificationTaskRecord.case_id == case_id)
+    record = session.scalar(select(VerificationTaskRecord).where(VerificationTaskRecord.case_id == case_id))
+
+    if record is None:
+        case_record = _find_case_record(session, case_id)
+        charger_id = case_record.charger_id if case_record is not None else case_id
+        record = VerificationTaskRecord(
+            id=_next_verification_task_id(session, shard),
+            case_id=case_id,
+            question=f"Is charger {charger_id} physically offline?",
+            owner="FieldOps",
+            status="open",
+            result=None,
         )
+        session.add(record)
+        session.flush()
 
-        if record is None:
-            case_record = _find_case_record(session, case_id)
-            charger_id = case_record.charger_id if case_record is not None else case_id
-            record = VerificationTaskRecord(
-                id=_next_verification_task_id(session),
-                case_id=case_id,
-                question=f"Is charger {charger_id} physically offline?",
-                owner="FieldOps",
-                status="open",
-                result=None,
-            )
-            session.add(record)
-            session.flush()
-
-        record.status = "done"
-        record.result = result
+    record.status = "done"
+    record.result = result
 
-        session.add(
-            VerificationOutcomeRecord(
-                case_id=case_id,
-                result=result,
-                notes=notes,
-                timestamp=_utc_now(),
-            )
+    session.add(
+        VerificationOutcomeRecord(
+            case_id=case_id,
+            result=result,
+            notes=notes,
+            timestamp=_utc_now(),
         )
+    )
 
-        session.flush()
-        session.refresh(record)
-        return _record_to_verification_task(record)
+    session.flush()
+    return _record_to_verification_task(record)
 
 
-def get_work_orders_map() -> Dict[str, WorkOrder]:
-    with session_scope() as session:
-        records = session.scalars(select(WorkOrderRecord)).all()
-    return {record.case_id: _record_to_work_order(record) for record in records}
+def _load_work_orders(session: Session) -> List[WorkOrder]:
+    return [_record_to_work_order(record) for record in session.scalars(select(WorkOrderRecord))]
 
 
-def get_verification_tasks_map() -> Dict[str, VerificationTask]:
-    with session_scope() as session:
-        records = session.scalars(select(VerificationTaskRecord)).all()
-    return {record.case_id: _record_to_verification_task(record) for record in records}
+def _load_verification_tasks(session: Session) -> List[VerificationTask]:
+    return [_record_to_verification_task(record) for record in session.scalars(select(VerificationTaskRecord))]
 
 
-def get_verification_outcomes() -> List[VerificationOutcome]:
-    with session_scope() as session:
-        records = session.scalars(
-            select(VerificationOutcomeRecord).order_by(VerificationOutcomeRecord.id.asc())
-        ).all()
+def _load_verification_outcomes(session: Session) -> List[VerificationOutcome]:
+    records = session.scalars(select(VerificationOutcomeRecord).order_by(VerificationOutcomeRecord.id.asc()))
     return [
         {
             "case_id": record.case_id,
@@ -296,3 +412,139 @@ def get_verification_outcomes() -> List[VerificationOutcome]:
         for record in records
     ]
 
+
+def _merge_cases(parts: Sequence[List[Case]]) -> List[Case]:
+    return list(merge(*parts, key=lambda case: -case.priority_score))
+
+
+def _merge_outcomes(parts: Sequence[List[VerificationOutcome]]) -> List[VerificationOutcome]:
+    return list(merge(*parts, key=lambda outcome: outcome["timestamp"]))
+
+
+def set_signals(items: Sequence[Signal]) -> None:
+    """Upsert incoming triage signals for traceability."""
+    parts = partition(items, lambda signal: shard_for_charger(signal.charger_id))
+
+    def upsert(shard: Shard) -> None:
+        with session_scope(shard) as session:
+            _upsert_signals(session, parts[shard])
+
+    fan_out(upsert, list(parts))
+
+
+def get_signals() -> List[Signal]:
+    def load(shard: Shard) -> List[Signal]:
+        return run_readonly(_load_signals, shard)
+
+    return list(merge(*fan_out(load), key=lambda signal: (signal.timestamp, signal.id)))
+
+
+def get_signal_contents(ids: Sequence[str]) -> List[SignalContent]:
+    """Stored content of the signals among ``ids``, in no particular order."""
+
+    def load(shard: Shard) -> List[SignalContent]:
+        return run_readonly(lambda session: _load_signal_contents(session, ids), shard)
+
+    return [signal for part in fan_out(load) for signal in part]
+
+
+def iter_signal_ids(batch_size: int = 10_000) -> Iterator[str]:
+    """Stream every stored signal id, shard by shard."""
+    for shard in all_shards():
+        with session_scope(shard, readonly=True) as session:
+            yield from session.scalars(select(SignalRecord.id).execution_options(yield_per=batch_size))
+
+
+def set_baseline_cases(cases: Sequence[Case]) -> None:
+    parts = partition(cases, _case_shard)
+
+    # Every shard is rewritten so cases that moved or disappeared do not linger.
+    def replace(shard: Shard) -> None:
+        with session_scope(shard) as session:
+            _replace_baseline_cases(session, parts.get(shard, []))
+            if shard is None:
+                _clear_demo_seed_marker(session)
+
+    fan_out(replace)
+
+
+def set_certainty_cases(cases: Sequence[Case], tasks: Sequence[VerificationTask]) -> None:
+    case_parts = partition(cases, _case_shard)
+    task_parts = partition(tasks, lambda task: shard_for_case(task.case_id))
+
+    def replace(shard: Shard) -> None:
+        with session_scope(shard) as session:
+            _replace_certainty_cases(session, case_parts.get(shard, []), task_parts.get(shard, []))
+            if shard is None:
+                _clear_demo_seed_marker(session)
+
+    fan_out(replace)
+
+
+def get_cases(mode: CaseMode) -> List[Case]:
+    def load(shard: Shard) -> List[Case]:
+        return run_readonly(lambda session: _load_cases(session, mode), shard)
+
+    return _merge_cases(fan_out(load))
+
+
+def count_cases(mode: CaseMode) -> int:
+    def count(shard: Shard) -> int:
+        return run_readonly(lambda session: _count_cases(session, mode), shard)
+
+    return sum(fan_out(count))
+
+
+def cases_token(mode: CaseMode) -> Tuple[Tuple[Optional[int], Optional[datetime]], ...]:
+    """Cheap fingerprint of the stored ``mode`` cases; it changes whenever they are rewritten."""
+
+    def load(shard: Shard) -> Tuple[Optional[int], Optional[datetime]]:
+        return run_readonly(lambda session: _load_cases_token(session, mode), shard)
+
+    return tuple(fan_out(load))
+
+
+def find_case(case_id: str) -> Optional[Case]:
+    return run_readonly(lambda session: _load_case(session, case_id), shard_for_case(case_id))
+
+
+def create_or_update_work_order(
+    case_id: str,
+    assigned_team: str,
+    due_at: datetime,
+    state: WorkOrderState = "created",
+) -> WorkOrder:
+    shard = shard_for_case(case_id)
+    with session_scope(shard) as session:
+        return _upsert_work_order(session, case_id, assigned_team, due_at, state)
+
+
+def complete_verification(
+    case_id: str,
+    result: VerificationResult,
+    notes: Optional[str],
+) -> VerificationTask:
+    shard = shard_for_case(case_id)
+    with session_scope(shard) as session:
+        return _record_verification(session, shard, case_id, result, notes)
+
+
+def get_work_orders_map() -> Dict[str, WorkOrder]:
+    def load(shard: Shard) -> List[WorkOrder]:
+        return run_readonly(_load_work_orders, shard)
+
+    return {work_order.case_id: work_order for part in fan_out(load) for work_order in part}
+
+
+def get_verification_tasks_map() -> Dict[str, VerificationTask]:
+    def load(shard: Shard) -> List[VerificationTask]:
+        return run_readonly(_load_verification_tasks, shard)
+
+    return {task.case_id: task for part in fan_out(load) for task in part}
+
+
+def get_verification_outcomes() -> List[VerificationOutcome]:
+    def load(shard: Shard) -> List[VerificationOutcome]:
+        return run_readonly(_load_verification_outcomes, shard)
+
+    return _merge_outcomes(fan_out(load))
@@ -0,0 +1,75 @@
+"""Fixtures shared across test modules."""
+
+from __future__ import annotations
+
+import pytest
+
+from app import store
+from app.models import Case, VerificationTask
+
+
+@pytest.fixture
+def case_lifecycle_state() -> None:
+    """Seed one baseline and two certainty cases, with an open verification task for the second."""
+    store.reset_store()
+    store.set_baseline_cases(
+        [
+            Case(
+                id="case_baseline_001",
+                charger_id="AUS_0123",
+                priority_score=92,
+                sla_hours=4,
+                root_cause_tag="connector",
+                confidence=0.84,
+                recommended_action="dispatch_field_tech",
+                evidence_ids=["sig_001"],
+                grid_stress_level="high",
+                explanation="Repeated hard-down signal.",
+                uncertainty_reasons=[],
+                verification_required=False,
+            )
+        ]
+    )
+    store.set_certainty_cases(
+        [
+            Case(
+                id="case_certainty_001",
+                charger_id="AUS_0123",
+                priority_score=92,
+                sla_hours=4,
+                root_cause_tag="connector",
+                confidence=0.91,
+                recommended_action="dispatch_field_tech",
+                evidence_ids=["sig_001"],
+                grid_stress_level="high",
+                explanation="High confidence physical connector issue.",
+                uncertainty_reasons=[],
+                verification_required=False,
+            ),
+            Case(
+                id="case_certainty_002",
+                charger_id="AUS_0144",
+                priority_score=71,
+                sla_hours=8,
+                root_cause_tag="network",
+                confidence=0.45,
+                recommended_action="needs_verification",
+                evidence_ids=["sig_011"],
+                grid_stress_level="elevated",
+                explanation="Conflicting network telemetry; verify before dispatch.",
+                uncertainty_reasons=["signal_conflict"],
+                verification_required=True,
+            ),
+        ],
+        [
+            VerificationTask(
+                id="ver_001",
+                case_id="case_certainty_002",
+                question="Is charger AUS_0144 physically offline?",
+                owner="FieldOps",
+                status="open",
+                result=None,
+            )
+        ],
+    )
+
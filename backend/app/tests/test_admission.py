@@ -0,0 +1,97 @@
+"""Tests for admission control budgets and backpressure responses."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.admission import (
+    READ_BUDGET,
+    TRIAGE_BUDGET,
+    AdmissionBudget,
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+    BudgetConfig,
+)
+
+
+def test_budget_queues_then_rejects_when_full() -> None:
+    async def scenario() -> None:
+        budget = AdmissionBudget("triage", BudgetConfig(max_concurrent=1, max_queue=1, queue_timeout_s=1.0))
+        await budget.acquire()
+
+        queued = asyncio.ensure_future(budget.acquire())
+        await asyncio.sleep(0)
+        assert budget.snapshot()["queued"] == 1
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await budget.acquire()
+        assert rejected.value.status_code == 429
+
+        budget.release()
+        await asyncio.wait_for(queued, timeout=1.0)
+        snapshot = budget.snapshot()
+        assert snapshot["active"] == 1
+        assert snapshot["queued"] == 0
+        budget.release()
+        assert budget.snapshot()["active"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_budget_times_out_queued_request_with_503() -> None:
+    async def scenario() -> None:
+        budget = AdmissionBudget("reads", BudgetConfig(max_concurrent=1, max_queue=4, queue_timeout_s=0.01))
+        await budget.acquire()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await budget.acquire()
+        assert rejected.value.status_code == 503
+        assert budget.snapshot()["queued"] == 0
+        assert budget.snapshot()["rejected_timeout"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_middleware_returns_envelope_with_retry_after() -> None:
+    controller = AdmissionController(
+        {
+            TRIAGE_BUDGET: AdmissionBudget(
+                TRIAGE_BUDGET, BudgetConfig(max_concurrent=0, max_queue=0, queue_timeout_s=3.0)
+            ),
+            READ_BUDGET: AdmissionBudget(
+                READ_BUDGET, BudgetConfig(max_concurrent=4, max_queue=4, queue_timeout_s=1.0)
+            ),
+        }
+    )
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+
+    @app.post("/api/triage/baseline")
+    def triage() -> dict:
+        return {"ok": True}
+
+    @app.get("/api/cases")
+    def cases() -> dict:
+        return {"ok": True}
+
+    client = TestClient(app)
+    rejected = client.post("/api/triage/baseline")
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "3"
+    assert rejected.json() == {"ok": False, "data": None, "error": "triage queue is full; retry later"}
+
+    assert client.get("/api/cases").status_code == 200
+    assert controller.snapshot()[READ_BUDGET]["active"] == 0
+
+
+def test_dashboard_reads_share_the_read_budget() -> None:
+    controller = AdmissionController.from_env()
+
+    for path in ("/api/cases", "/api/cases/clusters", "/api/metrics/compare"):
+        assert controller.classify("GET", path) is controller.budgets[READ_BUDGET]
+    assert controller.classify("GET", "/api/cases/case_0001") is None
+    assert controller.classify("POST", "/api/triage/certainty") is controller.budgets[TRIAGE_BUDGET]
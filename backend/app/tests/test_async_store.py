@@ -0,0 +1,113 @@
+"""Async store, async route and CPU offload tests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app import async_store, store
+from app.db import session as db_session
+from app.main import app
+from app.models import DispatchRequest, VerifyRequest
+from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+from app.services import case_service
+from app.services.metrics_service import compare_metrics, compare_metrics_async
+from app.services.singleflight import SingleFlight
+
+DUE_AT = datetime(2026, 2, 21, 4, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.usefixtures("case_lifecycle_state")
+def test_async_reads_match_the_sync_store() -> None:
+    async def read() -> tuple:
+        return (
+            await async_store.get_cases("certainty"),
+            await async_store.find_case("case_certainty_001"),
+            await async_store.get_verification_tasks_map(),
+            await compare_metrics_async(),
+        )
+
+    cases, case, tasks, metrics = asyncio.run(read())
+    assert cases == store.get_cases("certainty")
+    assert case == store.find_case("case_certainty_001")
+    assert tasks == store.get_verification_tasks_map()
+    assert metrics == compare_metrics()
+
+
+@pytest.mark.usefixtures("case_lifecycle_state")
+def test_in_memory_database_reads_go_through_the_sync_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(db_session, "DATABASE_URL", "sqlite+pysqlite://")
+    assert async_store._routed()
+
+    assert asyncio.run(async_store.get_cases("certainty")) == store.get_cases("certainty")
+
+
+@pytest.mark.usefixtures("case_lifecycle_state")
+def test_async_case_writes_match_the_sync_semantics() -> None:
+    async def write() -> tuple:
+        request = DispatchRequest(assigned_team="FieldOps", due_at=DUE_AT)
+        first = await case_service.dispatch_case_async("case_certainty_001", request)
+        second = await case_service.dispatch_case_async(
+            "case_certainty_001", DispatchRequest(assigned_team="FieldOps", due_at=DUE_AT, state="in_progress")
+        )
+        verified = await case_service.verify_case_async("case_certainty_002", VerifyRequest(result="false_alarm"))
+        return first, second, verified
+
+    first, second, verified = asyncio.run(write())
+    assert first.work_order.id == second.work_order.id
+    assert store.get_work_orders_map()["case_certainty_001"].state == "in_progress"
+    assert verified.verification_task.status == "done"
+    assert store.get_verification_outcomes()[-1]["case_id"] == "case_certainty_002"
+
+
+def test_do_async_shares_one_computation() -> None:
+    flight = SingleFlight()
+    executions = 0
+
+    async def slow() -> int:
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def run() -> list:
+        return await asyncio.gather(*(flight.do_async("key", slow) for _ in range(5)))
+
+    assert asyncio.run(run()) == [42] * 5
+    assert executions == 1
+    assert flight.stats()["key"] == {"calls": 5, "executions": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_triage_scoring_does_not_stall_the_event_loop() -> None:
+    store.reset_store()
+    payload = {"signals": list(generate_signal_rows(WorkloadConfig(signals=4000, chargers=4000, seed=3)))}
+
+    async def run() -> tuple:
+        lags: list = []
+        finished = asyncio.Event()
+
+        async def ticker() -> None:
+            while not finished.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.005)
+                lags.append(time.perf_counter() - started - 0.005)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            ticking = asyncio.create_task(ticker())
+            started = time.perf_counter()
+            response = await client.post("/api/triage/certainty", json=payload)
+            elapsed = time.perf_counter() - started
+            finished.set()
+            await ticking
+        return response, elapsed, lags
+
+    response, elapsed, lags = asyncio.run(run())
+    assert response.status_code == 200
+    assert len(response.json()["data"]["cases"]) == store.count_cases("certainty")
+    # The loop keeps ticking while triage runs; a blocked loop would stall for most of the request.
+    assert len(lags) > 10
+    assert max(lags) < elapsed / 2
@@ -0,0 +1,77 @@
+"""Resumable backfill CLI tests."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from app import store
+from app.seed_data import backfill as backfill_module
+from app.seed_data.backfill import Checkpoint, backfill
+from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+
+
+def _write_inputs(tmp_path: Path) -> tuple[Path, Path, list[dict]]:
+    rows = list(generate_signal_rows(WorkloadConfig(signals=120, chargers=12, seed=9)))
+    csv_path = tmp_path / "history.csv"
+    with csv_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows[:60])
+        writer.writerow({**rows[0], "id": "sig_bad", "status": "exploded"})
+    ndjson_path = tmp_path / "history.ndjson"
+    lines = [json.dumps(row) for row in rows[60:]]
+    lines.insert(5, "{not json")
+    ndjson_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return csv_path, ndjson_path, rows
+
+
+def test_backfill_loads_csv_and_ndjson_and_skips_finished_files(tmp_path: Path) -> None:
+    store.reset_store()
+    csv_path, ndjson_path, rows = _write_inputs(tmp_path)
+    checkpoint = tmp_path / "checkpoint.json"
+    rejects = tmp_path / "rejects.ndjson"
+
+    summary = backfill([csv_path, ndjson_path], checkpoint, chunk_size=25, workers=2, rejects_path=rejects, triage=True)
+
+    assert summary.rows_written == 120
+    assert summary.rejected == 2
+    assert {signal.id for signal in store.get_signals()} == {row["id"] for row in rows}
+    assert summary.triage is not None and summary.triage["certainty_cases"] == 12
+    assert store.count_cases("certainty") == 12
+    assert [json.loads(line)["record"] for line in rejects.read_text().splitlines()] == [61, 6]
+    assert all(progress.done for progress in Checkpoint.load(checkpoint).files.values())
+
+    again = backfill([csv_path, ndjson_path], checkpoint, chunk_size=25)
+    assert again.records_read == 0
+
+
+def test_backfill_resumes_after_interruption(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store.reset_store()
+    _, ndjson_path, rows = _write_inputs(tmp_path)
+    checkpoint = tmp_path / "checkpoint.json"
+    real_upsert = backfill_module.upsert_signal_rows
+    calls = {"count": 0}
+
+    def failing_upsert(session, chunk_rows):
+        calls["count"] += 1
+        if calls["count"] == 3:
+            raise RuntimeError("connection lost")
+        real_upsert(session, chunk_rows)
+
+    monkeypatch.setattr(backfill_module, "upsert_signal_rows", failing_upsert)
+    with pytest.raises(RuntimeError):
+        backfill([ndjson_path], checkpoint, chunk_size=20)
+    (progress,) = Checkpoint.load(checkpoint).files.values()
+    assert progress.records_done == 40
+    assert not progress.done
+
+    monkeypatch.setattr(backfill_module, "upsert_signal_rows", real_upsert)
+    resumed = backfill([ndjson_path], checkpoint, chunk_size=20)
+
+    assert resumed.resumed_records == 40
+    assert resumed.records_read == 21
+    assert len(store.get_signals()) == 60
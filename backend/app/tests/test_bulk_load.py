@@ -0,0 +1,79 @@
+"""Bulk seed loader parity and statement-count tests."""
+
+from __future__ import annotations
+
+import io
+import json
+
+from app import store
+from app.db.query_stats import assert_query_budget
+from app.models import Signal
+from app.seed_data.bulk_load import _iter_json_array, bulk_load
+from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+
+
+def _state() -> dict:
+    return {
+        "baseline": [case.model_dump() for case in store.get_cases("baseline")],
+        "certainty": [case.model_dump() for case in store.get_cases("certainty")],
+        "tasks": {case_id: task.model_dump() for case_id, task in store.get_verification_tasks_map().items()},
+        "outcomes": [
+            {key: value for key, value in outcome.items() if key != "timestamp"}
+            for outcome in store.get_verification_outcomes()
+        ],
+    }
+
+
+def test_json_array_stream_matches_json_load_across_chunk_boundaries() -> None:
+    rows = [
+        {"id": "a", "text": "bracket ] and comma , inside", "lat": 30.25},
+        {"id": "b", "nested": {"values": [1, 2, 3]}, "flag": True},
+        {"id": "c", "text": "unicode é and escaped \\\" quote"},
+    ]
+    raw = json.dumps(rows, indent=2)
+
+    for chunk_size in (1, 7, 64, 1 << 16):
+        assert list(_iter_json_array(io.StringIO(raw), chunk_size=chunk_size)) == rows
+    assert list(_iter_json_array(io.StringIO("  []  "))) == []
+
+
+def test_bulk_load_matches_row_by_row_load() -> None:
+    rows = list(generate_signal_rows(WorkloadConfig(signals=400, chargers=40, seed=11)))
+    signals = [Signal.model_validate(row) for row in rows]
+    certainty_cases, _ = run_certainty_triage(signals)
+    outcome_rows = [
+        {"case_id": certainty_cases[0].id, "result": "confirmed_issue", "notes": "first"},
+        {"case_id": certainty_cases[1].id, "result": "false_alarm", "notes": None},
+        {"case_id": certainty_cases[0].id, "result": "needs_more_data", "notes": "again"},
+        {"case_id": "case_unknown", "result": "confirmed_issue", "notes": "no case"},
+        {"case_id": certainty_cases[2].id, "result": "not_a_result", "notes": "skipped"},
+    ]
+
+    store.reset_store()
+    store.set_signals(signals)
+    store.set_baseline_cases(run_baseline_triage(signals))
+    store.set_certainty_cases(*run_certainty_triage(signals))
+    for row in outcome_rows:
+        if row["result"] in {"confirmed_issue", "false_alarm", "needs_more_data"}:
+            store.complete_verification(row["case_id"], row["result"], row["notes"])
+    expected = _state()
+
+    summary = bulk_load(rows + rows[:3], outcome_rows, batch_size=64)
+
+    assert _state() == expected
+    assert summary["signals"] == 400
+    assert summary["duplicate_signals"] == 3
+    assert summary["verification_outcomes"] == 4
+
+
+def test_bulk_load_uses_batched_statements() -> None:
+    rows = list(generate_signal_rows(WorkloadConfig(signals=1_200, chargers=120, seed=5)))
+    outcomes = [{"case_id": f"case_missing_{index}", "result": "false_alarm"} for index in range(50)]
+
+    # 6 deletes, 3 signal batches, then one insert each for both case modes, tasks and outcomes.
+    with assert_query_budget(13):
+        bulk_load(rows, outcomes, batch_size=500)
+
+    assert len(store.get_verification_outcomes()) == 50
@@ -0,0 +1,78 @@
+"""Multi-zoom case clustering tests."""
+
+from __future__ import annotations
+
+import random
+
+from fastapi.testclient import TestClient
+
+from app import store
+from app.clustering import CLUSTER_EXTENT_PX, CLUSTER_MAX_ZOOM, CLUSTER_RADIUS_PX, ClusterIndex
+from app.main import app
+from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+from app.spatial import WORLD, BBox
+
+
+def _viewport(lon: float, lat: float, zoom: int, width_px: int = 1024, height_px: int = 768) -> BBox:
+    """Approximate lon/lat box of a ``width_px`` x ``height_px`` map centred on (lon, lat)."""
+    deg_per_px = 360.0 / (256 * 2**zoom)
+    half_w, half_h = width_px * deg_per_px / 2, height_px * deg_per_px / 2
+    return BBox(
+        max(-180.0, lon - half_w), max(-90.0, lat - half_h), min(180.0, lon + half_w), min(90.0, lat + half_h)
+    )
+
+
+def test_every_zoom_accounts_for_every_point() -> None:
+    rng = random.Random(3)
+    points = [(rng.gauss(-97.74, 0.05), rng.gauss(30.27, 0.05), rng.randint(0, 100)) for _ in range(2000)]
+    index = ClusterIndex(points)
+    top = max(priority for _, _, priority in points)
+
+    for zoom in range(CLUSTER_MAX_ZOOM + 2):
+        clusters = index.clusters(zoom, WORLD)
+        assert sum(cluster.count for cluster in clusters) == len(points)
+        assert max(cluster.max_priority for cluster in clusters) == top
+        for cluster in clusters:
+            assert (cluster.leaf is None) == (cluster.count > 1)
+            if cluster.expansion_zoom is not None:
+                assert cluster.expansion_zoom > zoom
+
+    assert len(index.clusters(0, WORLD)) == 1
+    assert sorted(cluster.leaf for cluster in index.clusters(CLUSTER_MAX_ZOOM + 1, WORLD)) == list(range(len(points)))
+
+
+def test_viewport_responses_stay_small_at_every_zoom() -> None:
+    rng = random.Random(4)
+    points = [(rng.gauss(-97.74, 0.03), rng.gauss(30.27, 0.03), rng.randint(0, 100)) for _ in range(20_000)]
+    index = ClusterIndex(points)
+
+    # Seeds are at least one cluster radius apart: 60 px on 512 px tiles is 30 screen px.
+    radius_px = CLUSTER_RADIUS_PX * 256 / CLUSTER_EXTENT_PX
+    limit = 1024 * 768 / radius_px**2
+    for zoom in range(CLUSTER_MAX_ZOOM + 2):
+        assert len(index.clusters(zoom, _viewport(-97.74, 30.27, zoom))) <= limit
+
+
+def test_clusters_endpoint_follows_triage_posts() -> None:
+    store.reset_store()
+    client = TestClient(app)
+    payload = {"signals": list(generate_signal_rows(WorkloadConfig(signals=300, chargers=60, seed=9)))}
+    cases = client.post("/api/triage/certainty", json=payload).json()["data"]["cases"]
+
+    response = client.get("/api/cases/clusters", params={"zoom": 2})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["mode"] == "certainty"
+    assert [(cluster["count"], cluster["max_priority_score"]) for cluster in data["clusters"]] == [
+        (len(cases), max(case["priority_score"] for case in cases))
+    ]
+    assert data["clusters"][0]["expansion_zoom"] is not None
+
+    data = client.get("/api/cases/clusters", params={"zoom": 30, "bbox": "-98,30,-97,31"}).json()["data"]
+    assert data["zoom"] == CLUSTER_MAX_ZOOM + 1
+    assert sorted(cluster["case_id"] for cluster in data["clusters"]) == sorted(case["id"] for case in cases)
+
+    for params in ({"zoom": -1}, {"zoom": 5, "bbox": "1,2,3"}, {"zoom": 5, "mode": "other"}):
+        response = client.get("/api/cases/clusters", params=params)
+        assert response.status_code == 400
+        assert response.json()["ok"] is False
@@ -0,0 +1,124 @@
+"""Area-wide outage correlation tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app import store
+from app.main import app
+from app.models import Signal
+from app.scoring import group_signals_by_charger
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+from app.triage.correlation import detect_outages, incidents_from_cases, link_incidents
+
+BASE_TS = datetime(2026, 2, 20, 20, 0, tzinfo=timezone.utc)
+
+
+def _signal(
+    charger_id: str, lat: float, lon: float, minute: float, status: str = "down", source: str = "charger_api"
+) -> Signal:
+    return Signal(
+        id=f"sig_{charger_id}_{source}_{minute}",
+        source=source,
+        timestamp=BASE_TS + timedelta(minutes=minute),
+        charger_id=charger_id,
+        lat=lat,
+        lon=lon,
+        status=status,
+        text="charger offline" if status == "down" else "charging fine",
+    )
+
+
+def _feeder_outage(chargers: int = 8, start_minute: float = 0.0) -> list[Signal]:
+    """``chargers`` chargers a few hundred metres apart that drop within three minutes, each confirmed by a 311 call."""
+    signals: list[Signal] = []
+    for index in range(chargers):
+        charger_id = f"AUS_{index + 1:04d}"
+        lat, lon = 30.2672 + 0.001 * (index % 3), -97.7431 + 0.001 * (index // 3)
+        signals.append(_signal(charger_id, lat, lon, minute=start_minute + index * 0.4))
+        signals.append(_signal(charger_id, lat, lon, minute=start_minute + index * 0.4 + 5, source="311"))
+    return signals
+
+
+def _scattered_noise() -> list[Signal]:
+    """Isolated faults across town at unrelated times."""
+    return [
+        _signal(f"AUS_{900 + index:04d}", 30.20 + 0.03 * index, -97.80 + 0.04 * index, minute=index * 47)
+        for index in range(6)
+    ]
+
+
+def test_feeder_outage_becomes_one_incident_with_one_dispatch() -> None:
+    signals = _feeder_outage() + _scattered_noise()
+    cases, _ = run_certainty_triage(signals)
+
+    members = [case for case in cases if case.incident_id is not None]
+    assert len(members) == 8
+    assert len({case.incident_id for case in members}) == 1
+    assert [case.recommended_action for case in members].count("dispatch_field_tech") == 1
+    assert all(case.recommended_action == "covered_by_incident" for case in members[1:])
+    assert members[0].recommended_action == "dispatch_field_tech"
+
+    (incident,) = incidents_from_cases(cases)
+    assert incident.primary_case_id == members[0].id
+    assert incident.suppressed_dispatches == 7
+    assert incident.id == f"inc_{members[0].id[5:]}_20260220T2000"
+    assert all(case.incident_id is None for case in cases if case.charger_id >= "AUS_0900")
+
+
+def test_recovered_and_staggered_chargers_are_not_grouped() -> None:
+    signals = _feeder_outage(4)
+    # Two neighbours went down with the feeder but are back online.
+    for charger_id in ("AUS_0005", "AUS_0006"):
+        signals.append(_signal(charger_id, 30.2672, -97.7401, minute=1))
+        signals.append(_signal(charger_id, 30.2672, -97.7401, minute=30, status="online"))
+    # Another neighbour failed hours later, independently.
+    signals.append(_signal("AUS_0007", 30.2675, -97.7425, minute=240))
+
+    assert detect_outages(group_signals_by_charger(signals)) == []
+
+
+def test_outage_across_an_onset_window_boundary_is_one_incident() -> None:
+    # Onsets from 19:58:30 to 20:01:18 fall on both sides of the 20:00 window edge.
+    (outage,) = detect_outages(group_signals_by_charger(_feeder_outage(start_minute=-1.5)))
+    assert len(outage.charger_ids) == 8
+
+
+def test_primary_is_the_top_member_that_dispatches() -> None:
+    signals = _feeder_outage()
+    cases = run_baseline_triage(signals)
+    assert all(case.recommended_action == "dispatch_field_tech" for case in cases)
+    # The highest-priority member still needs a site check before anyone is sent.
+    cases[0] = cases[0].model_copy(update={"recommended_action": "needs_verification", "confidence": 0.31})
+    outages = detect_outages(group_signals_by_charger(signals))
+
+    linked = link_incidents(cases, outages)
+    actions = [case.recommended_action for case in linked]
+    assert actions[:2] == ["needs_verification", "dispatch_field_tech"]
+    assert actions.count("covered_by_incident") == 6
+    (incident,) = incidents_from_cases(linked)
+    assert incident.primary_case_id == linked[1].id
+    assert incident.suppressed_dispatches == 6
+
+    # Without any dispatching member nothing is consolidated.
+    unverified = [case.model_copy(update={"recommended_action": "needs_verification"}) for case in cases]
+    assert link_incidents(unverified, outages) == unverified
+
+
+def test_certainty_triage_response_lists_incidents_and_persists_links() -> None:
+    store.reset_store()
+    client = TestClient(app)
+    payload = {"signals": [signal.model_dump(mode="json") for signal in _feeder_outage() + _scattered_noise()]}
+
+    data = client.post("/api/triage/certainty", json=payload).json()["data"]
+    (incident,) = data["incidents"]
+    assert len(incident["case_ids"]) == 8
+    assert incident["suppressed_dispatches"] == 7
+
+    case = store.find_case(incident["case_ids"][-1])
+    assert case is not None
+    assert case.incident_id == incident["id"]
+    assert case.recommended_action == "covered_by_incident"
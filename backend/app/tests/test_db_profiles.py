@@ -0,0 +1,60 @@
+"""Storage profile and connection pool telemetry tests."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.db.pool_stats import InstrumentedQueuePool, pool_snapshot
+from app.db.profiles import engine_options, install_profile, resolve_profile
+from app.main import app
+
+POSTGRES_URL = "postgresql+psycopg://ev:ev@localhost:5432/ev_grid_ops"
+
+
+def test_production_profile_follows_the_dialect() -> None:
+    assert resolve_profile("production", "sqlite:///./x.db").name == "sqlite_wal"
+    assert resolve_profile("production", POSTGRES_URL).name == "postgres"
+
+    with pytest.raises(ValueError, match="is for sqlite"):
+        resolve_profile("sqlite_wal", POSTGRES_URL)
+    with pytest.raises(ValueError, match="unknown DB_PROFILE"):
+        resolve_profile("turbo", "sqlite:///./x.db")
+
+
+def test_sqlite_wal_profile_sets_pragmas_on_every_connection(tmp_path) -> None:
+    url = f"sqlite:///{tmp_path / 'wal.db'}"
+    profile = resolve_profile("sqlite_wal", url)
+    engine = create_engine(url, **engine_options(profile, url))
+    install_profile(engine, profile)
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        assert pool_snapshot(engine)["checkouts"] == 1
+    finally:
+        engine.dispose()
+
+
+def test_postgres_profile_sends_server_timeouts() -> None:
+    options = engine_options(resolve_profile("postgres", POSTGRES_URL), POSTGRES_URL)
+
+    assert options["pool_size"] == 20 and options["pool_use_lifo"] is True
+    assert "-c statement_timeout=15000" in options["connect_args"]["options"]
+    assert "-c lock_timeout=5000" in options["connect_args"]["options"]
+
+
+def test_db_pool_endpoint_reports_the_primary_pool() -> None:
+    client = TestClient(app)
+    client.get("/api/cases", params={"mode": "certainty"})
+
+    response = client.get("/api/metrics/db-pool")
+
+    assert response.status_code == 200
+    primary = response.json()["data"]["pools"]["primary"]
+    assert primary["pool_class"] == "InstrumentedQueuePool"
+    assert primary["checkouts"] >= 1
+    assert {"checked_out", "overflow", "wait_ms_mean", "wait_ms_max", "timeouts"} <= set(primary)
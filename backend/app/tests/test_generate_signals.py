@@ -0,0 +1,51 @@
+"""Tests for the deterministic synthetic workload generator."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.seed_data.generate_signals import (
+    WorkloadConfig,
+    generate_signal_rows,
+    generate_signals,
+    write_signal_rows,
+)
+
+
+def test_same_seed_yields_identical_stream() -> None:
+    config = WorkloadConfig(signals=500, chargers=40, seed=7)
+    assert list(generate_signal_rows(config)) == list(generate_signal_rows(config))
+    assert list(generate_signal_rows(config)) != list(generate_signal_rows(WorkloadConfig(signals=500, chargers=40, seed=8)))
+
+
+def test_stream_is_time_ordered_valid_and_clustered_around_austin() -> None:
+    signals = list(generate_signals(WorkloadConfig(signals=2_000, chargers=100, seed=3)))
+
+    assert len(signals) == 2_000
+    assert len({signal.id for signal in signals}) == 2_000
+    assert all(a.timestamp <= b.timestamp for a, b in zip(signals, signals[1:]))
+    assert all(29.9 < signal.lat < 30.7 and -98.1 < signal.lon < -97.3 for signal in signals)
+    assert {signal.source for signal in signals} == {"charger_api", "311", "ugc"}
+    assert all(signal.charger_id.startswith("AUS_") for signal in signals)
+
+
+def test_flapping_rate_produces_status_transitions() -> None:
+    rows = list(generate_signal_rows(WorkloadConfig(signals=400, chargers=5, seed=1, flapping_rate=1.0, conflict_rate=0.0)))
+    by_charger: dict[str, list[str]] = {}
+    for row in rows:
+        by_charger.setdefault(row["charger_id"], []).append(row["status"])
+    assert any("online" in statuses and len(set(statuses)) > 1 for statuses in by_charger.values())
+
+
+def test_write_signal_rows_round_trips_json_and_ndjson(tmp_path: Path) -> None:
+    config = WorkloadConfig(signals=25, chargers=5)
+    expected = list(generate_signal_rows(config))
+
+    json_path = tmp_path / "signals.json"
+    assert write_signal_rows(generate_signal_rows(config), json_path) == 25
+    assert json.loads(json_path.read_text()) == expected
+
+    ndjson_path = tmp_path / "signals.ndjson"
+    write_signal_rows(generate_signal_rows(config), ndjson_path)
+    assert [json.loads(line) for line in ndjson_path.read_text().splitlines()] == expected
@@ -0,0 +1,100 @@
+"""Grid stress zone index, time-series lookup and provider tests."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.adapters.grid_stress_mock import FileGridStressProvider
+from app.grid_stress import GridStressSnapshot, GridZone, StressSeries, ZoneIndex, configure_grid_stress
+from app.models import Signal
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+
+BASE_TS = datetime(2026, 2, 20, 20, 0, tzinfo=timezone.utc)
+ZONES = [
+    {"zone": "WEST", "polygon": [[-98.0, 30.0], [-97.7, 30.0], [-97.75, 30.5], [-98.0, 30.5]]},
+    {"zone": "EAST", "polygon": [[-97.7, 30.0], [-97.4, 30.0], [-97.4, 30.5], [-97.75, 30.5]]},
+]
+
+
+class _FixedProvider:
+    def __init__(self, snapshot: GridStressSnapshot) -> None:
+        self._snapshot = snapshot
+
+    def snapshot(self) -> GridStressSnapshot:
+        return self._snapshot
+
+
+def _reading(zone: str, hours: float, level: str) -> dict:
+    return {"zone": zone, "timestamp": (BASE_TS + timedelta(hours=hours)).isoformat(), "stress_level": level}
+
+
+def test_zone_index_matches_a_scan_over_every_polygon() -> None:
+    rng = random.Random(8)
+    zones = [
+        GridZone(f"Z{i}", tuple((rng.uniform(-98, -97), rng.uniform(30, 31)) for _ in range(rng.randint(3, 7))))
+        for i in range(12)
+    ]
+    index = ZoneIndex(zones, cell_deg=0.1)
+    for _ in range(2000):
+        lon, lat = rng.uniform(-98.1, -96.9), rng.uniform(29.9, 31.1)
+        expected = next((zone.name for zone in zones if zone.contains(lon, lat)), None)
+        assert index.zone_at(lon, lat) == expected
+
+    # A point on the shared edge belongs to exactly one of the two zones.
+    shared = GridStressSnapshot.from_rows(ZONES, []).zones
+    assert shared.zone_at(-97.725, 30.25) in {"WEST", "EAST"}
+    assert [zone.name for zone in shared.zones if zone.contains(-97.725, 30.25)] == [shared.zone_at(-97.725, 30.25)]
+
+
+def test_series_returns_the_reading_in_effect() -> None:
+    series = StressSeries.from_readings([(30.0, "high"), (10.0, "normal"), (20.0, "elevated")])
+    assert series.level_at(5.0) is None
+    assert series.level_at(10.0) == "normal"
+    assert series.level_at(19.9) == "normal"
+    assert series.level_at(25.0) == "elevated"
+    assert series.level_at(1e12) == "high"
+
+
+def test_triage_reads_zone_stress_and_falls_back_outside_zones() -> None:
+    snapshot = GridStressSnapshot.from_rows(
+        ZONES,
+        [_reading("WEST", -1, "normal"), _reading("WEST", 0.5, "high"), _reading("EAST", -1, "elevated")],
+    )
+    configure_grid_stress(_FixedProvider(snapshot))
+    try:
+        signals = [
+            Signal(
+                id=f"sig_{charger_id}",
+                source="charger_api",
+                timestamp=BASE_TS + timedelta(hours=hours),
+                charger_id=charger_id,
+                lat=30.25,
+                lon=lon,
+                status="online",
+                text="charging fine",
+            )
+            for charger_id, lon, hours in (
+                ("AUS_0001", -97.9, 0),
+                ("AUS_0002", -97.9, 1),
+                ("AUS_0003", -97.5, 1),
+                ("AUS_0004", -96.0, 1),
+            )
+        ]
+        for cases in (run_baseline_triage(signals), run_certainty_triage(signals)[0]):
+            levels = {case.charger_id: case.grid_stress_level for case in cases}
+            # AUS_0004 is outside every zone: a quiet charger gets the severity estimate.
+            assert levels == {"AUS_0001": "normal", "AUS_0002": "high", "AUS_0003": "elevated", "AUS_0004": "normal"}
+    finally:
+        configure_grid_stress(None)
+
+
+def test_seed_files_cover_the_demo_timeline() -> None:
+    snapshot = FileGridStressProvider().snapshot()
+    evening_peak = BASE_TS + timedelta(hours=4)
+    assert snapshot.level_at(-97.7431, 30.2672, BASE_TS) == "elevated"
+    assert snapshot.level_at(-97.7431, 30.2672, evening_peak) == "high"
+    assert snapshot.level_at(-97.7253, 30.4021, evening_peak) == "elevated"
+    assert snapshot.level_at(-97.6664, 30.1975, BASE_TS - timedelta(hours=8)) == "normal"
+
@@ -0,0 +1,192 @@
+"""Live grid stress feed tests against a local HTTP stand-in."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from app.adapters.grid_stress_ercot_optional import CircuitBreaker, FeedGridStressProvider, http_fetcher
+from app.adapters.grid_stress_mock import FileGridStressProvider
+
+AT = datetime(2026, 2, 20, 20, 0, tzinfo=timezone.utc)
+DOWNTOWN = (-97.7431, 30.2672)
+ZONES = [{"zone": "AUSTIN_CENTRAL", "polygon": [[-97.8, 30.2], [-97.6, 30.2], [-97.6, 30.3], [-97.8, 30.3]]}]
+
+
+class FeedStandIn:
+    """Serves feed rows with a configurable delay and status code."""
+
+    def __init__(self) -> None:
+        self.delay_s = 0.0
+        self.status = 200
+        self.level = "normal"
+        self.requests = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                stand_in.requests += 1
+                time.sleep(stand_in.delay_s)
+                body = json.dumps(
+                    [{"zone": "AUSTIN_CENTRAL", "timestamp": "2026-02-20T00:00:00Z", "stress_level": stand_in.level}]
+                ).encode()
+                self.send_response(stand_in.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/grid-stress"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def feed() -> Iterator[FeedStandIn]:
+    stand_in = FeedStandIn()
+    yield stand_in
+    stand_in.server.shutdown()
+    stand_in.server.server_close()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _provider(feed: FeedStandIn, clock=time.monotonic, timeout_s: float = 1.0, **kwargs) -> FeedGridStressProvider:
+    return FeedGridStressProvider(
+        http_fetcher(feed.url, timeout_s=timeout_s), ZONES, fallback=FileGridStressProvider(), clock=clock, **kwargs
+    )
+
+
+def _wait_for(condition, timeout_s: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+def test_snapshot_serves_the_fallback_while_the_first_fetch_is_slow(feed: FeedStandIn) -> None:
+    feed.delay_s, feed.level = 0.5, "high"
+    provider = _provider(feed)
+
+    started = time.perf_counter()
+    snapshot = provider.snapshot()
+    assert time.perf_counter() - started < 0.05
+    # 20:00Z in the seed series: downtown is elevated.
+    assert snapshot.level_at(*DOWNTOWN, AT) == "elevated"
+
+    _wait_for(lambda: provider.stats()["serving"] == "feed")
+    assert provider.snapshot().level_at(*DOWNTOWN, AT) == "high"
+    assert feed.requests == 1
+
+
+def test_stale_reads_return_at_once_and_coalesce_into_one_refresh(feed: FeedStandIn) -> None:
+    clock = FakeClock()
+    provider = _provider(feed, clock=clock, ttl_s=60)
+    assert provider.refresh()
+
+    clock.now += 61
+    feed.delay_s, feed.level = 0.3, "high"
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(provider.snapshot().level_at(*DOWNTOWN, AT))) for _ in range(20)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.perf_counter() - started < 0.25
+    assert results == ["normal"] * 20
+
+    _wait_for(lambda: provider.snapshot().level_at(*DOWNTOWN, AT) == "high")
+    assert feed.requests == 2
+
+
+def test_timeouts_open_the_breaker_and_reads_fall_back(feed: FeedStandIn) -> None:
+    clock = FakeClock()
+    provider = _provider(
+        feed,
+        clock=clock,
+        timeout_s=0.3,
+        ttl_s=60,
+        max_stale_s=600,
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout_s=120, clock=clock),
+    )
+    feed.level = "high"
+    assert provider.refresh()
+
+    # Well past the timeout, so a loaded test run cannot turn the healthy fetches into timeouts.
+    feed.delay_s = 1.5
+    assert not provider.refresh()
+    assert not provider.refresh()
+    assert provider.breaker.state == "open"
+    assert not provider.refresh()
+    assert feed.requests == 3
+    # The last known levels are still served while they are not too old.
+    assert provider.snapshot().level_at(*DOWNTOWN, AT) == "high"
+
+    # Too old: the mock answers, and the stale read sends one probe that fails again.
+    feed.delay_s, feed.status = 0.0, 503
+    clock.now += 601
+    assert provider.snapshot().level_at(*DOWNTOWN, AT) == "elevated"
+    assert provider.stats()["serving"] == "fallback"
+    _wait_for(lambda: feed.requests == 4 and provider.breaker.state == "open")
+
+    feed.status, feed.level = 200, "normal"
+    clock.now += 120
+    assert provider.refresh()
+    assert provider.breaker.state == "closed"
+    assert provider.snapshot().level_at(*DOWNTOWN, AT) == "normal"
+
+
+def test_half_open_breaker_lets_one_probe_through() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=10, clock=clock)
+    breaker.record_failure()
+    assert not breaker.allow()
+    clock.now += 10
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now += 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_error_status_counts_as_a_failure(feed: FeedStandIn) -> None:
+    feed.status = 503
+    provider = _provider(feed, breaker=CircuitBreaker(failure_threshold=1, reset_timeout_s=60))
+    assert not provider.refresh()
+    assert provider.stats()["failures"] == 1
+    assert provider.breaker.state == "open"
+
+
+def test_background_refresher_polls_until_stopped(feed: FeedStandIn) -> None:
+    provider = _provider(feed, ttl_s=0.05)
+    provider.start()
+    try:
+        _wait_for(lambda: feed.requests >= 3)
+    finally:
+        provider.stop()
+    seen = feed.requests
+    time.sleep(0.15)
+    assert feed.requests == seen
@@ -0,0 +1,82 @@
+"""Seen-signal filter and idempotent triage ingestion tests."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app import store
+from app.main import app
+from app.models import Signal
+from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+from app.services.ingest_dedup import BloomFilter, SeenSignalFilter, seen_signals
+
+
+def _rows(signals: int = 300, chargers: int = 40) -> list[dict]:
+    return list(generate_signal_rows(WorkloadConfig(signals=signals, chargers=chargers, seed=12)))
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives() -> None:
+    bloom = BloomFilter(capacity=20_000, error_rate=0.01)
+    for index in range(20_000):
+        bloom.add(f"sig_{index}")
+    assert all(f"sig_{index}" in bloom for index in range(20_000))
+    false_positives = sum(f"other_{index}" in bloom for index in range(20_000))
+    assert false_positives / 20_000 < 0.02
+
+
+def test_filter_seeds_from_the_signals_table() -> None:
+    store.reset_store()
+    stored = [Signal.model_validate(row) for row in _rows()]
+    store.set_signals(stored)
+
+    plan = SeenSignalFilter().plan_sync(stored + [Signal.model_validate({**_rows(1)[0], "id": "sig_brand_new"})])
+    assert plan.repeats == len(stored)
+    assert [signal.id for signal in plan.new] == ["sig_brand_new"]
+    assert plan.changed == []
+
+
+def test_resent_batches_skip_writes_and_rescoring_until_content_changes() -> None:
+    store.reset_store()
+    client = TestClient(app)
+    rows = _rows()
+
+    first = client.post("/api/triage/certainty", json={"signals": rows}).json()["data"]
+    assert seen_signals.stats()["new"] == len(rows)
+
+    again = client.post("/api/triage/certainty", json={"signals": rows}).json()["data"]
+    stats = seen_signals.stats()
+    assert stats["repeats_dropped"] == len(rows)
+    assert stats["lru_hits"] == len(rows)
+    assert stats["rescoring_skipped"] == 1
+    assert again == first
+
+    # A subset of a seen batch is still rescored: the cases depend on the whole batch.
+    subset = client.post("/api/triage/certainty", json={"signals": rows[:100]}).json()["data"]
+    assert seen_signals.stats()["rescoring_skipped"] == 1
+    assert len(subset["cases"]) < len(first["cases"])
+
+    edited = [dict(row) for row in rows]
+    edited[0]["text"] = "cable cut, connector missing"
+    client.post("/api/triage/certainty", json={"signals": edited})
+    stats = seen_signals.stats()
+    assert stats["changed"] == 1
+    assert stats["rescoring_skipped"] == 1
+    assert {signal.id: signal.text for signal in store.get_signals()}[rows[0]["id"]] == "cable cut, connector missing"
+
+    metrics = client.get("/api/metrics/ingest").json()["data"]
+    assert metrics["lru_hit_rate"] > 0.5
+    assert "ev_grid_ops_ingest_repeats_dropped_total" in client.get("/api/metrics/prometheus").text
+
+
+def test_clearing_the_store_resets_the_filter() -> None:
+    store.reset_store()
+    client = TestClient(app)
+    rows = _rows(50, 10)
+    client.post("/api/triage/baseline", json={"signals": rows})
+
+    store.reset_store()
+    assert seen_signals.stats()["lru_size"] == 0
+    data = client.post("/api/triage/baseline", json={"signals": rows}).json()["data"]
+    assert len(store.get_signals()) == len(rows)
+    stored = client.get("/api/cases", params={"mode": "baseline"}).json()["data"]["cases"]
+    assert sorted(case["id"] for case in data["cases"]) == sorted(case["id"] for case in stored)
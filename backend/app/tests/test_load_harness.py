@@ -0,0 +1,39 @@
+"""Smoke test for the in-process ASGI load harness."""
+
+from __future__ import annotations
+
+import asyncio
+
+from app.seed_data.load_demo_seed import load_demo_seed
+from benchmarks.load import DEFAULT_MIX, LoadConfig, asgi_client, percentile, run_load
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_run_load_reports_every_route_in_the_mix() -> None:
+    load_demo_seed()
+    config = LoadConfig(
+        concurrency=1,
+        duration_s=30.0,
+        max_requests=60,
+        mix={name: 1.0 for name in DEFAULT_MIX},
+        triage_batch=20,
+    )
+
+    async def scenario():
+        async with asgi_client() as client:
+            return await run_load(client, config)
+
+    report = asyncio.run(scenario())
+    rows = {row["route"]: row for row in report.to_rows()}
+
+    assert report.total_requests >= 60
+    assert rows["ALL"]["requests"] == report.total_requests
+    assert {"GET /api/cases", "GET /api/metrics/compare", "POST /api/triage/certainty"} <= set(rows)
+    assert rows["GET /api/cases"]["statuses"] == {"200": rows["GET /api/cases"]["requests"]}
+    assert rows["ALL"]["p50_ms"] <= rows["ALL"]["p99_ms"]
@@ -0,0 +1,118 @@
+"""Peak memory regression tests for large triage batches."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import store
+from app.main import app
+from app.models import TriageRequest
+from app.db.sharding import fan_out
+from app.observability import memory
+from app.observability.memory import MemoryTracker
+from app.observability.spans import span
+from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+from app.triage.certainty import run_certainty_triage
+
+BATCH_SIGNALS = 2_000
+
+# Bytes per signal, about 1.5x what the pipeline measured when the budgets were set.
+PEAK_BUDGET_PER_SIGNAL = 6_000
+STAGE_BUDGETS_PER_SIGNAL = {
+    "decode_validate": 1_800,
+    "set_signals": 4_000,
+    "group_signals": 100,
+    "collapse_near_duplicates": 150,
+    "score": 100,
+    "build_cases": 400,
+    "correlate_outages": 100,
+    "persist_cases": 800,
+}
+
+
+def test_certainty_pipeline_peak_memory_per_signal_within_budget() -> None:
+    store.reset_store()
+    rows = list(generate_signal_rows(WorkloadConfig(signals=BATCH_SIGNALS, chargers=BATCH_SIGNALS // 10, seed=3)))
+    tracker = MemoryTracker(enabled=True)
+
+    with tracker.measure("certainty", signals=len(rows), top_sites=0) as measurement:
+        with span("decode_validate"):
+            payload = TriageRequest.model_validate({"signals": rows})
+        with span("set_signals"):
+            store.set_signals(payload.signals)
+        cases, tasks = run_certainty_triage(payload.signals)
+        with span("persist_cases"):
+            store.set_certainty_cases(cases, tasks)
+
+    assert measurement is not None
+    stage_peaks = {stage.stage: stage.peak_bytes / BATCH_SIGNALS for stage in measurement.stages}
+    assert set(stage_peaks) == set(STAGE_BUDGETS_PER_SIGNAL)
+    over_budget = {
+        stage: round(peak) for stage, peak in stage_peaks.items() if peak > STAGE_BUDGETS_PER_SIGNAL[stage]
+    }
+    assert not over_budget, f"stages over their per-signal memory budget: {over_budget}"
+    assert measurement.peak_bytes_per_signal <= PEAK_BUDGET_PER_SIGNAL
+
+
+def test_only_one_measurement_runs_at_a_time() -> None:
+    tracker = MemoryTracker(enabled=True)
+    with tracker.measure("outer") as outer:
+        with tracker.measure("inner") as inner:
+            assert outer is not None
+            assert inner is None
+    assert [item["label"] for item in tracker.recent()] == ["outer"]
+
+
+def test_nested_and_parallel_stages_each_get_a_record() -> None:
+    tracker = MemoryTracker(enabled=True)
+
+    def shard_stage(shard) -> int:
+        with span("shard_stage"):
+            return len(bytearray(200_000))
+
+    with tracker.measure("nested", top_sites=0) as measurement:
+        with span("outer"):
+            kept = bytearray(100_000)
+            with span("inner"):
+                scratch = bytearray(1_000_000)
+                del scratch
+            fan_out(shard_stage, [None, None])
+        del kept
+
+    assert measurement is not None
+    stages = {}
+    for stage in measurement.stages:
+        stages.setdefault(stage.stage, []).append(stage)
+    assert sorted(stages) == ["inner", "outer", "shard_stage"]
+    assert len(stages["shard_stage"]) == 2
+    (outer,), (inner,) = stages["outer"], stages["inner"]
+    assert inner.peak_bytes >= 1_000_000
+    # The inner stage must not reset the peak the outer stage is tracking.
+    assert outer.peak_bytes >= inner.peak_bytes
+    assert outer.net_bytes >= 100_000
+
+
+def test_memory_endpoint_returns_recent_triage_measurements(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(memory.tracker, "enabled", True)
+    memory.tracker.reset()
+    rows = list(generate_signal_rows(WorkloadConfig(signals=60, chargers=6, seed=5)))
+    client = TestClient(app)
+
+    assert client.post("/api/triage/baseline", json={"signals": rows}).status_code == 200
+    assert client.post("/api/triage/certainty", json={"signals": rows}).status_code == 200
+    client.get("/api/cases")
+
+    body = client.get("/api/metrics/memory", params={"limit": 5}).json()
+    assert body["ok"] is True
+    assert body["data"]["enabled"] is True
+    latest, previous = body["data"]["measurements"]
+    assert latest["label"] == "POST /api/triage/certainty"
+    assert previous["label"] == "POST /api/triage/baseline"
+    assert latest["signals"] == 60
+    stages = {stage["stage"]: stage for stage in latest["stages"]}
+    assert list(stages)[0] == "decode_validate"
+    assert {"set_signals", "group_signals", "build_cases", "persist_cases"} <= set(stages)
+    assert latest["peak_bytes"] >= max(stage["peak_bytes"] for stage in latest["stages"])
+    assert stages["build_cases"]["top_sites"]
+    memory.tracker.reset()
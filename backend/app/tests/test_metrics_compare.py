@@ -1,6 +1,9 @@
+import asyncio
 from datetime import datetime
 from math import isfinite
 
+import pytest
+
 from app import store
 from app.models import Case, DispatchRequest, VerificationTask, VerifyRequest
 from app.routes.metrics import get_compare_metrics
@@ -91,70 +94,6 @@ def _seed_state() -> None:
     )
 
 
-def _seed_case_lifecycle_state() -> None:
-    store.reset_store()
-    store.set_baseline_cases(
-        [
-            Case(
-                id="case_baseline_001",
-                charger_id="AUS_0123",
-                priority_score=92,
-                sla_hours=4,
-                root_cause_tag="connector",
-                confidence=0.84,
-                recommended_action="dispatch_field_tech",
-                evidence_ids=["sig_001"],
-                grid_stress_level="high",
-                explanation="Repeated hard-down signal.",
-                uncertainty_reasons=[],
-                verification_required=False,
-            )
-        ]
-    )
-    store.set_certainty_cases(
-        [
-            Case(
-                id="case_certainty_001",
-                charger_id="AUS_0123",
-                priority_score=92,
-                sla_hours=4,
-                root_cause_tag="connector",
-                confidence=0.91,
-                recommended_action="dispatch_field_tech",
-                evidence_ids=["sig_001"],
-                grid_stress_level="high",
-                explanation="High confidence physical connector issue.",
-                uncertainty_reasons=[],
-                verification_required=False,
-            ),
-            Case(
-                id="case_certainty_002",
-                charger_id="AUS_0144",
-                priority_score=71,
-                sla_hours=8,
-                root_cause_tag="network",
-                confidence=0.45,
-                recommended_action="needs_verification",
-                evidence_ids=["sig_011"],
-                grid_stress_level="elevated",
-                explanation="Conflicting network telemetry; verify before dispatch.",
-                uncertainty_reasons=["signal_conflict"],
-                verification_required=True,
-            ),
-        ],
-        [
-            VerificationTask(
-                id="ver_001",
-                case_id="case_certainty_002",
-                question="Is charger AUS_0144 physically offline?",
-                owner="FieldOps",
-                status="open",
-                result=None,
-            )
-        ],
-    )
-
-
 def test_compare_metrics_non_null_numeric_values():
     _seed_state()
     metrics = compare_metrics()
@@ -172,7 +111,7 @@ def test_compare_metrics_non_null_numeric_values():
 
 def test_compare_metrics_endpoint_envelope_shape():
     _seed_state()
-    payload = get_compare_metrics().model_dump()
+    payload = asyncio.run(get_compare_metrics()).model_dump()
     assert set(payload.keys()) == {"ok", "data", "error"}
     assert payload["ok"] is True
     assert payload["error"] is None
@@ -188,8 +127,8 @@ def test_compare_metrics_endpoint_envelope_shape():
         assert isinstance(data[key], (int, float))
 
 
+@pytest.mark.usefixtures("case_lifecycle_state")
 def test_dispatch_case_creates_and_updates_work_order():
-    _seed_case_lifecycle_state()
     first = case_service.dispatch_case(
         "case_certainty_001",
         DispatchRequest(
@@ -212,8 +151,8 @@ def test_dispatch_case_creates_and_updates_work_order():
     assert store.get_work_orders_map()["case_certainty_001"].state == "in_progress"
 
 
+@pytest.mark.usefixtures("case_lifecycle_state")
 def test_verify_case_marks_task_done_and_persists_outcome():
-    _seed_case_lifecycle_state()
     response = case_service.verify_case(
         "case_certainty_002",
         VerifyRequest(result="confirmed_issue", notes="Connector bent."),
@@ -0,0 +1,79 @@
+"""Near-duplicate crowd report collapsing tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.models import Signal
+from app.scoring import compute_priority_score, group_signals_by_charger, infer_root_cause_tag
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+from app.triage.near_duplicates import collapse_charger_signals, collapse_near_duplicates
+
+BASE_TS = datetime(2026, 2, 20, 20, 0, tzinfo=timezone.utc)
+FLOOD_TEXTS = ("charger dead", "charger is dead!!", "Charger DEAD", "charger dead!!!")
+
+
+def _signal(index: int, text: str, source: str = "ugc", status: str = "down", charger_id: str = "AUS_0001") -> Signal:
+    return Signal(
+        id=f"sig_{charger_id}_{source}_{index}",
+        source=source,
+        timestamp=BASE_TS + timedelta(seconds=index),
+        charger_id=charger_id,
+        lat=30.2672,
+        lon=-97.7431,
+        status=status,
+        text=text,
+    )
+
+
+def _flood(reports: int = 200, charger_id: str = "AUS_0001") -> list[Signal]:
+    return [_signal(index, FLOOD_TEXTS[index % len(FLOOD_TEXTS)], charger_id=charger_id) for index in range(reports)]
+
+
+def test_flood_collapses_into_its_newest_report() -> None:
+    signals = _flood() + [
+        _signal(500, "connector bent and will not latch"),
+        _signal(501, "charger dead", status="online"),
+        _signal(502, "charger dead", source="charger_api"),
+        _signal(503, "charger dead", source="charger_api"),
+    ]
+    collapsed = collapse_charger_signals(group_signals_by_charger(signals)["AUS_0001"])
+
+    # Telemetry passes through; a different text or status starts its own cluster.
+    assert [(signal.id, weight) for signal, weight in zip(collapsed.signals, collapsed.weights)] == [
+        ("sig_AUS_0001_charger_api_503", 1),
+        ("sig_AUS_0001_charger_api_502", 1),
+        ("sig_AUS_0001_ugc_501", 1),
+        ("sig_AUS_0001_ugc_500", 1),
+        ("sig_AUS_0001_ugc_199", 200),
+    ]
+    assert collapsed.collapsed == 199
+
+
+def test_flood_no_longer_inflates_the_volume_bonus() -> None:
+    single = [_signal(0, "charger dead", charger_id="AUS_0002")]
+    flooded = _flood(charger_id="AUS_0001")
+    cases = {case.charger_id: case for case in run_certainty_triage(single + flooded)[0]}
+
+    assert cases["AUS_0001"].priority_score == cases["AUS_0002"].priority_score
+    assert compute_priority_score(flooded) > cases["AUS_0001"].priority_score
+    # Every report is still evidence for the case.
+    assert len(cases["AUS_0001"].evidence_ids) == 200
+
+
+def test_baseline_still_scores_every_report() -> None:
+    flooded = _flood()
+    (case,) = run_baseline_triage(flooded)
+    assert case.priority_score == compute_priority_score(flooded)
+
+
+def test_keyword_votes_keep_the_flood_weight() -> None:
+    signals = [_signal(index, "payment reader rejects all cards!") for index in range(30)] + [
+        _signal(100 + index, text) for index, text in enumerate(("connector bent", "plug loose", "cable cut"))
+    ]
+    collapsed = collapse_near_duplicates(group_signals_by_charger(signals))["AUS_0001"]
+
+    assert len(collapsed.signals) == 4
+    assert infer_root_cause_tag(collapsed.signals, collapsed.weights) == infer_root_cause_tag(signals)
+    assert infer_root_cause_tag(collapsed.signals) == "connector"
@@ -0,0 +1,85 @@
+"""Tests for per-stage triage latency instrumentation."""
+
+from __future__ import annotations
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.middleware.query_accounting import QueryAccountingMiddleware
+from app.observability.spans import BACKGROUND_ROUTE, StageHistogram, registry, span
+
+TRIAGE_PAYLOAD = {
+    "signals": [
+        {
+            "id": "sig_perf_1",
+            "source": "311",
+            "timestamp": "2026-02-20T20:00:00Z",
+            "charger_id": "AUS_9001",
+            "lat": 30.2672,
+            "lon": -97.7431,
+            "status": "down",
+            "text": "charger dead",
+        }
+    ]
+}
+
+
+def test_histogram_quantiles_fall_inside_observed_range() -> None:
+    histogram = StageHistogram()
+    for duration_ms in range(1, 101):
+        histogram.observe(duration_ms * 1_000_000)
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert 25.0 <= summary["p50_ms"] <= 100.0
+    assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"] <= summary["max_ms"] == 100.0
+
+
+def test_spans_outside_requests_use_background_route() -> None:
+    registry.reset()
+    with span("warmup"):
+        pass
+    assert registry.snapshot()[BACKGROUND_ROUTE]["warmup"]["count"] == 1
+
+
+def test_triage_request_records_stage_histograms_per_route() -> None:
+    registry.reset()
+    client = TestClient(app)
+    response = client.post("/api/triage/certainty", json=TRIAGE_PAYLOAD)
+    assert response.status_code == 200
+
+    perf = client.get("/api/metrics/perf").json()
+    stages = perf["data"]["routes"]["POST /api/triage/certainty"]
+    for stage in ("decode_validate", "set_signals", "group_signals", "score", "build_cases", "persist_cases", "request"):
+        assert stages[stage]["count"] == 1
+
+    text = client.get("/api/metrics/prometheus").text
+    assert "# TYPE ev_grid_ops_stage_duration_seconds histogram" in text
+    assert 'route="POST /api/triage/certainty",stage="score",le="+Inf"} 1' in text
+
+
+def test_decode_validate_excludes_time_spent_before_the_route(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry.reset()
+    forward = QueryAccountingMiddleware.__call__
+
+    async def slow_middleware(self, scope, receive, send) -> None:
+        # Stands in for an admission queue or a busy middleware ahead of the route.
+        await anyio.sleep(0.3)
+        await forward(self, scope, receive, send)
+
+    monkeypatch.setattr(QueryAccountingMiddleware, "__call__", slow_middleware)
+    assert TestClient(app).post("/api/triage/certainty", json=TRIAGE_PAYLOAD).status_code == 200
+
+    stages = registry.snapshot()["POST /api/triage/certainty"]
+    assert stages["request"]["max_ms"] >= 300
+    assert stages["decode_validate"]["max_ms"] < 300
+
+
+def test_route_labels_template_path_parameters() -> None:
+    registry.reset()
+    client = TestClient(app)
+    client.post("/api/cases/case_missing/dispatch", json={"assigned_team": "FieldOps", "due_at": "2026-02-21T04:00:00Z"})
+
+    assert "POST /api/cases/{id}/dispatch" in registry.snapshot()
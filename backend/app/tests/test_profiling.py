@@ -0,0 +1,82 @@
+"""Tests for the opt-in per-request profiling hook."""
+
+from __future__ import annotations
+
+import pstats
+import time
+from pathlib import Path
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.profiling import ProfiledRoute, ProfilingConfig, ProfilingMiddleware
+from app.models import ApiResponse, TriageRequest
+
+
+def _busy_triage_handler(payload: TriageRequest) -> ApiResponse:
+    deadline = time.perf_counter() + 0.03
+    while time.perf_counter() < deadline:
+        pass
+    return ApiResponse(ok=True, data={"signals": len(payload.signals)}, error=None)
+
+
+def _client(config: ProfilingConfig) -> tuple[TestClient, ProfilingMiddleware]:
+    router = APIRouter(prefix="/api/triage", route_class=ProfiledRoute)
+    router.add_api_route("/baseline", _busy_triage_handler, methods=["POST"], response_model=ApiResponse)
+    app = FastAPI()
+    app.include_router(router)
+    middleware = ProfilingMiddleware(app, config=config)
+    return TestClient(middleware), middleware
+
+
+def test_requests_without_header_are_not_profiled(tmp_path: Path) -> None:
+    client, middleware = _client(ProfilingConfig(token="s3cret", output_dir=tmp_path))
+    response = client.post("/api/triage/baseline", json={"signals": []})
+    wrong = client.post("/api/triage/baseline", json={"signals": []}, headers={"X-Profile": "nope"})
+
+    assert response.json()["data"] == {"signals": 0}
+    assert "X-Profile-Id" not in response.headers and "X-Profile-Id" not in wrong.headers
+    assert middleware.written == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_authorized_request_writes_tagged_pstats(tmp_path: Path) -> None:
+    client, _ = _client(ProfilingConfig(token="s3cret", output_dir=tmp_path))
+    response = client.post(
+        "/api/triage/baseline",
+        json={"signals": []},
+        headers={"X-Profile": "s3cret", "X-Request-ID": "req-42"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Profile-Id"] == "req_42"
+    [profile] = list(tmp_path.glob("*.pstats"))
+    assert "post_api_triage_baseline_req_42" in profile.name
+    functions = {name for _, _, name in pstats.Stats(str(profile)).stats}
+    assert "_busy_triage_handler" in functions
+
+
+def test_sampling_mode_writes_collapsed_stacks_and_rotates(tmp_path: Path) -> None:
+    config = ProfilingConfig(
+        sample_rate=1.0,
+        mode="sampling",
+        output_dir=tmp_path,
+        max_files=2,
+        max_per_minute=10,
+        sampling_interval_s=0.001,
+    )
+    client, middleware = _client(config)
+    for _ in range(3):
+        client.post("/api/triage/baseline", json={"signals": []})
+
+    files = sorted(tmp_path.glob("*.collapsed"))
+    assert middleware.written == 3
+    assert len(files) == 2
+    assert "_busy_triage_handler" in files[-1].read_text()
+
+
+def test_rate_cap_limits_profiled_requests(tmp_path: Path) -> None:
+    client, middleware = _client(ProfilingConfig(sample_rate=1.0, output_dir=tmp_path, max_per_minute=1))
+    for _ in range(3):
+        client.post("/api/triage/baseline", json={"signals": []})
+    assert middleware.written == 1
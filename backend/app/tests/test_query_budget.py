@@ -0,0 +1,94 @@
+"""Query budget regression tests for store and service hot paths."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import store
+from app.db.query_stats import assert_query_budget, count_queries
+from app.middleware.query_accounting import QueryAccountingMiddleware
+from app.models import DispatchRequest, Signal
+from app.routes import cases
+from app.services import case_service
+
+DUE_AT = datetime(2026, 2, 21, 4, 0, tzinfo=timezone.utc)
+
+
+def _signals(count: int) -> list[Signal]:
+    return [
+        Signal(
+            id=f"sig_budget_{index:04d}",
+            source="charger_api",
+            timestamp=DUE_AT + timedelta(minutes=index),
+            charger_id=f"AUS_{index % 7:04d}",
+            lat=30.2672,
+            lon=-97.7431,
+            status="down",
+            text="offline",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.usefixtures("case_lifecycle_state")
+def test_dispatch_case_query_budget() -> None:
+    request = DispatchRequest(assigned_team="FieldOps", due_at=DUE_AT)
+
+    # find case, find work order, insert
+    with assert_query_budget(3):
+        case_service.dispatch_case("case_certainty_001", request)
+    # find case, find work order, update
+    with assert_query_budget(3):
+        case_service.dispatch_case("case_certainty_001", request)
+
+
+@pytest.mark.usefixtures("case_lifecycle_state")
+def test_dispatch_route_query_budget() -> None:
+    # The /dispatch route runs the async service path; count what it executes per request.
+    api = FastAPI()
+    api.add_middleware(QueryAccountingMiddleware, debug_headers=True)
+    api.include_router(cases.router, prefix="/api")
+    client = TestClient(api)
+    body = {"assigned_team": "FieldOps", "due_at": DUE_AT.isoformat()}
+
+    # find case, find work order, insert; then find case, find work order, update
+    for _ in range(2):
+        response = client.post("/api/cases/case_certainty_001/dispatch", json=body)
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Statements"]) <= 3
+
+
+def test_set_signals_does_not_issue_a_query_per_signal() -> None:
+    store.reset_store()
+    with count_queries() as first:
+        store.set_signals(_signals(200))
+    with count_queries() as second:
+        store.set_signals(_signals(200))
+
+    assert first.statements <= 3
+    assert second.statements <= 3
+    assert second.rows >= 200
+
+
+def test_assert_query_budget_reports_executed_statements() -> None:
+    with pytest.raises(AssertionError, match="expected at most 0 SQL statements"):
+        with assert_query_budget(0):
+            store.find_case("case_missing")
+
+
+def test_debug_headers_report_request_totals() -> None:
+    app = FastAPI()
+    app.add_middleware(QueryAccountingMiddleware, debug_headers=True)
+
+    @app.get("/probe")
+    def probe() -> dict:
+        store.find_case("case_missing")
+        return {"ok": True}
+
+    response = TestClient(app).get("/probe")
+    assert response.headers["X-DB-Statements"] == "1"
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0.0
@@ -0,0 +1,46 @@
+"""In-memory triage replay tests."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from app.db.query_stats import count_queries
+from app.models import Signal
+from app.seed_data.bulk_load import iter_json_rows
+from app.seed_data.generate_signals import WorkloadConfig, generate_signals
+from app.seed_data.load_demo_seed import SEED_DIR, load_demo_seed
+from app.services.metrics_service import compare_metrics
+from app.triage.replay import replay
+
+
+def test_replay_matches_persisted_metrics_without_touching_the_database() -> None:
+    signals = sorted(
+        (Signal.model_validate(row) for row in iter_json_rows(SEED_DIR / "signals.json")),
+        key=lambda signal: signal.timestamp,
+    )
+    outcomes = list(iter_json_rows(SEED_DIR / "verification_outcomes.json"))
+
+    with count_queries() as stats:
+        report = replay(signals, outcomes, window=timedelta(minutes=5))
+
+    assert stats.statements == 0
+    assert report.signals == 12
+    assert report.outcomes == 4
+    assert [point.signals for point in report.points[:-1]] == [1, 2, 3, 2, 3, 1]
+    load_demo_seed()
+    final = report.points[-1]
+    expected = compare_metrics()
+    assert final.false_dispatch_reduction_pct == expected.false_dispatch_reduction_pct
+    assert final.critical_catch_rate_delta_pct == expected.critical_catch_rate_delta_pct
+
+
+def test_replay_paces_to_speedup_and_prunes_lookback() -> None:
+    signals = list(generate_signals(WorkloadConfig(signals=300, chargers=20, seed=4, duration_hours=6)))
+    report = replay(signals, window=timedelta(minutes=30), lookback=timedelta(hours=1), speedup=72_000.0)
+
+    assert len(report.points) == 12
+    assert sum(point.signals for point in report.points) == 300
+    assert max(point.lookback_signals for point in report.points) < 150
+    # Six simulated hours at 72000x take at least 0.3s of wall time.
+    assert report.wall_s >= report.simulated_s / 72_000.0
+    assert report.events_per_s > 0
@@ -0,0 +1,108 @@
+"""Read replica routing tests, with a second SQLite file standing in for the replica."""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app import store
+from app.db.base import Base
+from app.db.models import CaseRecord
+from app.db.session import configure_replicas, replica_status, session_scope
+from app.db.sharding import fan_out
+from app.models import Case
+
+
+def _case(case_id: str) -> Case:
+    return Case(
+        id=case_id,
+        charger_id="AUS_0001",
+        priority_score=50,
+        sla_hours=8,
+        root_cause_tag="network",
+        confidence=0.7,
+        recommended_action="dispatch_field_tech",
+        evidence_ids=[],
+        grid_stress_level="normal",
+        explanation="Replica routing fixture.",
+        uncertainty_reasons=[],
+        verification_required=False,
+    )
+
+
+def _fresh_request(fn, *args):
+    """Run ``fn`` the way a new request would: no earlier writes in its context."""
+    return contextvars.Context().run(fn, *args)
+
+
+@pytest.fixture
+def replica(tmp_path) -> Iterator[Engine]:
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    replica_engine = create_engine(url)
+    Base.metadata.create_all(bind=replica_engine)
+    with Session(replica_engine) as session:
+        session.add(CaseRecord(**store._case_values(_case("case_replica_only"), "certainty")))
+        session.commit()
+    store.reset_store()
+    configure_replicas([url])
+    yield replica_engine
+    configure_replicas([])
+    replica_engine.dispose()
+
+
+def test_reads_go_to_the_replica(replica: Engine) -> None:
+    assert [case.id for case in _fresh_request(store.get_cases, "certainty")] == ["case_replica_only"]
+    assert _fresh_request(store.find_case, "case_replica_only") is not None
+
+
+def test_reads_stick_to_the_primary_after_a_write(replica: Engine) -> None:
+    def write_then_read() -> list:
+        store.set_certainty_cases([_case("case_primary")], [])
+        return [case.id for case in store.get_cases("certainty")]
+
+    assert _fresh_request(write_then_read) == ["case_primary"]
+    assert [case.id for case in _fresh_request(store.get_cases, "certainty")] == ["case_replica_only"]
+
+
+def test_writes_inside_fan_out_keep_the_caller_on_the_primary(replica: Engine) -> None:
+    lock = threading.Lock()
+
+    def write(shard) -> None:
+        # Two parallel calls on the primary; each writes from its own copied context.
+        with lock, session_scope(shard) as session:
+            store._replace_certainty_cases(session, [_case("case_fanned_out")], [])
+
+    def write_then_read() -> list:
+        fan_out(write, [None, None])
+        return [case.id for case in store.get_cases("certainty")]
+
+    assert _fresh_request(write_then_read) == ["case_fanned_out"]
+
+
+def test_failed_replica_falls_back_to_the_primary(tmp_path) -> None:
+    store.reset_store()
+    store.set_certainty_cases([_case("case_primary")], [])
+    configure_replicas([f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"])
+    try:
+        assert [case.id for case in _fresh_request(store.get_cases, "certainty")] == ["case_primary"]
+        assert replica_status()[0]["healthy"] is False
+    finally:
+        configure_replicas([])
+
+
+def test_replica_that_fails_mid_read_is_retried_on_the_primary(tmp_path) -> None:
+    store.reset_store()
+    store.set_certainty_cases([_case("case_primary")], [])
+    # The replica accepts connections but has no tables, so the query itself fails.
+    configure_replicas([f"sqlite:///{tmp_path / 'empty.db'}"])
+    try:
+        assert [case.id for case in _fresh_request(store.get_cases, "certainty")] == ["case_primary"]
+        assert replica_status()[0]["healthy"] is False
+    finally:
+        configure_replicas([])
@@ -0,0 +1,130 @@
+"""Versioned, hot-reloadable scoring rules tests."""
+
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import store
+from app.main import app
+from app.models import Signal
+from app.scoring_rules import SCORING_RULES_PATH, ScoringRulesFile, compile_rules, scoring_rules
+from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+from app.triage.baseline import run_baseline_triage
+
+
+def _document(**overrides: Any) -> Dict[str, Any]:
+    return {**json.loads(SCORING_RULES_PATH.read_text()), **overrides}
+
+
+def _write(path: Path, document: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(document))
+
+
+def _rows() -> list[dict]:
+    return list(generate_signal_rows(WorkloadConfig(signals=200, chargers=20, seed=4)))
+
+
+@pytest.fixture
+def rules_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "scoring_rules.json"
+    _write(path, _document())
+    yield path
+
+
+def test_bundled_rules_compile_into_lookup_tables() -> None:
+    rules = compile_rules(_document())
+    scores = (100, 85, 84, 70, 69, 50, 49, 0, -3, 140)
+    assert [rules.sla_hours(score) for score in scores] == [2, 2, 4, 4, 8, 8, 24, 24, 24, 2]
+    assert rules.keyword_hits("Card reader frozen, cable bent") == (2, 2, 0)
+    # Process-pool workers receive a recompiled copy.
+    assert pickle.loads(pickle.dumps(rules)).sla_by_priority == rules.sla_by_priority
+
+
+@pytest.mark.parametrize(
+    "document, message",
+    [
+        (_document(version=""), "version"),
+        (_document(sla_bands=[{"min_priority": 50, "hours": 8}]), "min_priority 0"),
+        (_document(root_cause_keywords={"firmware": ["update"]}), "unknown tags"),
+        (_document(status_weights={"down": 1.0}), "status_weights"),
+        (_document(confidence={"base": 0.9}), "malformed"),
+    ],
+)
+def test_invalid_rules_are_rejected(document: Dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        compile_rules(document)
+
+
+def test_reload_swaps_rules_without_touching_runs_in_flight(rules_path: Path) -> None:
+    source = ScoringRulesFile(rules_path, reload_s=0)
+    signals = [Signal.model_validate(row) for row in _rows()]
+    before = source.current()
+    assert not source.reload()
+
+    _write(rules_path, _document(version="2026-10-20.1", sla_bands=[{"min_priority": 0, "hours": 1}]))
+    assert source.reload()
+    after = source.current()
+
+    # A run that took the old rules keeps them; new runs get the new version.
+    assert {case.rules_version for case in run_baseline_triage(signals, before)} == {before.version}
+    assert {(case.rules_version, case.sla_hours) for case in run_baseline_triage(signals, after)} == {
+        ("2026-10-20.1", 1)
+    }
+
+    _write(rules_path, _document(version="2026-10-20.1"))
+    assert not source.reload()
+    rules_path.write_text("{not json")
+    assert not source.reload()
+    stats = source.stats()
+    assert (stats["version"], stats["reloads"], stats["failures"]) == ("2026-10-20.1", 1, 2)
+    assert source.current() is after
+
+
+def test_reload_rejects_reusing_any_earlier_version_for_other_rules(rules_path: Path) -> None:
+    source = ScoringRulesFile(rules_path, reload_s=0)
+    bundled = source.current()
+    _write(rules_path, _document(version="2026-10-20.1", sla_bands=[{"min_priority": 0, "hours": 1}]))
+    assert source.reload()
+
+    # The bundled version is no longer active, but it still names the bundled rules.
+    _write(rules_path, _document(sla_bands=[{"min_priority": 0, "hours": 3}]))
+    assert not source.reload()
+    assert "already used" in source.stats()["last_error"]
+    assert source.current().version == "2026-10-20.1"
+
+    # Rolling back to the bundled rules unchanged is fine.
+    _write(rules_path, _document())
+    assert source.reload()
+    assert source.current().sla_by_priority == bundled.sla_by_priority
+
+
+def test_triage_records_the_rules_version_and_rescores_after_a_reload(
+    rules_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store.reset_store()
+    client = TestClient(app)
+    rows = _rows()
+    bundled = scoring_rules.current().version
+
+    client.post("/api/triage/baseline", json={"signals": rows})
+    stored = client.get("/api/cases", params={"mode": "baseline"}).json()["data"]["cases"]
+    assert {case["rules_version"] for case in stored} == {bundled}
+
+    monkeypatch.setattr(scoring_rules, "path", rules_path)
+    try:
+        _write(rules_path, _document(version="2026-10-20.1"))
+        assert scoring_rules.reload(force=True)
+        # The batch is an exact resend, but it was scored under other rules.
+        cases = client.post("/api/triage/baseline", json={"signals": rows}).json()["data"]["cases"]
+        assert {case["rules_version"] for case in cases} == {"2026-10-20.1"}
+        assert client.get("/api/metrics/scoring-rules").json()["data"]["version"] == "2026-10-20.1"
+    finally:
+        monkeypatch.undo()
+        scoring_rules.reload(force=True)
+    assert scoring_rules.current().version == bundled
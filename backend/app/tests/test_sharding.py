@@ -0,0 +1,111 @@
+"""Region-sharded persistence and triage tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import select
+
+from app import store
+from app.db.models import CaseRecord, SignalRecord, WorkOrderRecord
+from app.db.session import configure_shards, init_database, session_scope
+from app.db.sharding import shard_for_case, shard_for_charger
+from app.models import DispatchRequest, Signal, VerifyRequest
+from app.seed_data.bulk_load import bulk_load
+from app.seed_data.generate_signals import WorkloadConfig, generate_signals
+from app.services import case_service
+from app.services.metrics_service import compare_metrics, compute_compare_metrics
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+from app.triage.sharded import run_sharded_baseline_triage, run_sharded_certainty_triage
+
+
+def _signals() -> List[Signal]:
+    signals: List[Signal] = []
+    for seed, region in enumerate(("AUS", "DAL", "HOU")):
+        for signal in generate_signals(WorkloadConfig(signals=300, chargers=15, region=region, seed=seed)):
+            signals.append(signal.model_copy(update={"id": f"{signal.id}_{region.lower()}"}))
+    return signals
+
+
+@pytest.fixture
+def sharded(tmp_path) -> Iterator[None]:
+    configure_shards({"AUS": f"sqlite:///{tmp_path / 'aus.db'}", "DAL": f"sqlite:///{tmp_path / 'dal.db'}"})
+    init_database()
+    store.reset_store()
+    yield
+    configure_shards({})
+    store.reset_store()
+
+
+def test_routing_uses_the_charger_region() -> None:
+    assert shard_for_charger("AUS_0001") is None
+
+    configure_shards({"DAL": "sqlite://"})
+    try:
+        assert shard_for_charger("dal-0001") == "DAL"
+        assert shard_for_case("case_dal_0001") == "DAL"
+        assert shard_for_charger("HOU_0001") is None
+    finally:
+        configure_shards({})
+
+
+def test_sharded_triage_matches_unsharded_output(sharded: None) -> None:
+    signals = _signals()
+
+    assert run_sharded_baseline_triage(signals) == run_baseline_triage(signals)
+    assert run_sharded_certainty_triage(signals) == run_certainty_triage(signals)
+
+
+def test_rows_land_in_their_region_shard(sharded: None) -> None:
+    signals = _signals()
+    store.set_signals(signals)
+    store.set_certainty_cases(*run_sharded_certainty_triage(signals))
+
+    for shard, region in ((None, "HOU"), ("AUS", "AUS"), ("DAL", "DAL")):
+        with session_scope(shard) as session:
+            chargers = set(session.scalars(select(SignalRecord.charger_id)))
+            case_chargers = set(session.scalars(select(CaseRecord.charger_id)))
+        assert chargers and {charger.split("_")[0] for charger in chargers} == {region}
+        assert {charger.split("_")[0] for charger in case_chargers} == {region}
+
+    assert store.get_signals() == sorted(signals, key=lambda signal: (signal.timestamp, signal.id))
+    assert store.count_cases("certainty") == len({signal.charger_id for signal in signals})
+
+
+def test_merged_reads_and_metrics_match_unsharded_triage(sharded: None) -> None:
+    signals = _signals()
+    baseline = run_baseline_triage(signals)
+    certainty, tasks = run_certainty_triage(signals)
+    store.set_baseline_cases(run_sharded_baseline_triage(signals))
+    store.set_certainty_cases(*run_sharded_certainty_triage(signals))
+
+    assert [case.priority_score for case in store.get_cases("certainty")] == [
+        case.priority_score for case in certainty
+    ]
+    assert store.get_verification_tasks_map() == {task.case_id: task for task in tasks}
+    assert compare_metrics() == compute_compare_metrics(baseline, certainty, {task.case_id: task for task in tasks}, [])
+
+
+def test_case_writes_go_to_the_case_shard(sharded: None) -> None:
+    signals = _signals()
+    store.set_certainty_cases(*run_sharded_certainty_triage(signals))
+    dal_case = next(case for case in store.get_cases("certainty") if case.charger_id.startswith("DAL"))
+    hou_case = next(case for case in store.get_cases("certainty") if case.charger_id.startswith("HOU"))
+    request = DispatchRequest(assigned_team="FieldOps", due_at=datetime(2026, 2, 21, 4, tzinfo=timezone.utc))
+
+    assert case_service.dispatch_case(dal_case.id, request).work_order.id == f"wo_{dal_case.id[len('case_'):]}"
+    assert case_service.dispatch_case(hou_case.id, request).work_order.id == f"wo_{hou_case.id[len('case_'):]}"
+    case_service.verify_case(dal_case.id, VerifyRequest(result="false_alarm", notes=None))
+
+    with session_scope("DAL") as session:
+        assert session.scalars(select(WorkOrderRecord.case_id)).all() == [dal_case.id]
+    assert store.get_verification_tasks_map()[dal_case.id].result == "false_alarm"
+    assert [outcome["case_id"] for outcome in store.get_verification_outcomes()] == [dal_case.id]
+
+
+def test_primary_only_bulk_tools_refuse_sharded_databases(sharded: None) -> None:
+    with pytest.raises(RuntimeError, match="DATABASE_SHARDS"):
+        bulk_load([])
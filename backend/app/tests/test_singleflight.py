@@ -0,0 +1,58 @@
+"""Tests for request coalescing on hot read paths."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services import case_service
+from app.services.singleflight import SingleFlight, read_coalescer
+
+
+def test_concurrent_identical_calls_share_one_execution() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    executions = []
+
+    def slow() -> object:
+        executions.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(flight.do, "key", slow)
+        assert started.wait(timeout=5)
+        followers = [pool.submit(flight.do, "key", slow) for _ in range(7)]
+        while flight.stats()["key"]["calls"] < 8:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert len(executions) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats()["key"] == {"calls": 8, "executions": 1, "coalesced": 7, "in_flight": 0}
+
+
+def test_errors_propagate_and_are_not_cached() -> None:
+    flight = SingleFlight()
+
+    def boom() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("key", boom)
+    assert flight.do("key", lambda: 42) == 42
+    assert flight.stats()["key"]["executions"] == 2
+
+
+def test_list_cases_records_coalescer_stats() -> None:
+    read_coalescer.reset_stats()
+    data = case_service.list_cases("certainty")
+
+    assert data.mode == "certainty"
+    assert read_coalescer.stats()["list_cases:certainty"]["calls"] == 1
@@ -0,0 +1,98 @@
+"""Binary snapshot round-trip tests."""
+
+from __future__ import annotations
+
+import json
+import sys
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from app import store
+from app.seed_data.load_demo_seed import load_demo_seed
+from app.seed_data.snapshot import _HEADER, _TYPECODES, Snapshot, export_snapshot, import_snapshot
+
+
+def _full_state() -> dict:
+    return {
+        "baseline": store.get_cases("baseline"),
+        "certainty": store.get_cases("certainty"),
+        "work_orders": store.get_work_orders_map(),
+        "tasks": store.get_verification_tasks_map(),
+        "outcomes": store.get_verification_outcomes(),
+    }
+
+
+def test_snapshot_round_trip_restores_full_state(tmp_path: Path) -> None:
+    load_demo_seed()
+    case = store.get_cases("certainty")[0]
+    store.create_or_update_work_order(case.id, "FieldOps", datetime(2026, 2, 21, 6, 30, tzinfo=timezone.utc))
+    store.complete_verification(case.id, "false_alarm", None)
+    expected = _full_state()
+    path = tmp_path / "state.evsnap"
+
+    exported = export_snapshot(path)
+    store.reset_store()
+    imported = import_snapshot(path, batch_size=3)
+
+    assert imported == exported
+    assert exported["signals"] == 12
+    assert exported["work_orders"] == 1
+    assert _full_state() == expected
+
+    with Snapshot(path) as snapshot:
+        lat = snapshot.columns("signals", only=["lat"])["lat"]
+        assert isinstance(lat.values, memoryview)
+        assert lat.values.format == "d"
+        notes = snapshot.columns("verification_outcomes", only=["notes"])["notes"]
+        assert notes[snapshot.table_rows("verification_outcomes") - 1] is None
+
+
+def test_snapshot_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "bogus.evsnap"
+    path.write_bytes(b"not a snapshot at all, just bytes")
+
+    with pytest.raises(ValueError, match="not an EV Grid Ops snapshot"):
+        import_snapshot(path)
+
+
+def _swap_byte_order(path: Path) -> None:
+    """Rewrite a snapshot as if it had been exported on a host of the other byte order."""
+    data = bytearray(path.read_bytes())
+    magic, version, reserved, manifest_offset, manifest_length = _HEADER.unpack_from(data, 0)
+    manifest = json.loads(data[manifest_offset : manifest_offset + manifest_length])
+    for table in manifest["tables"].values():
+        for column in table["columns"].values():
+            for key, (offset, length) in column["sections"].items():
+                typecode = "q" if key == "offsets" else "b" if key == "nulls" else _TYPECODES.get(column["kind"])
+                if key == "data" or typecode is None:
+                    continue
+                values = array(typecode)
+                values.frombytes(bytes(data[offset : offset + length]))
+                values.byteswap()
+                data[offset : offset + length] = values.tobytes()
+    manifest["byteorder"] = "big" if sys.byteorder == "little" else "little"
+    manifest_bytes = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+    del data[manifest_offset:]
+    data += manifest_bytes
+    _HEADER.pack_into(data, 0, magic, version, reserved, manifest_offset, len(manifest_bytes))
+    path.write_bytes(bytes(data))
+
+
+def test_snapshot_from_the_other_byte_order_is_decoded(tmp_path: Path) -> None:
+    load_demo_seed()
+    expected = _full_state()
+    path = tmp_path / "state.evsnap"
+    export_snapshot(path)
+    _swap_byte_order(path)
+
+    with Snapshot(path) as snapshot:
+        assert snapshot._swap
+        lat = snapshot.columns("signals", only=["lat"])["lat"]
+        assert len(lat.values) == snapshot.table_rows("signals")
+
+    store.reset_store()
+    import_snapshot(path)
+    assert _full_state() == expected
@@ -0,0 +1,151 @@
+"""Spatial index and bounding-box case query tests."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import async_store, store
+from app.main import app
+from app.models import Signal
+from app.services.case_index import case_index
+from app.spatial import BBox, GridIndex, parse_bbox
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+
+BASE_TS = datetime(2026, 2, 20, 20, 0, tzinfo=timezone.utc)
+# (charger_id, lat, lon): two downtown chargers and one at the airport.
+CHARGERS = (("AUS_0001", 30.2672, -97.7431), ("AUS_0002", 30.2690, -97.7400), ("AUS_0003", 30.1975, -97.6664))
+DOWNTOWN = "-97.75,30.26,-97.73,30.28"
+
+
+def _signals(chargers=CHARGERS, status: str = "down") -> list[Signal]:
+    return [
+        Signal(
+            id=f"sig_{charger_id}_{minute}",
+            source="charger_api" if minute == 0 else "311",
+            timestamp=BASE_TS + timedelta(minutes=minute + index),
+            charger_id=charger_id,
+            lat=lat,
+            lon=lon,
+            status=status,
+            text="charger offline",
+        )
+        for index, (charger_id, lat, lon) in enumerate(chargers)
+        for minute in range(index + 1)
+    ]
+
+
+def _store_triage(signals: list[Signal]) -> None:
+    store.reset_store()
+    store.set_signals(signals)
+    store.set_baseline_cases(run_baseline_triage(signals))
+    cases, tasks = run_certainty_triage(signals)
+    store.set_certainty_cases(cases, tasks)
+
+
+def test_grid_index_matches_a_linear_scan() -> None:
+    rng = random.Random(5)
+    points = [
+        None if rng.random() < 0.05 else (rng.uniform(-97.9, -97.5), rng.uniform(30.1, 30.5)) for _ in range(3000)
+    ]
+    index = GridIndex(points, cell_deg=0.01)
+    boxes = [
+        BBox(-97.75, 30.26, -97.73, 30.28),
+        BBox(-97.8, 30.2, -97.6, 30.4),
+        BBox(-97.7431, 30.2, -97.7431, 30.3),
+        BBox(-180.0, -90.0, 180.0, 90.0),
+        BBox(-97.0, 31.0, -96.0, 32.0),
+    ]
+    for bbox in boxes:
+        expected = [i for i, point in enumerate(points) if point is not None and bbox.contains(*point)]
+        assert index.query(bbox) == expected
+    assert GridIndex([]).query(boxes[0]) == []
+
+
+def test_parse_bbox_rejects_malformed_boxes() -> None:
+    assert parse_bbox("-97.75,30.26,-97.73,30.28") == BBox(-97.75, 30.26, -97.73, 30.28)
+    for raw in ("1,2,3", "a,b,c,d", "-97.73,30.26,-97.75,30.28", "-97.75,30.26,-97.73,95", "nan,0,1,1"):
+        with pytest.raises(ValueError):
+            parse_bbox(raw)
+
+
+def test_cases_carry_the_coordinates_of_their_newest_signal() -> None:
+    moved = _signals() + [
+        Signal(
+            id="sig_moved",
+            source="charger_api",
+            timestamp=BASE_TS + timedelta(hours=1),
+            charger_id="AUS_0001",
+            lat=30.3,
+            lon=-97.7,
+            status="down",
+            text="charger offline",
+        )
+    ]
+    _store_triage(moved)
+    case = store.find_case("case_aus_0001")
+    assert case is not None
+    assert (case.lat, case.lon) == (30.3, -97.7)
+
+
+def test_bbox_query_returns_cases_in_view_and_follows_retriage() -> None:
+    _store_triage(_signals())
+    client = TestClient(app)
+
+    response = client.get("/api/cases", params={"mode": "certainty", "bbox": DOWNTOWN})
+    assert response.status_code == 200
+    cases = response.json()["data"]["cases"]
+    assert {case["charger_id"] for case in cases} == {"AUS_0001", "AUS_0002"}
+    everything = client.get("/api/cases", params={"mode": "certainty"}).json()["data"]["cases"]
+    assert cases == [case for case in everything if case["charger_id"] != "AUS_0003"]
+
+    # A new triage run replaces the cases; the next bbox query must not serve the old index.
+    _store_triage(_signals(chargers=CHARGERS[2:]))
+    response = client.get("/api/cases", params={"mode": "certainty", "bbox": DOWNTOWN})
+    assert response.json()["data"]["cases"] == []
+
+    response = client.get("/api/cases", params={"mode": "certainty", "bbox": "1,2,3"})
+    assert response.status_code == 400
+    assert response.json()["ok"] is False
+
+
+def test_concurrent_index_refreshes_share_one_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    store.reset_store()
+    store.set_baseline_cases(run_baseline_triage(_signals()))
+    case_index.clear()
+    loads = []
+    load_cases = async_store.get_cases
+
+    async def counted_get_cases(mode):
+        loads.append(mode)
+        return await load_cases(mode)
+
+    monkeypatch.setattr(async_store, "get_cases", counted_get_cases)
+
+    async def refresh_twice():
+        return await asyncio.gather(case_index.refresh("baseline"), case_index.refresh("baseline"))
+
+    first, second = asyncio.run(refresh_twice())
+    assert first is second and loads == ["baseline"]
+
+    # A refresh after a write indexes the new cases.
+    store.set_baseline_cases(run_baseline_triage(_signals(CHARGERS[:1])))
+    fresh = asyncio.run(case_index.refresh("baseline"))
+    assert [case.charger_id for case in fresh.cases] == ["AUS_0001"]
+
+
+def test_bbox_query_over_100k_chargers_only_checks_nearby_cells() -> None:
+    rng = random.Random(11)
+    points = [(rng.gauss(-97.7431, 0.02), rng.gauss(30.2672, 0.02)) for _ in range(100_000)]
+    index = GridIndex(points)
+    neighborhood = BBox(-97.75, 30.26, -97.73, 30.275)
+
+    matches = index.query(neighborhood)
+    assert matches
+    # Work is bounded by the points near the view, not by the 100k indexed.
+    assert len(matches) <= index.candidates(neighborhood) < 1.5 * len(matches)
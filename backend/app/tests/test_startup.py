@@ -0,0 +1,80 @@
+"""Startup marker, warm-up and readiness tests."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app import store
+from app.db.bootstrap import demo_seed_current, ensure_demo_cases, prepare_database
+from app.db.query_stats import assert_query_budget
+from app.main import app
+from app.services.startup_service import run_startup, startup_state
+
+
+def test_schema_marker_skips_create_all_on_next_boot() -> None:
+    prepare_database()
+
+    with assert_query_budget(1):
+        assert prepare_database() is False
+
+
+def test_seed_marker_skips_case_checks_until_state_is_reset() -> None:
+    store.reset_store()
+    assert demo_seed_current() is False
+
+    assert ensure_demo_cases() is True
+    assert demo_seed_current() is True
+    with assert_query_budget(1):
+        assert ensure_demo_cases() is False
+
+    store.reset_store()
+    assert demo_seed_current() is False
+
+
+def test_replacing_cases_invalidates_the_seed_marker() -> None:
+    store.reset_store()
+    assert ensure_demo_cases() is True
+
+    store.set_baseline_cases([])
+    assert demo_seed_current() is False
+    assert ensure_demo_cases() is True
+
+    store.set_certainty_cases([], [])
+    assert demo_seed_current() is False
+
+
+def test_readiness_reports_warm_up_phases() -> None:
+    client = TestClient(app)
+    startup_state.reset()
+
+    response = client.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["data"]["status"] == "pending"
+    assert client.get("/api/health/live").status_code == 200
+
+    store.reset_store()
+    thread = run_startup("background")
+    assert thread is not None
+    thread.join(timeout=30)
+
+    body = client.get("/api/health/ready").json()
+    assert body["ok"] is True
+    assert body["data"]["status"] == "ready"
+    phases = [(phase["name"], phase["background"]) for phase in body["data"]["phases"]]
+    assert phases == [
+        ("prepare_database", False),
+        ("check_seed_marker", False),
+        ("ensure_demo_cases", True),
+        ("warm_queries", True),
+        ("seed_signal_filter", True),
+    ]
+
+    run_startup("inline")
+    assert [phase["name"] for phase in startup_state.snapshot()["phases"]] == [
+        "prepare_database",
+        "check_seed_marker",
+        "warm_queries",
+        "seed_signal_filter",
+    ]
+    assert startup_state.ready
@@ -1,20 +1,26 @@
-"""Deterministic baseline triage pipeline."""
+"""Deterministic baseline triage pipeline.
+
+Baseline scores every report as it arrives, floods included; it is the naive
+comparison point for certainty mode, which collapses near-duplicates first.
+"""
 
 from __future__ import annotations
 
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 
+from app.grid_stress import grid_stress_snapshot
 from app.models import Case, Signal
+from app.observability.spans import span
 from app.scoring import (
     build_baseline_explanation,
     choose_recommended_action,
-    compute_grid_stress_level,
     compute_priority_score,
-    compute_sla_hours,
     group_signals_by_charger,
     infer_root_cause_tag,
     make_case_id,
+    resolve_grid_stress_level,
 )
+from app.scoring_rules import CompiledRules, current_rules
 
 
 def _baseline_confidence(priority_score: int) -> float:
@@ -23,37 +29,52 @@ def _baseline_confidence(priority_score: int) -> float:
     return round(max(0.05, min(0.99, confidence)), 2)
 
 
-def run_baseline_triage(signals: Sequence[Signal]) -> List[Case]:
+def run_baseline_triage(signals: Sequence[Signal], rules: Optional[CompiledRules] = None) -> List[Case]:
     """Return one case per charger with severity-only scoring."""
-    grouped = group_signals_by_charger(signals)
-    cases: List[Case] = []
+    rules = rules or current_rules()
+    with span("group_signals"):
+        grouped = group_signals_by_charger(signals)
 
-    for charger_id, charger_signals in grouped.items():
-        priority_score = compute_priority_score(charger_signals)
-        root_cause_tag = infer_root_cause_tag(charger_signals)
-
-        cases.append(
-            Case(
-                id=make_case_id(charger_id),
-                charger_id=charger_id,
-                priority_score=priority_score,
-                sla_hours=compute_sla_hours(priority_score),
-                root_cause_tag=root_cause_tag,
-                confidence=_baseline_confidence(priority_score),
-                recommended_action=choose_recommended_action(
-                    priority_score=priority_score,
-                    verification_required=False,
-                ),
-                evidence_ids=[signal.id for signal in charger_signals],
-                grid_stress_level=compute_grid_stress_level(priority_score),
-                explanation=build_baseline_explanation(
+    with span("score"):
+        scored = [
+            (
+                charger_id,
+                charger_signals,
+                compute_priority_score(charger_signals, rules=rules),
+                infer_root_cause_tag(charger_signals, rules=rules),
+            )
+            for charger_id, charger_signals in grouped.items()
+        ]
+
+    cases: List[Case] = []
+    with span("build_cases"):
+        stress = grid_stress_snapshot()
+        for charger_id, charger_signals, priority_score, root_cause_tag in scored:
+            cases.append(
+                Case(
+                    id=make_case_id(charger_id),
                     charger_id=charger_id,
                     priority_score=priority_score,
+                    sla_hours=rules.sla_hours(priority_score),
                     root_cause_tag=root_cause_tag,
-                ),
-                uncertainty_reasons=[],
-                verification_required=False,
+                    confidence=_baseline_confidence(priority_score),
+                    recommended_action=choose_recommended_action(
+                        priority_score=priority_score,
+                        verification_required=False,
+                    ),
+                    evidence_ids=[signal.id for signal in charger_signals],
+                    grid_stress_level=resolve_grid_stress_level(stress, charger_signals[0], priority_score),
+                    explanation=build_baseline_explanation(
+                        charger_id=charger_id,
+                        priority_score=priority_score,
+                        root_cause_tag=root_cause_tag,
+                    ),
+                    uncertainty_reasons=[],
+                    verification_required=False,
+                    lat=charger_signals[0].lat,
+                    lon=charger_signals[0].lon,
+                    rules_version=rules.version,
+                )
             )
-        )
 
     return sorted(cases, key=lambda item: item.priority_score, reverse=True)
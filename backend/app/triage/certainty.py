@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
-from typing import List, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 
+from app.grid_stress import grid_stress_snapshot
 from app.models import Case, Signal, VerificationTask
+from app.observability.spans import span
 from app.scoring import (
     build_certainty_explanation,
     choose_recommended_action,
     compute_confidence,
-    compute_grid_stress_level,
     compute_priority_score,
-    compute_sla_hours,
     group_signals_by_charger,
     infer_root_cause_tag,
     make_case_id,
+    resolve_grid_stress_level,
     make_verification_task_id,
 )
+from app.scoring_rules import CompiledRules, current_rules
+from app.triage.correlation import detect_outages, link_incidents
+from app.triage.near_duplicates import collapse_near_duplicates
 
 CONFIDENCE_THRESHOLD = 0.65
 
@@ -24,54 +28,78 @@ CONFIDENCE_THRESHOLD = 0.65
 def run_certainty_triage(
     signals: Sequence[Signal],
     confidence_threshold: float = CONFIDENCE_THRESHOLD,
+    rules: Optional[CompiledRules] = None,
 ) -> Tuple[List[Case], List[VerificationTask]]:
     """Return certainty-scored cases and generated verification tasks."""
-    grouped = group_signals_by_charger(signals)
+    rules = rules or current_rules()
+    with span("group_signals"):
+        grouped = group_signals_by_charger(signals)
+
+    with span("collapse_near_duplicates"):
+        collapsed = collapse_near_duplicates(grouped)
+
+    with span("score"):
+        scored = [
+            (
+                charger_id,
+                charger_signals,
+                compute_priority_score(collapsed[charger_id].signals, collapsed[charger_id].weights, rules),
+                infer_root_cause_tag(collapsed[charger_id].signals, collapsed[charger_id].weights, rules),
+                compute_confidence(charger_signals, rules),
+            )
+            for charger_id, charger_signals in grouped.items()
+        ]
+
     cases: List[Case] = []
     verification_tasks: List[VerificationTask] = []
+    with span("build_cases"):
+        stress = grid_stress_snapshot()
+        for charger_id, charger_signals, priority_score, root_cause_tag, (confidence, reasons) in scored:
+            verification_required = confidence < confidence_threshold
+            case_id = make_case_id(charger_id)
 
-    for charger_id, charger_signals in grouped.items():
-        priority_score = compute_priority_score(charger_signals)
-        confidence, reasons = compute_confidence(charger_signals)
-        verification_required = confidence < confidence_threshold
-        case_id = make_case_id(charger_id)
-
-        cases.append(
-            Case(
-                id=case_id,
-                charger_id=charger_id,
-                priority_score=priority_score,
-                sla_hours=compute_sla_hours(priority_score),
-                root_cause_tag=infer_root_cause_tag(charger_signals),
-                confidence=confidence,
-                recommended_action=choose_recommended_action(
-                    priority_score=priority_score,
-                    verification_required=verification_required,
-                ),
-                evidence_ids=[signal.id for signal in charger_signals],
-                grid_stress_level=compute_grid_stress_level(priority_score),
-                explanation=build_certainty_explanation(
+            cases.append(
+                Case(
+                    id=case_id,
                     charger_id=charger_id,
                     priority_score=priority_score,
+                    sla_hours=rules.sla_hours(priority_score),
+                    root_cause_tag=root_cause_tag,
                     confidence=confidence,
-                    reasons=reasons,
-                ),
-                uncertainty_reasons=reasons,
-                verification_required=verification_required,
+                    recommended_action=choose_recommended_action(
+                        priority_score=priority_score,
+                        verification_required=verification_required,
+                    ),
+                    evidence_ids=[signal.id for signal in charger_signals],
+                    grid_stress_level=resolve_grid_stress_level(stress, charger_signals[0], priority_score),
+                    explanation=build_certainty_explanation(
+                        charger_id=charger_id,
+                        priority_score=priority_score,
+                        confidence=confidence,
+                        reasons=reasons,
+                    ),
+                    uncertainty_reasons=reasons,
+                    verification_required=verification_required,
+                    lat=charger_signals[0].lat,
+                    lon=charger_signals[0].lon,
+                    rules_version=rules.version,
+                )
             )
-        )
 
-        if verification_required:
-            verification_tasks.append(
-                VerificationTask(
-                    id=make_verification_task_id(case_id),
-                    case_id=case_id,
-                    question=f"Is charger {charger_id} physically offline right now?",
-                    owner="FieldOps",
-                    status="open",
-                    result=None,
+            if verification_required:
+                verification_tasks.append(
+                    VerificationTask(
+                        id=make_verification_task_id(case_id),
+                        case_id=case_id,
+                        question=f"Is charger {charger_id} physically offline right now?",
+                        owner="FieldOps",
+                        status="open",
+                        result=None,
+                    )
                 )
-            )
+
+    with span("correlate_outages"):
+        cases = link_incidents(cases, detect_outages(grouped))
 
     cases.sort(key=lambda item: item.priority_score, reverse=True)
     verification_tasks.sort(key=lambda item: item.case_id)
@@ -0,0 +1,181 @@
+"""Detect area-wide outages and fold their per-charger dispatches into one incident.
+
+When a feeder trips, every charger on it reports ``down`` within minutes, and
+per-charger triage would recommend a dispatch for each of them. This stage
+finds those groups in linear time:
+
+1. For every charger whose newest report is ``down``, walk back through its
+   signals (newest first, as grouped by triage) to the start of that run of
+   ``down`` reports: the onset.
+2. Those chargers are hashed into ``OUTAGE_CELL_DEG`` grid cells and
+   ``OUTAGE_WINDOW_MIN`` onset buckets.
+3. A cell is *hot* when its 3x3 neighbourhood, in its own onset bucket and
+   the two adjacent ones, holds at least ``OUTAGE_MIN_CHARGERS`` onsets, so an
+   outage that starts across a bucket boundary is still seen whole. Adjacent
+   hot cells (in space and bucket) form one outage, which also claims the
+   chargers in the occupied cells bordering it.
+
+Every step touches each signal, charger or occupied cell a constant number of
+times, so the stage stays O(n) in the number of signals.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Mapping, Sequence, Set, Tuple
+
+from app.models import Case, Incident, Signal
+
+OUTAGE_CELL_DEG = float(os.getenv("OUTAGE_CELL_DEG", "0.005"))
+OUTAGE_WINDOW_MIN = float(os.getenv("OUTAGE_WINDOW_MIN", "10"))
+OUTAGE_MIN_CHARGERS = int(os.getenv("OUTAGE_MIN_CHARGERS", "5"))
+
+# (cell x, cell y, onset bucket)
+_Key = Tuple[int, int, int]
+_NEIGHBOURS = tuple((dx, dy, dt) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dt in (-1, 0, 1))
+
+
+@dataclass(frozen=True)
+class Outage:
+    charger_ids: Tuple[str, ...]
+    started_at: datetime
+    lat: float
+    lon: float
+
+
+def detect_outages(
+    grouped: Mapping[str, Sequence[Signal]],
+    cell_deg: float = OUTAGE_CELL_DEG,
+    window_min: float = OUTAGE_WINDOW_MIN,
+    min_chargers: int = OUTAGE_MIN_CHARGERS,
+) -> List[Outage]:
+    """Return groups of nearby chargers that went down together and are still down.
+
+    ``grouped`` maps charger ids to their signals, newest first, as returned by
+    :func:`app.scoring.group_signals_by_charger`.
+    """
+    window_s = window_min * 60.0
+    onsets: Dict[str, datetime] = {}
+    newest: Dict[str, Signal] = {}
+    buckets: Dict[_Key, List[str]] = {}
+    for charger_id, charger_signals in grouped.items():
+        latest = charger_signals[0]
+        if latest.status != "down":
+            continue
+        onset = latest.timestamp
+        for signal in charger_signals:
+            if signal.status != "down":
+                break
+            onset = signal.timestamp
+        onsets[charger_id] = onset
+        newest[charger_id] = latest
+        key = (
+            math.floor(latest.lon / cell_deg),
+            math.floor(latest.lat / cell_deg),
+            math.floor(onset.timestamp() / window_s),
+        )
+        buckets.setdefault(key, []).append(charger_id)
+
+    # Kept in bucket order so outages come out in signal order without sorting.
+    hot = {
+        (x, y, t): None
+        for (x, y, t) in buckets
+        if sum(len(buckets.get((x + dx, y + dy, t + dt), ())) for dx, dy, dt in _NEIGHBOURS) >= min_chargers
+    }
+
+    outages: List[Outage] = []
+    claimed: Set[_Key] = set()
+    for seed in hot:
+        if seed in claimed:
+            continue
+        claimed.add(seed)
+        stack = [seed]
+        cells: List[_Key] = []
+        while stack:
+            x, y, t = stack.pop()
+            cells.append((x, y, t))
+            for dx, dy, dt in _NEIGHBOURS:
+                key = (x + dx, y + dy, t + dt)
+                if key in claimed or key not in buckets:
+                    continue
+                claimed.add(key)
+                # Border cells join the outage but do not extend it.
+                if key in hot:
+                    stack.append(key)
+                else:
+                    cells.append(key)
+
+        charger_ids = [charger_id for key in cells for charger_id in buckets[key]]
+        outages.append(
+            Outage(
+                charger_ids=tuple(charger_ids),
+                started_at=min(onsets[charger_id] for charger_id in charger_ids),
+                lat=sum(newest[charger_id].lat for charger_id in charger_ids) / len(charger_ids),
+                lon=sum(newest[charger_id].lon for charger_id in charger_ids) / len(charger_ids),
+            )
+        )
+    return outages
+
+
+def link_incidents(cases: Sequence[Case], outages: Sequence[Outage]) -> List[Case]:
+    """Tag member cases with their incident and keep one dispatch per incident.
+
+    The highest-priority member that would be dispatched is the primary case
+    and keeps its recommendation. Other members that would have been
+    dispatched are marked ``covered_by_incident`` instead. An outage with no
+    dispatching member leaves its cases untouched. ``cases`` keep their order.
+    """
+    position = {case.charger_id: index for index, case in enumerate(cases)}
+    linked = list(cases)
+    for outage in outages:
+        members = sorted(
+            (position[charger_id] for charger_id in outage.charger_ids if charger_id in position),
+            key=lambda index: (-cases[index].priority_score, cases[index].charger_id),
+        )
+        dispatching = [index for index in members if cases[index].recommended_action == "dispatch_field_tech"]
+        if not dispatching:
+            continue
+        primary_index = dispatching[0]
+        primary = cases[primary_index]
+        identifier = f"inc_{primary.id[5:]}_{outage.started_at:%Y%m%dT%H%M}"
+        for index in members:
+            case = cases[index]
+            update: Dict[str, object] = {"incident_id": identifier}
+            if index != primary_index and case.recommended_action == "dispatch_field_tech":
+                update["recommended_action"] = "covered_by_incident"
+                update["explanation"] = (
+                    f"{case.explanation} Part of area outage {identifier} "
+                    f"({len(members)} chargers down together); dispatch consolidated under {primary.id}."
+                )
+            linked[index] = case.model_copy(update=update)
+    return linked
+
+
+def incidents_from_cases(cases: Sequence[Case]) -> List[Incident]:
+    """Summarise the incidents that ``cases`` are linked to, most urgent first."""
+    by_incident: Dict[str, List[Case]] = {}
+    for case in cases:
+        if case.incident_id is not None:
+            by_incident.setdefault(case.incident_id, []).append(case)
+
+    incidents: List[Incident] = []
+    for identifier, members in by_incident.items():
+        members.sort(key=lambda case: (-case.priority_score, case.charger_id))
+        located = [case for case in members if case.lat is not None and case.lon is not None]
+        primary = next((case for case in members if case.recommended_action == "dispatch_field_tech"), members[0])
+        incidents.append(
+            Incident(
+                id=identifier,
+                primary_case_id=primary.id,
+                case_ids=[case.id for case in members],
+                lat=round(sum(case.lat for case in located) / len(located), 5) if located else None,
+                lon=round(sum(case.lon for case in located) / len(located), 5) if located else None,
+                max_priority_score=members[0].priority_score,
+                suppressed_dispatches=sum(1 for case in members if case.recommended_action == "covered_by_incident"),
+            )
+        )
+    incidents.sort(key=lambda incident: (-incident.max_priority_score, incident.id))
+    return incidents
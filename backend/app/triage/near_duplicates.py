@@ -0,0 +1,176 @@
+"""Collapse floods of near-identical crowd reports before scoring.
+
+During an outage the ``311`` and ``ugc`` sources send hundreds of reports like
+"charger dead" and "charger is dead!!" for one charger. Scored one by one they
+max out the volume bonus and make keyword voting re-read the same words. This
+stage folds each flood into its newest report, weighted by the flood's size.
+
+Per charger, in the newest-first order produced by grouping:
+
+1. Report text is lower-cased, stripped to letters and digits, and cut into
+   character ``NEAR_DUP_SHINGLE``-grams.
+2. Each distinct text gets a MinHash signature of ``NEAR_DUP_BANDS *
+   NEAR_DUP_ROWS`` values. The last ``NEAR_DUP_CACHE_SIZE`` texts are cached
+   across runs; flood texts repeat, so a few thousand entries cover them.
+3. Signatures are split into bands for locality-sensitive hashing. A report
+   joins the first earlier cluster with the same source and status that shares
+   a band and whose estimated Jaccard similarity is at least
+   ``NEAR_DUP_THRESHOLD``. Otherwise it starts a cluster of its own.
+
+Each report does a fixed number of band lookups and at most one comparison per
+band, so the stage is O(n) in the number of signals. Signals from other
+sources pass through with weight 1.
+
+Only certainty triage collapses; baseline scores every report on purpose.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import re
+import zlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.models import Signal
+
+NEAR_DUP_ENABLED = os.getenv("NEAR_DUP_ENABLED", "1") == "1"
+NEAR_DUP_SOURCES = frozenset(filter(None, os.getenv("NEAR_DUP_SOURCES", "311,ugc").split(",")))
+NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.5"))
+NEAR_DUP_SHINGLE = int(os.getenv("NEAR_DUP_SHINGLE", "3"))
+NEAR_DUP_BANDS = int(os.getenv("NEAR_DUP_BANDS", "16"))
+NEAR_DUP_ROWS = int(os.getenv("NEAR_DUP_ROWS", "4"))
+NEAR_DUP_CACHE_SIZE = int(os.getenv("NEAR_DUP_CACHE_SIZE", "4096"))
+
+_PRIME = (1 << 61) - 1
+# Fixed seed: the same texts always hash alike, so triage stays deterministic.
+_rng = random.Random(20261019)
+_PERMUTATIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NEAR_DUP_BANDS * NEAR_DUP_ROWS)
+)
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass
+class CollapsedSignals:
+    """Cluster representatives, newest first, and how many reports each stands for."""
+
+    signals: List[Signal] = field(default_factory=list)
+    weights: List[int] = field(default_factory=list)
+
+    @property
+    def collapsed(self) -> int:
+        return sum(self.weights) - len(self.weights)
+
+
+def normalize_text(text: str) -> str:
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+@lru_cache(maxsize=NEAR_DUP_CACHE_SIZE)
+def text_signature(normalized: str) -> Tuple[int, ...]:
+    """MinHash signature of the text's character shingles."""
+    width = NEAR_DUP_SHINGLE
+    shingles = {normalized[i : i + width] for i in range(max(1, len(normalized) - width + 1))}
+    hashes = [zlib.crc32(shingle.encode()) for shingle in shingles]
+    return tuple(min((a * value + b) % _PRIME for value in hashes) for a, b in _PERMUTATIONS)
+
+
+@lru_cache(maxsize=NEAR_DUP_CACHE_SIZE)
+def _text_keys(text: str) -> Tuple[str, Tuple[int, ...], Tuple[int, ...]]:
+    """Normalized text, signature and LSH band keys of a raw report text.
+
+    Band keys are hashed to ints up front; a collision only adds a candidate,
+    which the signature comparison then rejects.
+    """
+    normalized = normalize_text(text)
+    signature = text_signature(normalized)
+    rows = NEAR_DUP_ROWS
+    return (
+        normalized,
+        signature,
+        tuple(hash((band, signature[band * rows : (band + 1) * rows])) for band in range(NEAR_DUP_BANDS)),
+    )
+
+
+def estimated_similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    return sum(x == y for x, y in zip(left, right)) / len(left)
+
+
+class _Bucket:
+    """Clusters of one charger's reports with the same source and status."""
+
+    __slots__ = ("exact", "bands", "first")
+
+    def __init__(self, cluster: int, keys: Tuple[int, ...]) -> None:
+        # Normalized text -> cluster; band key -> first cluster with that band.
+        self.exact: Dict[str, int] = {}
+        self.bands: Dict[int, int] = {}
+        # Most buckets only ever see one text; their bands are indexed on the second.
+        self.first: Optional[Tuple[int, Tuple[int, ...]]] = (cluster, keys)
+
+
+def collapse_charger_signals(
+    signals: Sequence[Signal],
+    threshold: float = NEAR_DUP_THRESHOLD,
+    sources: frozenset = NEAR_DUP_SOURCES,
+) -> CollapsedSignals:
+    """Fold near-duplicate crowd reports of one charger into weighted representatives."""
+    result = CollapsedSignals()
+    representatives, weights = result.signals, result.weights
+    buckets: Dict[Tuple[str, str], _Bucket] = {}
+    signatures: List[Tuple[int, ...]] = []
+
+    for signal in signals:
+        if signal.source not in sources:
+            representatives.append(signal)
+            weights.append(1)
+            signatures.append(())
+            continue
+
+        normalized, signature, keys = _text_keys(signal.text)
+        bucket = buckets.get((signal.source, signal.status))
+        if bucket is None:
+            cluster = len(representatives)
+            representatives.append(signal)
+            weights.append(1)
+            signatures.append(signature)
+            bucket = buckets[(signal.source, signal.status)] = _Bucket(cluster, keys)
+            bucket.exact[normalized] = cluster
+            continue
+
+        cluster = bucket.exact.get(normalized)
+        if cluster is None:
+            bands = bucket.bands
+            if bucket.first is not None:
+                first, first_keys = bucket.first
+                for key in first_keys:
+                    bands[key] = first
+                bucket.first = None
+            for key in keys:
+                candidate = bands.get(key)
+                if candidate is not None and estimated_similarity(signature, signatures[candidate]) >= threshold:
+                    cluster = candidate
+                    break
+            if cluster is None:
+                cluster = len(representatives)
+                representatives.append(signal)
+                weights.append(0)
+                signatures.append(signature)
+                for key in keys:
+                    bands.setdefault(key, cluster)
+            bucket.exact[normalized] = cluster
+        weights[cluster] += 1
+
+    return result
+
+
+def collapse_near_duplicates(grouped: Mapping[str, Sequence[Signal]]) -> Dict[str, CollapsedSignals]:
+    """Collapse every charger's signals; a pass-through when ``NEAR_DUP_ENABLED=0``."""
+    if not NEAR_DUP_ENABLED:
+        return {
+            charger_id: CollapsedSignals(list(signals), [1] * len(signals)) for charger_id, signals in grouped.items()
+        }
+    return {charger_id: collapse_charger_signals(signals) for charger_id, signals in grouped.items()}
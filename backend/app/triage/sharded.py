@@ -0,0 +1,48 @@
+"""Run the triage pipelines per region shard and merge the results.
+
+Cases are per charger and chargers never span regions, so each shard's
+signals can be triaged independently. The merge reproduces the unsharded
+ordering exactly: priority descending, ties by charger id.
+Without ``DATABASE_SHARDS`` these are plain calls into the pipelines.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+from app.db.sharding import fan_out, partition, shard_for_charger, sharding_enabled
+from app.models import Case, Signal, VerificationTask
+from app.scoring_rules import CompiledRules, current_rules
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import CONFIDENCE_THRESHOLD, run_certainty_triage
+
+
+def _merge_cases(parts: List[List[Case]]) -> List[Case]:
+    return sorted(
+        (case for part in parts for case in part),
+        key=lambda case: (-case.priority_score, case.charger_id),
+    )
+
+
+def run_sharded_baseline_triage(signals: Sequence[Signal], rules: Optional[CompiledRules] = None) -> List[Case]:
+    # Resolved once so every shard scores with the same rules version.
+    rules = rules or current_rules()
+    if not sharding_enabled():
+        return run_baseline_triage(signals, rules)
+    parts = partition(signals, lambda signal: shard_for_charger(signal.charger_id))
+    return _merge_cases(fan_out(lambda shard: run_baseline_triage(parts[shard], rules), list(parts)))
+
+
+def run_sharded_certainty_triage(
+    signals: Sequence[Signal],
+    confidence_threshold: float = CONFIDENCE_THRESHOLD,
+    rules: Optional[CompiledRules] = None,
+) -> Tuple[List[Case], List[VerificationTask]]:
+    rules = rules or current_rules()
+    if not sharding_enabled():
+        return run_certainty_triage(signals, confidence_threshold, rules)
+    parts = partition(signals, lambda signal: shard_for_charger(signal.charger_id))
+    results = fan_out(lambda shard: run_certainty_triage(parts[shard], confidence_threshold, rules), list(parts))
+    cases = _merge_cases([shard_cases for shard_cases, _ in results])
+    tasks = sorted((task for _, shard_tasks in results for task in shard_tasks), key=lambda task: task.case_id)
+    return cases, tasks
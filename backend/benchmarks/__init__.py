@@ -0,0 +1,4 @@
+"""Benchmark suites for triage, persistence and metrics at scale.
+
+Run from the ``backend`` directory, e.g. ``python -m benchmarks --sizes 1000,100000``.
+"""
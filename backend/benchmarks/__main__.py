@@ -0,0 +1,58 @@
+"""CLI entry point: ``python -m benchmarks [--sizes ...] [--compare previous.json]``."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+from typing import Sequence
+
+from benchmarks.database import configure_database
+
+
+def _parse_sizes(raw: str) -> list[int]:
+    return [int(part.replace("_", "")) for part in raw.split(",") if part.strip()]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run triage/store/metrics benchmarks.")
+    parser.add_argument("--sizes", type=_parse_sizes, default=None, help="comma-separated signal counts")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-store", action="store_true", help="only run in-memory triage benchmarks")
+    parser.add_argument("--database-url", help="defaults to a throwaway SQLite file")
+    parser.add_argument("--out", type=Path, help="result JSON path (default: bench_results/suite_<ts>.json)")
+    parser.add_argument("--compare", type=Path, help="previous result JSON to diff against")
+    args = parser.parse_args(argv)
+
+    scratch = configure_database(args.database_url)
+
+    # Imported after DATABASE_URL is set so the app binds to the scratch database.
+    from benchmarks.results import compare_results, write_results
+    from benchmarks.suite import DEFAULT_SIZES, run_suite
+
+    try:
+        results = run_suite(
+            sizes=args.sizes or DEFAULT_SIZES,
+            repeat=args.repeat,
+            include_store=not args.skip_store,
+            seed=args.seed,
+        )
+        out = write_results(
+            "suite",
+            results,
+            args.out,
+            extra_meta={"database_url": os.environ["DATABASE_URL"], "seed": args.seed},
+        )
+        print(f"results written to {out}")
+        if args.compare:
+            print(f"changes vs {args.compare}:")
+            for line in compare_results(args.compare, out):
+                print(f"  {line}")
+    finally:
+        if scratch is not None:
+            scratch.cleanup()
+
+
+if __name__ == "__main__":
+    main()
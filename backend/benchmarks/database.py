@@ -0,0 +1,21 @@
+"""Point the app at a benchmark database before it is imported."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Optional
+
+
+def configure_database(database_url: Optional[str]) -> Optional[tempfile.TemporaryDirectory]:
+    """Set ``DATABASE_URL`` to ``database_url`` or a throwaway SQLite file.
+
+    Must run before anything imports ``app.db.session``. Returns the scratch
+    directory (clean it up when done) when no URL was given.
+    """
+    if database_url:
+        os.environ["DATABASE_URL"] = database_url
+        return None
+    scratch = tempfile.TemporaryDirectory(prefix="ev_grid_ops_bench_")
+    os.environ["DATABASE_URL"] = f"sqlite+pysqlite:///{scratch.name}/bench.db"
+    return scratch
@@ -0,0 +1,343 @@
+"""In-process load harness for the FastAPI app.
+
+Virtual users issue a weighted mix of triage posts, case polls, dispatches,
+verifies and metrics reads against ``app.main.app``, either in-process through
+``httpx.ASGITransport`` or over HTTP to a local uvicorn server. The report has
+throughput and p50/p95/p99 latency per route.
+
+    python -m benchmarks.load --concurrency 32 --duration 30
+    python -m benchmarks.load --transport uvicorn --database-url postgresql://ev:ev@localhost:5432/ev_grid_ops
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence
+
+import httpx
+
+from benchmarks.database import configure_database
+
+DEFAULT_MIX: Dict[str, float] = {
+    "poll_cases": 0.60,
+    "metrics": 0.15,
+    "triage_certainty": 0.06,
+    "triage_baseline": 0.03,
+    "dispatch": 0.10,
+    "verify": 0.06,
+}
+# Opt-in operations: pass them with --mix.
+EXTRA_OPERATIONS = ("poll_map",)
+VERIFY_RESULTS = ("confirmed_issue", "false_alarm", "needs_more_data")
+
+
+@dataclass(frozen=True)
+class LoadConfig:
+    concurrency: int = 16
+    duration_s: float = 10.0
+    # Stop after this many requests even if the duration has not elapsed.
+    max_requests: Optional[int] = None
+    mix: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    triage_batch: int = 200
+    seed: int = 7
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(q * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class RouteStats:
+    latencies_s: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        ordered = sorted(self.latencies_s)
+        return {
+            "requests": len(ordered),
+            "throughput_rps": round(len(ordered) / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+            "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+            "statuses": {str(code): count for code, count in sorted(self.statuses.items(), key=lambda item: str(item[0]))},
+        }
+
+
+@dataclass
+class LoadReport:
+    elapsed_s: float
+    routes: Dict[str, RouteStats]
+
+    @property
+    def total_requests(self) -> int:
+        return sum(len(stats.latencies_s) for stats in self.routes.values())
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        rows = [{"route": route, **stats.summary(self.elapsed_s)} for route, stats in sorted(self.routes.items())]
+        overall = RouteStats()
+        for stats in self.routes.values():
+            overall.latencies_s.extend(stats.latencies_s)
+            overall.statuses.update(stats.statuses)
+        rows.append({"route": "ALL", **overall.summary(self.elapsed_s)})
+        return rows
+
+
+class _Session:
+    """Shared state across virtual users: known case ids and triage payloads."""
+
+    def __init__(self, client: httpx.AsyncClient, config: LoadConfig, triage_payloads: List[Dict[str, Any]]) -> None:
+        self.client = client
+        self.config = config
+        self.triage_payloads = triage_payloads
+        self.case_ids: List[str] = []
+        self.routes: Dict[str, RouteStats] = {}
+        self.issued = 0
+
+    async def request(self, route: str, method: str, url: str, **kwargs: Any) -> Optional[httpx.Response]:
+        stats = self.routes.setdefault(route, RouteStats())
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            stats.latencies_s.append(time.perf_counter() - start)
+            stats.statuses["transport_error"] += 1
+            return None
+        stats.latencies_s.append(time.perf_counter() - start)
+        stats.statuses[response.status_code] += 1
+        return response
+
+    async def poll_cases(self, rng: random.Random) -> None:
+        response = await self.request("GET /api/cases", "GET", "/api/cases", params={"mode": "certainty"})
+        if response is not None and response.status_code == 200:
+            self.case_ids = [case["id"] for case in response.json()["data"]["cases"]] or self.case_ids
+
+    async def poll_map(self, rng: random.Random) -> None:
+        """Pan a roughly 4 x 3 km map viewport around central Austin."""
+        lon, lat = rng.uniform(-97.80, -97.68), rng.uniform(30.20, 30.40)
+        bbox = f"{lon - 0.02:.4f},{lat - 0.015:.4f},{lon + 0.02:.4f},{lat + 0.015:.4f}"
+        await self.request("GET /api/cases?bbox", "GET", "/api/cases", params={"mode": "certainty", "bbox": bbox})
+
+    async def metrics(self, rng: random.Random) -> None:
+        await self.request("GET /api/metrics/compare", "GET", "/api/metrics/compare")
+
+    async def triage_baseline(self, rng: random.Random) -> None:
+        await self.request(
+            "POST /api/triage/baseline", "POST", "/api/triage/baseline", json=rng.choice(self.triage_payloads)
+        )
+
+    async def triage_certainty(self, rng: random.Random) -> None:
+        await self.request(
+            "POST /api/triage/certainty", "POST", "/api/triage/certainty", json=rng.choice(self.triage_payloads)
+        )
+
+    async def dispatch(self, rng: random.Random) -> None:
+        if not self.case_ids:
+            await self.poll_cases(rng)
+            return
+        due_at = datetime.now(timezone.utc) + timedelta(hours=rng.choice((2, 4, 8)))
+        await self.request(
+            "POST /api/cases/{id}/dispatch",
+            "POST",
+            f"/api/cases/{rng.choice(self.case_ids)}/dispatch",
+            json={"assigned_team": "FieldOps", "due_at": due_at.isoformat(), "state": "created"},
+        )
+
+    async def verify(self, rng: random.Random) -> None:
+        if not self.case_ids:
+            await self.poll_cases(rng)
+            return
+        await self.request(
+            "POST /api/cases/{id}/verify",
+            "POST",
+            f"/api/cases/{rng.choice(self.case_ids)}/verify",
+            json={"result": rng.choice(VERIFY_RESULTS), "notes": "load test"},
+        )
+
+
+def build_triage_payloads(batch_size: int, seed: int, count: int = 8) -> List[Dict[str, Any]]:
+    from app.seed_data.generate_signals import WorkloadConfig, generate_signal_rows
+
+    return [
+        {
+            "signals": list(
+                generate_signal_rows(
+                    WorkloadConfig(signals=batch_size, chargers=max(5, batch_size // 10), seed=seed + index)
+                )
+            )
+        }
+        for index in range(count)
+    ]
+
+
+async def run_load(client: httpx.AsyncClient, config: LoadConfig) -> LoadReport:
+    """Drive ``client`` with ``config.concurrency`` virtual users and report latencies."""
+    session = _Session(client, config, build_triage_payloads(config.triage_batch, config.seed))
+    operations: Dict[str, Callable[[random.Random], Awaitable[None]]] = {
+        name: getattr(session, name) for name in config.mix
+    }
+    names = list(config.mix)
+    cum_weights = list(accumulate(config.mix.values()))
+
+    await session.poll_cases(random.Random(config.seed))
+    session.routes.clear()
+
+    start = time.perf_counter()
+    deadline = start + config.duration_s
+
+    async def virtual_user(user_id: int) -> None:
+        rng = random.Random(config.seed * 1000 + user_id)
+        while time.perf_counter() < deadline:
+            if config.max_requests is not None:
+                if session.issued >= config.max_requests:
+                    return
+                session.issued += 1
+            operation = rng.choices(names, cum_weights=cum_weights, k=1)[0]
+            await operations[operation](rng)
+
+    await asyncio.gather(*(virtual_user(index) for index in range(config.concurrency)))
+    return LoadReport(elapsed_s=time.perf_counter() - start, routes=session.routes)
+
+
+@asynccontextmanager
+async def asgi_client() -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client bound in-process to ``app.main.app``."""
+    from app.db.session import init_database
+    from app.main import app
+
+    init_database()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://loadtest"
+    ) as client:
+        yield client
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@asynccontextmanager
+async def uvicorn_client(port: Optional[int] = None) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client talking to ``app.main.app`` served by a local uvicorn thread."""
+    import uvicorn
+
+    from app.main import app
+
+    port = port or _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("uvicorn failed to start")
+        await asyncio.sleep(0.05)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60.0) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+async def run_with_transport(transport: str, config: LoadConfig) -> LoadReport:
+    factory = uvicorn_client if transport == "uvicorn" else asgi_client
+    async with factory() as client:
+        return await run_load(client, config)
+
+
+def _parse_mix(raw: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in raw.split(","):
+        key, _, weight = part.partition("=")
+        key = key.strip()
+        if key not in DEFAULT_MIX and key not in EXTRA_OPERATIONS:
+            known = sorted([*DEFAULT_MIX, *EXTRA_OPERATIONS])
+            raise argparse.ArgumentTypeError(f"unknown operation {key!r}; expected one of {known}")
+        mix[key] = float(weight)
+    return mix
+
+
+def _print_report(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'route':<32} {'reqs':>7} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  statuses")
+    for row in rows:
+        print(
+            f"{row['route']:<32} {row['requests']:>7} {row['throughput_rps']:>9.1f} "
+            f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}  {row['statuses']}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the API in-process or via local uvicorn.")
+    parser.add_argument("--transport", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--database-url", help="defaults to a throwaway SQLite file")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--max-requests", type=int)
+    parser.add_argument("--mix", type=_parse_mix, help="e.g. poll_cases=10,metrics=3,triage_certainty=1")
+    parser.add_argument("--triage-batch", type=int, default=200, help="signals per triage post")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", type=Path, help="result JSON path (default: bench_results/load_<ts>.json)")
+    args = parser.parse_args(argv)
+
+    scratch = configure_database(args.database_url)
+    try:
+        from app.db.async_session import all_engines
+        from app.db.pool_stats import pool_snapshot
+        from app.db.profiles import DB_PROFILE
+        from app.seed_data.load_demo_seed import load_demo_seed
+        from benchmarks.results import write_payload
+
+        load_demo_seed()
+        config = LoadConfig(
+            concurrency=args.concurrency,
+            duration_s=args.duration,
+            max_requests=args.max_requests,
+            mix=args.mix or dict(DEFAULT_MIX),
+            triage_batch=args.triage_batch,
+            seed=args.seed,
+        )
+        report = asyncio.run(run_with_transport(args.transport, config))
+        rows = report.to_rows()
+        _print_report(rows)
+        out = write_payload(
+            "load",
+            rows,
+            args.out,
+            extra_meta={
+                "transport": args.transport,
+                "database_url": os.environ["DATABASE_URL"],
+                "concurrency": config.concurrency,
+                "duration_s": round(report.elapsed_s, 3),
+                "mix": dict(config.mix),
+                "triage_batch": config.triage_batch,
+                "db_profile": DB_PROFILE,
+                "db_pool": {label: pool_snapshot(engine) for label, engine in all_engines().items()},
+            },
+        )
+        print(f"results written to {out}")
+    finally:
+        if scratch is not None:
+            scratch.cleanup()
+
+
+if __name__ == "__main__":
+    main()
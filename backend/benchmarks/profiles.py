@@ -0,0 +1,89 @@
+"""Compare storage profiles under the same API load.
+
+Each profile runs :mod:`benchmarks.load` in a fresh interpreter (engines are
+built at import time) with ``DB_PROFILE`` set. Without ``--database-url``
+each run gets its own throwaway SQLite file. The report has throughput and
+p95/p99 latency per route for every profile, plus the pool telemetry from
+the end of each run.
+
+    python -m benchmarks.profiles --profiles basic,sqlite_wal --concurrency 32 --duration 20
+    python -m benchmarks.profiles --profiles basic,postgres --database-url postgresql://ev:ev@localhost:5432/ev_grid_ops
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from benchmarks.results import write_payload
+
+
+def run_profile(profile: str, load_args: Sequence[str], out: Path) -> Dict[str, Any]:
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks.load", *load_args, "--out", str(out)],
+        env={**os.environ, "DB_PROFILE": profile},
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return json.loads(out.read_text(encoding="utf-8"))
+
+
+def _print_comparison(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'route':<32} {'profile':<12} {'rps':>9} {'p95 ms':>9} {'p99 ms':>9}  statuses")
+    for row in sorted(rows, key=lambda item: (item["route"] == "ALL", item["route"])):
+        print(
+            f"{row['route']:<32} {row['profile']:<12} {row['throughput_rps']:>9.1f} "
+            f"{row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}  {row['statuses']}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the load harness once per storage profile.")
+    parser.add_argument("--profiles", default="basic,sqlite_wal", help="comma-separated DB_PROFILE names")
+    parser.add_argument("--database-url", help="shared database for every run (default: one SQLite file per run)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per profile")
+    parser.add_argument("--triage-batch", type=int, default=200)
+    parser.add_argument("--out", type=Path, help="result JSON path (default: bench_results/profiles_<ts>.json)")
+    args = parser.parse_args(argv)
+
+    load_args = [
+        "--concurrency", str(args.concurrency),
+        "--duration", str(args.duration),
+        "--triage-batch", str(args.triage_batch),
+    ]
+    if args.database_url:
+        load_args += ["--database-url", args.database_url]
+
+    rows: List[Dict[str, Any]] = []
+    pools: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="ev_grid_ops_profiles_") as scratch:
+        for profile in [name.strip() for name in args.profiles.split(",") if name.strip()]:
+            print(f"running {profile} ...")
+            payload = run_profile(profile, load_args, Path(scratch) / f"{profile}.json")
+            rows.extend({"profile": profile, **row} for row in payload["results"])
+            pools[profile] = payload["meta"]["db_pool"]
+
+    _print_comparison(rows)
+    out = write_payload(
+        "profiles",
+        rows,
+        args.out,
+        extra_meta={
+            "database_url": args.database_url or "sqlite (scratch per profile)",
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "db_pool": pools,
+        },
+    )
+    print(f"results written to {out}")
+
+
+if __name__ == "__main__":
+    main()
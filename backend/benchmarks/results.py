@@ -0,0 +1,95 @@
+"""Benchmark result files: writing runs and comparing them."""
+
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List, Optional, Sequence
+
+RESULTS_DIR = Path("bench_results")
+
+
+@dataclass
+class BenchResult:
+    benchmark: str
+    signals: int
+    chargers: int
+    runs_s: List[float]
+
+    @property
+    def best_s(self) -> float:
+        return min(self.runs_s)
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["best_s"] = round(self.best_s, 6)
+        payload["median_s"] = round(median(self.runs_s), 6)
+        payload["signals_per_s"] = round(self.signals / self.best_s, 1) if self.best_s > 0 else None
+        return payload
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_payload(
+    suite: str,
+    rows: Sequence[Dict[str, Any]],
+    out: Optional[Path] = None,
+    extra_meta: Optional[Dict[str, Any]] = None,
+) -> Path:
+    """Write result ``rows`` with run metadata and return the file path."""
+    started = datetime.now(timezone.utc)
+    if out is None:
+        out = RESULTS_DIR / f"{suite}_{started.strftime('%Y%m%dT%H%M%SZ')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "meta": {
+            "suite": suite,
+            "timestamp": started.isoformat(),
+            "git_revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            **(extra_meta or {}),
+        },
+        "results": list(rows),
+    }
+    out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return out
+
+
+def write_results(
+    suite: str,
+    results: Sequence[BenchResult],
+    out: Optional[Path] = None,
+    extra_meta: Optional[Dict[str, Any]] = None,
+) -> Path:
+    return write_payload(suite, [result.to_dict() for result in results], out, extra_meta)
+
+
+def compare_results(previous: Path, current: Path) -> List[str]:
+    """Return human-readable best-time deltas between two result files."""
+    def _index(path: Path) -> Dict[tuple, float]:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return {(row["benchmark"], row["signals"]): row["best_s"] for row in payload["results"]}
+
+    before = _index(previous)
+    after = _index(current)
+    lines = []
+    for key in sorted(after):
+        if key not in before or before[key] <= 0:
+            continue
+        delta_pct = (after[key] - before[key]) / before[key] * 100.0
+        lines.append(f"{key[0]:<24} {key[1]:>9} signals  {before[key]:.4f}s -> {after[key]:.4f}s ({delta_pct:+.1f}%)")
+    return lines
@@ -0,0 +1,158 @@
+"""Triage, persistence and metrics benchmarks over generated workloads.
+
+Imports the app, so ``DATABASE_URL`` must point at a scratch database before
+this module is imported; ``python -m benchmarks`` takes care of that.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable, Dict, List, Sequence
+
+from app import store
+from app.models import Signal
+from app.observability.spans import registry
+from app.scoring import group_signals_by_charger
+from app.seed_data.generate_signals import WorkloadConfig, generate_signals
+from app.services.case_index import CaseIndex
+from app.services.metrics_service import compare_metrics
+from app.spatial import BBox
+from app.triage.baseline import run_baseline_triage
+from app.triage.certainty import run_certainty_triage
+from app.triage.correlation import detect_outages
+from app.triage.near_duplicates import collapse_near_duplicates
+from benchmarks.results import BenchResult
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+SIGNALS_PER_CHARGER = 20
+# Central Austin viewport; the generated chargers cluster around it.
+DOWNTOWN_BBOX = BBox(-97.78, 30.24, -97.70, 30.30)
+
+
+def _timed(fn: Callable[[], object], repeat: int) -> List[float]:
+    runs = []
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        runs.append(perf_counter() - start)
+    return runs
+
+
+def workload_for(size: int, seed: int = 42) -> WorkloadConfig:
+    return WorkloadConfig(signals=size, chargers=max(10, size // SIGNALS_PER_CHARGER), seed=seed)
+
+
+def run_triage_benchmarks(signals: Sequence[Signal], chargers: int, repeat: int) -> List[BenchResult]:
+    size = len(signals)
+    grouped = group_signals_by_charger(signals)
+    return [
+        BenchResult("triage_baseline", size, chargers, _timed(lambda: run_baseline_triage(signals), repeat)),
+        BenchResult("triage_certainty", size, chargers, _timed(lambda: run_certainty_triage(signals), repeat)),
+        BenchResult("correlate_outages", size, chargers, _timed(lambda: detect_outages(grouped), repeat)),
+        BenchResult(
+            "collapse_near_duplicates", size, chargers, _timed(lambda: collapse_near_duplicates(grouped), repeat)
+        ),
+    ]
+
+
+def run_span_overhead_benchmarks(signals: Sequence[Signal], chargers: int, repeat: int) -> List[BenchResult]:
+    """Certainty triage with span recording off and on, as ``PERF_SPANS_ENABLED=0`` / ``=1`` would set it.
+
+    One untimed run warms caches first. Runs then alternate between the two
+    settings, swapping which goes first each round, so drift hits both equally.
+    """
+    size = len(signals)
+    runs: Dict[bool, List[float]] = {False: [], True: []}
+    enabled = registry.enabled
+    try:
+        run_certainty_triage(signals)
+        for round_ in range(repeat):
+            for setting in (False, True) if round_ % 2 == 0 else (True, False):
+                registry.enabled = setting
+                runs[setting].extend(_timed(lambda: run_certainty_triage(signals), 1))
+    finally:
+        registry.enabled = enabled
+    return [
+        BenchResult("triage_certainty_spans_off", size, chargers, runs[False]),
+        BenchResult("triage_certainty_spans_on", size, chargers, runs[True]),
+    ]
+
+
+def span_overhead_pct(results: Sequence[BenchResult]) -> Dict[int, float]:
+    """Best-of-runs overhead of span recording per workload size, in percent."""
+    best = {(result.benchmark, result.signals): result.best_s for result in results}
+    return {
+        size: round((on / best[("triage_certainty_spans_off", size)] - 1) * 100, 2)
+        for (name, size), on in best.items()
+        if name == "triage_certainty_spans_on"
+    }
+
+
+def run_spatial_benchmarks(signals: Sequence[Signal], chargers: int, repeat: int) -> List[BenchResult]:
+    size = len(signals)
+    cases, _ = run_certainty_triage(signals)
+    index = CaseIndex.build((), cases)
+    return [
+        BenchResult("case_index_build", size, chargers, _timed(lambda: CaseIndex.build((), cases), repeat)),
+        BenchResult("case_bbox_query", size, chargers, _timed(lambda: index.within(DOWNTOWN_BBOX), repeat)),
+        BenchResult(
+            "case_clusters_query", size, chargers, _timed(lambda: index.clusters_within(12, DOWNTOWN_BBOX), repeat)
+        ),
+    ]
+
+
+def run_store_benchmarks(signals: Sequence[Signal], chargers: int, repeat: int) -> List[BenchResult]:
+    """Time persistence and read paths; writes run once per repeat on a fresh store."""
+    size = len(signals)
+    baseline_cases = run_baseline_triage(signals)
+    certainty_cases, tasks = run_certainty_triage(signals)
+
+    insert_runs: List[float] = []
+    upsert_runs: List[float] = []
+    case_write_runs: List[float] = []
+    for _ in range(repeat):
+        store.reset_store()
+        insert_runs.extend(_timed(lambda: store.set_signals(signals), 1))
+        upsert_runs.extend(_timed(lambda: store.set_signals(signals), 1))
+        case_write_runs.extend(
+            _timed(
+                lambda: (
+                    store.set_baseline_cases(baseline_cases),
+                    store.set_certainty_cases(certainty_cases, tasks),
+                ),
+                1,
+            )
+        )
+
+    return [
+        BenchResult("store_insert_signals", size, chargers, insert_runs),
+        BenchResult("store_upsert_signals", size, chargers, upsert_runs),
+        BenchResult("store_write_cases", size, chargers, case_write_runs),
+        BenchResult("store_get_cases", size, chargers, _timed(lambda: store.get_cases("certainty"), repeat)),
+        BenchResult("compare_metrics", size, chargers, _timed(compare_metrics, repeat)),
+    ]
+
+
+def run_suite(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeat: int = 3,
+    include_store: bool = True,
+    seed: int = 42,
+    log: Callable[[str], None] = print,
+) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for size in sizes:
+        config = workload_for(size, seed)
+        log(f"generating {size} signals across {config.chargers} chargers")
+        signals = list(generate_signals(config))
+        batch = run_triage_benchmarks(signals, config.chargers, repeat)
+        batch += run_span_overhead_benchmarks(signals, config.chargers, repeat)
+        batch += run_spatial_benchmarks(signals, config.chargers, repeat)
+        if include_store:
+            batch += run_store_benchmarks(signals, config.chargers, repeat)
+        for result in batch:
+            log(f"  {result.benchmark:<28} best {result.best_s:.4f}s")
+        log(f"  {'span_overhead':<28} {span_overhead_pct(batch)[size]:+.2f}%")
+        results.extend(batch)
+        del signals
+    return results
@@ -1,3 +1,6 @@
+import { useEffect, useState } from "react";
+
+import { getCases, type BBox } from "../lib/api";
 import type { Case, CaseMode } from "../lib/types";
 
 type LocationPoint = {
@@ -7,6 +10,8 @@ type LocationPoint = {
 };
 
 type CaseMapProps = {
+  mode: CaseMode;
+  // The latest queue; the map refetches its viewport whenever it changes.
   cases: Case[];
   selectedCaseId: string | null;
   locationIndex: Record<string, LocationPoint>;
@@ -52,6 +57,23 @@ function normalizeCoordinates(points: LocationPoint[]): { minLat: number; maxLat
   };
 }
 
+type Bounds = { minLat: number; maxLat: number; minLon: number; maxLon: number };
+
+const MAX_ZOOM = 8;
+
+function zoomBounds(bounds: Bounds, zoom: number): Bounds {
+  const centerLat = (bounds.minLat + bounds.maxLat) / 2;
+  const centerLon = (bounds.minLon + bounds.maxLon) / 2;
+  const latHalf = (bounds.maxLat - bounds.minLat) / (2 * zoom);
+  const lonHalf = (bounds.maxLon - bounds.minLon) / (2 * zoom);
+  return {
+    minLat: centerLat - latHalf,
+    maxLat: centerLat + latHalf,
+    minLon: centerLon - lonHalf,
+    maxLon: centerLon + lonHalf,
+  };
+}
+
 function projectPin(
   lat: number,
   lon: number,
@@ -67,14 +89,39 @@ function projectPin(
 }
 
 export function CaseMap({
+  mode,
   cases,
   selectedCaseId,
   locationIndex,
   onSelectCase,
 }: CaseMapProps) {
   const points = Object.values(locationIndex);
-
-  if (points.length === 0) {
+  const [zoom, setZoom] = useState(1);
+  const [visibleCases, setVisibleCases] = useState<Case[]>(cases);
+
+  const bounds = points.length > 0 ? zoomBounds(normalizeCoordinates(points), zoom) : null;
+  const bbox: BBox | null = bounds ? [bounds.minLon, bounds.minLat, bounds.maxLon, bounds.maxLat] : null;
+  const bboxKey = bbox?.join(",") ?? "";
+
+  useEffect(() => {
+    if (!bbox) return;
+    // Only ask the backend for the cases inside the current view.
+    let stale = false;
+    getCases(mode, bbox)
+      .then((data) => {
+        if (!stale) setVisibleCases(data.cases);
+      })
+      .catch(() => {
+        if (!stale) setVisibleCases(cases);
+      });
+    return () => {
+      stale = true;
+    };
+    // bboxKey stands in for bbox, which is a new array every render.
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [mode, cases, bboxKey]);
+
+  if (!bounds) {
     return (
       <section className="panel map-wrap">
         <div className="map-head">
@@ -85,9 +132,7 @@ export function CaseMap({
     );
   }
 
-  const bounds = normalizeCoordinates(points);
-
-  const pins: Pin[] = cases
+  const pins: Pin[] = visibleCases
     .map((entry) => {
       const location = locationIndex[entry.charger_id];
       if (!location) return null;
@@ -108,7 +153,25 @@ export function CaseMap({
     <section className="panel map-wrap">
       <div className="map-head">
         <h3>Case Map</h3>
-        <p className="muted">Baseline queue view</p>
+        <p className="muted">{mode === "baseline" ? "Baseline" : "Certainty"} queue view</p>
+        <div className="button-row">
+          <button
+            type="button"
+            className="btn-secondary"
+            onClick={() => setZoom((value) => Math.min(value * 2, MAX_ZOOM))}
+            disabled={zoom >= MAX_ZOOM}
+          >
+            Zoom in
+          </button>
+          <button
+            type="button"
+            className="btn-secondary"
+            onClick={() => setZoom((value) => Math.max(value / 2, 1))}
+            disabled={zoom <= 1}
+          >
+            Zoom out
+          </button>
+        </div>
       </div>
 
       <p className="muted map-note">Click a pin to open that case in detail view.</p>
@@ -122,7 +185,7 @@ export function CaseMap({
               type="button"
               className={`map-pin ${priorityClass(pin.priority)} ${isSelected ? "selected" : ""}`}
               style={{ left: `${pin.x}%`, top: `${pin.y}%` }}
-              onClick={() => onSelectCase("baseline", pin.id)}
+              onClick={() => onSelectCase(mode, pin.id)}
               title={`${pin.id} | ${pin.chargerId} | priority ${pin.priority} | confidence ${(pin.confidence * 100).toFixed(0)}%`}
             >
               <span>{pin.priority}</span>
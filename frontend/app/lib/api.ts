@@ -1,6 +1,7 @@
 import type {
   ApiResponse,
   BaselineTriageData,
+  CaseClustersData,
   CaseMode,
   CasesData,
   CertaintyTriageData,
@@ -41,11 +42,22 @@ export async function runCertainty(signals: Signal[]): Promise<CertaintyTriageDa
   return parseEnvelope<CertaintyTriageData>(res);
 }
 
-export async function getCases(mode: CaseMode): Promise<CasesData> {
-  const res = await fetch(`/api/cases?mode=${mode}`);
+export type BBox = [minLon: number, minLat: number, maxLon: number, maxLat: number];
+
+export async function getCases(mode: CaseMode, bbox?: BBox): Promise<CasesData> {
+  const params = new URLSearchParams({ mode });
+  if (bbox) params.set("bbox", bbox.join(","));
+  const res = await fetch(`/api/cases?${params.toString()}`);
   return parseEnvelope<CasesData>(res);
 }
 
+export async function getCaseClusters(mode: CaseMode, zoom: number, bbox?: BBox): Promise<CaseClustersData> {
+  const params = new URLSearchParams({ mode, zoom: String(Math.floor(zoom)) });
+  if (bbox) params.set("bbox", bbox.join(","));
+  const res = await fetch(`/api/cases/clusters?${params.toString()}`);
+  return parseEnvelope<CaseClustersData>(res);
+}
+
 export async function dispatchCase(caseId: string, body: DispatchRequest): Promise<DispatchData> {
   const res = await fetch(`/api/cases/${caseId}/dispatch`, {
     method: "POST",
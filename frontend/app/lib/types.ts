@@ -22,7 +22,8 @@ export type GridStressLevel = "normal" | "elevated" | "high";
 export type RecommendedAction =
   | "dispatch_field_tech"
   | "remote_reset"
-  | "needs_verification";
+  | "needs_verification"
+  | "covered_by_incident";
 export type RootCauseTag = "payment_terminal" | "connector" | "network" | "unknown";
 export type CaseMode = "baseline" | "certainty";
 
@@ -39,6 +40,20 @@ export type Case = {
   explanation: string;
   uncertainty_reasons: string[];
   verification_required: boolean;
+  lat?: number | null;
+  lon?: number | null;
+  incident_id?: string | null;
+  rules_version?: string | null;
+};
+
+export type Incident = {
+  id: string;
+  primary_case_id: string;
+  case_ids: string[];
+  lat: number | null;
+  lon: number | null;
+  max_priority_score: number;
+  suppressed_dispatches: number;
 };
 
 export type VerificationTask = {
@@ -75,6 +90,22 @@ export type BaselineTriageData = {
 export type CertaintyTriageData = {
   cases: Case[];
   verification_tasks: VerificationTask[];
+  incidents: Incident[];
+};
+
+export type CaseCluster = {
+  lat: number;
+  lon: number;
+  count: number;
+  max_priority_score: number;
+  case_id: string | null;
+  expansion_zoom: number | null;
+};
+
+export type CaseClustersData = {
+  mode: CaseMode;
+  zoom: number;
+  clusters: CaseCluster[];
 };
 
 export type CasesData = {
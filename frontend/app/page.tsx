@@ -102,8 +102,8 @@ export default function Page() {
         const fallback = fallbackLocationFromChargerId(item.charger_id);
         map[item.charger_id] = {
           charger_id: item.charger_id,
-          lat: fallback.lat,
-          lon: fallback.lon,
+          lat: item.lat ?? fallback.lat,
+          lon: item.lon ?? fallback.lon,
         };
       }
     }
@@ -350,6 +350,7 @@ export default function Page() {
       </section>
 
       <CaseMap
+        mode="baseline"
         cases={baselineCases}
         selectedCaseId={selectedCaseId}
         locationIndex={locationIndex}